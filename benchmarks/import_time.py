@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""Measure the time required to `import fireREST` in a fresh interpreter
+
+Usage: python benchmarks/import_time.py [--runs 20]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+SCRIPT = """
+import sys, time
+start = time.perf_counter()
+import fireREST
+elapsed = time.perf_counter() - start
+modules = [m for m in sys.modules if m.startswith('fireREST')]
+print(elapsed, len(modules))
+"""
+
+
+def measure(runs: int):
+    timings = []
+    modules = 0
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, '-c', SCRIPT], cwd=ROOT, check=True, capture_output=True, text=True
+        ).stdout.split()
+        timings.append(float(output[0]))
+        modules = int(output[1])
+    return timings, modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=20, help='number of interpreters started')
+    args = parser.parse_args()
+
+    timings, modules = measure(args.runs)
+    print(f'import fireREST ({args.runs} runs, {modules} fireREST modules loaded)')
+    print(f'  median: {statistics.median(timings) * 1000:.1f} ms')
+    print(f'  min:    {min(timings) * 1000:.1f} ms')
+    print(f'  max:    {max(timings) * 1000:.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""Measure cold-start retrieval of the application catalog with and without the on-disk reference store
+
+Each run creates a new connection (as a new process would) and retrieves all applications. The first run with the
+reference store downloads the catalog and persists it, subsequent runs are answered from disk
+
+Usage: python benchmarks/reference_store.py [--applications 5000] [--latency 0.05] [--runs 3]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from fireREST import FMC  # noqa: E402
+from server import serve  # noqa: E402
+
+
+def run(host, reference_store=None):
+    fmc = FMC(host, 'admin', 'admin', protocol='http', rate_limit=None, reference_store=reference_store)
+    start = time.perf_counter()
+    applications = fmc.object.application.get()
+    return time.perf_counter() - start, len(applications)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--applications', type=int, default=5000, help='number of applications served')
+    parser.add_argument('--latency', type=float, default=0.05, help='simulated latency per request in seconds')
+    parser.add_argument('--runs', type=int, default=3, help='number of connections per case')
+    args = parser.parse_args()
+
+    server, state, host = serve(items=0, latency=args.latency, applications=args.applications)
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            path = str(Path(directory) / 'references.sqlite')
+            for name, reference_store in (('without reference store', None), ('with reference store', path)):
+                print(name)
+                for i in range(args.runs):
+                    requests = len(state.requests)
+                    elapsed, count = run(host, reference_store)
+                    requests = len([r for r in state.requests[requests:] if r[1].endswith('/object/applications')])
+                    print(f'  run {i + 1}: {elapsed * 1000:8.1f} ms  {count} applications  {requests} requests')
+    finally:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
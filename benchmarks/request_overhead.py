@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""Measure the client-side cpu time fireREST spends on api requests against a local stand-in server. The server
+runs in a background thread, only cpu time of the calling thread is measured
+
+Usage: python benchmarks/request_overhead.py [--items 5000] [--runs 5] [--log-level WARNING] [--json-codec auto]
+"""
+
+import argparse
+import logging
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from fireREST import FMC  # noqa: E402
+from server import serve  # noqa: E402
+
+
+def measure(fmc, runs: int):
+    timings = []
+    items = 0
+    for _ in range(runs):
+        start = time.thread_time()
+        items = len(fmc.object.network.get())
+        timings.append(time.thread_time() - start)
+    return timings, items
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--items', type=int, default=5000, help='number of network objects served')
+    parser.add_argument('--runs', type=int, default=5, help='number of collection fetches')
+    parser.add_argument('--log-level', default='WARNING', help='log level of the fireREST logger')
+    parser.add_argument('--json-codec', default='auto', help='json codec used by the connection')
+    args = parser.parse_args()
+
+    logging.basicConfig(stream=open(os.devnull, 'w'))
+    logging.getLogger('fireREST').setLevel(args.log_level.upper())
+
+    server, _, host = serve(items=args.items)
+    try:
+        fmc = FMC(host, 'admin', 'admin', protocol='http', rate_limit=None, json_codec=args.json_codec)
+        timings, items = measure(fmc, args.runs)
+    finally:
+        server.shutdown()
+
+    print(
+        f'fmc.object.network.get() ({items} items, {args.runs} runs, '
+        f'log level {args.log_level.upper()}, {fmc.conn.codec.name} codec)'
+    )
+    print(f'  median cpu time: {statistics.median(timings) * 1000:.1f} ms')
+    print(f'  min cpu time:    {min(timings) * 1000:.1f} ms')
+    print(f'  max cpu time:    {max(timings) * 1000:.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""Measure the time required to generate request urls for resources, child resources and nested child resources
+
+Usage: python benchmarks/resource_url.py [--number 200000]
+"""
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from fireREST import FMC  # noqa: E402
+from server import serve  # noqa: E402
+
+UUID = '005056bb-0b24-0ed3-0000-012884901876'
+
+
+def cases(fmc):
+    network = fmc.object.network
+    accessrule = fmc.policy.accesspolicy.accessrule
+    override = fmc.object.network.override
+    ipv4staticroute = fmc.device.devicerecord.routing.ipv4staticroute
+    return {
+        'Resource (collection)': lambda: network.url(network.PATH.format(uuid=None)),
+        'Resource (item)': lambda: network.url(network.PATH.format(uuid=UUID)),
+        'Resource (platform namespace)': lambda: fmc.system.info.serverversion.url('/info/serverversion', 'platform'),
+        'ChildResource': lambda: accessrule.url(accessrule.PATH.format(container_uuid=UUID, uuid=UUID)),
+        'ChildResource (override)': lambda: override.url(override.PATH.format(container_uuid=UUID, uuid=None)),
+        'NestedChildResource': lambda: ipv4staticroute.url(
+            ipv4staticroute.PATH.format(container_uuid=UUID, child_container_uuid=UUID, uuid=UUID)
+        ),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--number', type=int, default=200000, help='number of urls generated per case')
+    args = parser.parse_args()
+
+    server, _, host = serve(items=0)
+    try:
+        fmc = FMC(host, 'admin', 'admin', protocol='http', rate_limit=None)
+    finally:
+        server.shutdown()
+
+    print(f'Resource.url ({args.number} calls per case)')
+    for name, func in cases(fmc).items():
+        elapsed = min(timeit.repeat(func, number=args.number, repeat=3))
+        print(f'  {name:<30} {elapsed / args.number * 1e9:8.0f} ns/call')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""Measure the time required to sanitize bulk payloads of access rules for create operations
+
+Usage: python benchmarks/sanitize_payload.py [--runs 200]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fireREST import utils  # noqa: E402
+
+BULK_SIZES = (1, 100, 1000)
+
+
+def accessrule(i: int):
+    def reference(kind, n):
+        return {'id': f'00000000-0000-0000-0000-{n:012d}', 'name': f'{kind}-{n}', 'type': kind}
+
+    return {
+        'id': f'00000000-0000-0000-0001-{i:012d}',
+        'name': f'rule-{i}',
+        'type': 'AccessRule',
+        'action': 'ALLOW',
+        'enabled': True,
+        'sourceZones': {'objects': [reference('SecurityZone', n) for n in range(2)]},
+        'destinationZones': {'objects': [reference('SecurityZone', n) for n in range(2, 4)]},
+        'sourceNetworks': {'objects': [reference('Network', n) for n in range(10)]},
+        'destinationNetworks': {'objects': [reference('Network', n) for n in range(10, 20)]},
+        'destinationPorts': {'objects': [reference('ProtocolPortObject', n) for n in range(5)]},
+        'urls': {'literals': [{'type': 'Url', 'url': f'https://example{n}.com'} for n in range(5)]},
+        'logEnd': True,
+        'sendEventsToFMC': True,
+        'links': {'self': f'https://fmc/api/fmc_config/v1/accessrules/{i}'},
+        'metadata': {'ruleIndex': i, 'section': 'Mandatory', 'category': '--Undefined--', 'timestamp': 0},
+    }
+
+
+def measure(payload, runs: int):
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        utils.sanitize_payload('post', payload)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=200, help='number of sanitize operations per bulk size')
+    args = parser.parse_args()
+
+    print(f'utils.sanitize_payload for access rules ({args.runs} runs)')
+    for size in BULK_SIZES:
+        payload = [accessrule(i) for i in range(size)]
+        timings = measure(payload, args.runs)
+        print(f'  {size:>5} items  median: {statistics.median(timings) * 1000:8.3f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+"""Minimal local stand-in for the FMC REST API used by the benchmarks
+
+Only the parts of the api required by fireREST's request path are implemented: authentication, token refresh,
+server version, paginated collections (with `expanded`, `name` and `nameOrValue` filters) and create, update and
+delete operations (including bulk delete using the `ids` filter) on a few object collections. Request latency can be
+simulated to approximate a real appliance
+"""
+
+import json
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlencode, urlparse
+
+DOMAIN = 'e276abec-e0f2-11e3-8169-6d9ed49b625f'
+PREFIX = f'/api/fmc_config/v1/domain/{DOMAIN}'
+
+
+def network(i: int):
+    return {
+        'id': str(uuid.UUID(int=i)),
+        'name': f'net-{i}',
+        'type': 'Network',
+        'value': f'10.{i // 256 % 256}.{i % 256}.0/24',
+        'overridable': False,
+        'description': f'benchmark network object {i}',
+        'links': {'self': f'https://fmc{PREFIX}/object/networks/{uuid.UUID(int=i)}', 'parent': f'https://fmc{PREFIX}'},
+        'metadata': {
+            'timestamp': 1700000000000 + i,
+            'lastUser': {'name': 'admin'},
+            'domain': {'name': 'Global', 'id': DOMAIN, 'type': 'Domain'},
+            'ipType': 'V_4',
+            'parentType': 'NetworkAddress',
+        },
+    }
+
+
+def application(i: int):
+    return {
+        'id': str(i),
+        'name': f'app-{i}',
+        'type': 'Application',
+        'appId': i,
+        'description': f'benchmark application {i}',
+        'risk': {'name': 'Low', 'weight': 2},
+        'productivity': {'name': 'Medium', 'weight': 3},
+        'appCategories': [{'id': str(i % 50), 'name': f'category-{i % 50}', 'type': 'ApplicationCategory'}],
+        'appTags': [{'id': str(i % 20), 'name': f'tag-{i % 20}', 'type': 'ApplicationTag'}],
+        'applicationTypes': [{'name': 'WEBAPP', 'type': 'ApplicationType'}],
+        'links': {'self': f'https://fmc{PREFIX}/object/applications/{i}'},
+    }
+
+
+class State:
+    """Collections and request log of the stand-in server"""
+
+    def __init__(self, items=2500, latency=0.0, applications=0):
+        self.latency = latency
+        self.lock = threading.Lock()
+        self.tokens = 0
+        self.requests = []
+        self.fail_next = []
+        self.collections = {
+            '/object/networks': [network(i) for i in range(items)],
+            '/object/hosts': [
+                {'id': str(uuid.UUID(int=10**6 + i)), 'name': f'host-{i}', 'type': 'Host', 'value': f'10.0.0.{i}'}
+                for i in range(10)
+            ],
+            '/object/applications': [application(i) for i in range(applications)],
+            '/policy/accesspolicies': [
+                {'id': str(uuid.UUID(int=10**7 + i)), 'name': f'acp-{i}', 'type': 'AccessPolicy'} for i in range(5)
+            ],
+        }
+
+
+def make_handler(state: State):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def log_message(self, *args):
+            pass
+
+        def send(self, status, body=None, headers=None):
+            data = json.dumps(body).encode() if body is not None else b''
+            self.send_response(status)
+            for key, value in (headers or {}).items():
+                self.send_header(key, value)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def error(self, status, description):
+            self.send(status, {'error': {'messages': [{'description': description}]}}, {'Retry-After': '0'})
+
+        def body(self):
+            length = int(self.headers.get('Content-Length') or 0)
+            raw = self.rfile.read(length) if length else b''
+            return json.loads(raw) if raw else None
+
+        def dispatch(self, method):
+            data = self.body()
+            url = urlparse(self.path)
+            query = {key: value[0] for key, value in parse_qs(url.query).items()}
+            token = self.headers.get('X-auth-access-token')
+            with state.lock:
+                state.requests.append((method, url.path, query, token))
+                fail = state.fail_next.pop(0) if state.fail_next else None
+            if state.latency:
+                time.sleep(state.latency)
+            if fail:
+                return self.error(fail, 'simulated failure')
+            if url.path.endswith(('/auth/generatetoken', '/auth/refreshtoken')):
+                with state.lock:
+                    state.tokens += 1
+                    count = state.tokens
+                return self.send(
+                    204,
+                    headers={
+                        'X-auth-access-token': f'access-{count}',
+                        'X-auth-refresh-token': f'refresh-{count}',
+                        'DOMAINS': json.dumps([{'name': 'Global', 'uuid': DOMAIN}]),
+                    },
+                )
+            if token != f'access-{state.tokens}':
+                return self.error(401, 'Access token invalid.')
+            if url.path.endswith('/info/serverversion'):
+                version = {'serverVersion': '7.4.0 (build 1)', 'vdbVersion': 'build 370 ( 2023-05-01 )'}
+                return self.send(
+                    200, {'items': [version], 'paging': {'count': 1, 'offset': 0, 'limit': 25, 'pages': 1}}
+                )
+            parts = url.path[len(PREFIX) :].split('/')
+            collection = state.collections.get('/'.join(parts[:3]))
+            if collection is None:
+                return self.error(404, 'not found')
+            if len(parts) > 3:
+                return self.item(method, collection, parts[3], data)
+            if method == 'GET':
+                return self.page(url.path, collection, query)
+            if method == 'POST':
+                return self.create(collection, data)
+            if method == 'DELETE' and query.get('filter', '').startswith('ids:'):
+                return self.delete(collection, query['filter'][4:].split(','))
+            return self.error(405, 'method not allowed')
+
+        def item(self, method, collection, uuid_, data):
+            for item in collection:
+                if item['id'] == uuid_:
+                    if method == 'DELETE':
+                        collection.remove(item)
+                    elif method == 'PUT':
+                        item.update(data)
+                    return self.send(200, item)
+            return self.error(404, 'not found')
+
+        def page(self, path, collection, query):
+            items = collection
+            for condition in query.get('filter', '').split(';'):
+                if condition.startswith('nameOrValue:'):
+                    value = condition.split(':', 1)[1]
+                    items = [i for i in items if value in i['name'] or value in i.get('value', '')]
+            if 'name' in query:
+                items = [i for i in items if i['name'] == query['name']]
+            offset = int(query.get('offset', 0))
+            limit = int(query.get('limit', 25))
+            page = items[offset : offset + limit]
+            if query.get('expanded', 'false').lower() != 'true':
+                page = [{'id': i['id'], 'name': i['name'], 'type': i['type']} for i in page]
+            paging = {'offset': offset, 'limit': limit, 'count': len(items), 'pages': -(-len(items) // limit)}
+            if offset + limit < len(items):
+                next_query = urlencode({**query, 'offset': offset + limit})
+                paging['next'] = [f'http://{self.headers["Host"]}{path}?{next_query}']
+            payload = {'paging': paging, 'links': {}}
+            if page:
+                payload['items'] = page
+            return self.send(200, payload)
+
+        def create(self, collection, data):
+            items = data if isinstance(data, list) else [data]
+            if any(item.get('name') == 'bad' for item in items):
+                return self.error(400, 'invalid item')
+            created = [dict(item, id=str(uuid.uuid4())) for item in items]
+            collection.extend(created)
+            return self.send(201, {'items': created} if isinstance(data, list) else created[0])
+
+        def delete(self, collection, uuids):
+            deleted = [item for item in collection if item['id'] in uuids]
+            if len(deleted) != len(uuids):
+                return self.error(404, 'not found')
+            for item in deleted:
+                collection.remove(item)
+            return self.send(200, {'items': deleted})
+
+        def do_GET(self):
+            self.dispatch('GET')
+
+        def do_POST(self):
+            self.dispatch('POST')
+
+        def do_PUT(self):
+            self.dispatch('PUT')
+
+        def do_DELETE(self):
+            self.dispatch('DELETE')
+
+    return Handler
+
+
+def serve(items=2500, latency=0.0, applications=0):
+    """start stand-in server in a background thread
+
+    :return: server, server state and `host:port` of the server
+    :rtype: tuple
+    """
+    state = State(items, latency, applications)
+    server = ThreadingHTTPServer(('127.0.0.1', 0), make_handler(state))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, state, f'127.0.0.1:{server.server_address[1]}'
@@ -1,40 +1,71 @@
 # -*- coding: utf-8 -*-
 
+import importlib
 import logging
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from fireREST import defaults
-from fireREST.fmc import Connection
-from fireREST.fmc.analysis import Analysis
-from fireREST.fmc.assignment import Assignment
-from fireREST.fmc.audit import Audit
-from fireREST.fmc.backup import Backup
-from fireREST.fmc.changemanagement import ChangeManagement
-from fireREST.fmc.chassis import Chassis
-from fireREST.fmc.deployment import Deployment
-from fireREST.fmc.device import Device
-from fireREST.fmc.devicecluster import DeviceCluster
-from fireREST.fmc.devicegroup import DeviceGroup
-from fireREST.fmc.devicehapair import DeviceHAPair
-from fireREST.fmc.health import Health
-from fireREST.fmc.integration import Integration
-from fireREST.fmc.intelligence import Intelligence
-from fireREST.fmc.job import Job
-from fireREST.fmc.license import License
-from fireREST.fmc.netmap import NetMap
-from fireREST.fmc.object import Object
-from fireREST.fmc.policy import Policy
-from fireREST.fmc.system import System
-from fireREST.fmc.systemconfiguration import SystemConfiguration
-from fireREST.fmc.troubleshoot import Troubleshoot
-from fireREST.fmc.update import Update
-from fireREST.fmc.user import User
+from fireREST.fmc import Connection, LazyResource, capability_map, lazy_getattr
+
+if TYPE_CHECKING:
+    from fireREST.fmc.aio import AsyncFMC as AsyncFMC
+    from fireREST.fmc.analysis import Analysis
+    from fireREST.fmc.assignment import Assignment
+    from fireREST.fmc.audit import Audit
+    from fireREST.fmc.backup import Backup
+    from fireREST.fmc.changemanagement import ChangeManagement
+    from fireREST.fmc.chassis import Chassis
+    from fireREST.fmc.deployment import Deployment
+    from fireREST.fmc.device import Device
+    from fireREST.fmc.devicecluster import DeviceCluster
+    from fireREST.fmc.devicegroup import DeviceGroup
+    from fireREST.fmc.devicehapair import DeviceHAPair
+    from fireREST.fmc.health import Health
+    from fireREST.fmc.integration import Integration
+    from fireREST.fmc.intelligence import Intelligence
+    from fireREST.fmc.job import Job
+    from fireREST.fmc.license import License
+    from fireREST.fmc.netmap import NetMap
+    from fireREST.fmc.object import Object
+    from fireREST.fmc.policy import Policy
+    from fireREST.fmc.system import System
+    from fireREST.fmc.systemconfiguration import SystemConfiguration
+    from fireREST.fmc.troubleshoot import Troubleshoot
+    from fireREST.fmc.update import Update
+    from fireREST.fmc.user import User
 
 logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
 
 
 class FMC:
+    analysis: LazyResource['Analysis'] = LazyResource('.fmc.analysis', 'Analysis')
+    assignment: LazyResource['Assignment'] = LazyResource('.fmc.assignment', 'Assignment')
+    audit: LazyResource['Audit'] = LazyResource('.fmc.audit', 'Audit')
+    backup: LazyResource['Backup'] = LazyResource('.fmc.backup', 'Backup')
+    changemanagement: LazyResource['ChangeManagement'] = LazyResource('.fmc.changemanagement', 'ChangeManagement')
+    chassis: LazyResource['Chassis'] = LazyResource('.fmc.chassis', 'Chassis')
+    deployment: LazyResource['Deployment'] = LazyResource('.fmc.deployment', 'Deployment')
+    device: LazyResource['Device'] = LazyResource('.fmc.device', 'Device')
+    devicecluster: LazyResource['DeviceCluster'] = LazyResource('.fmc.devicecluster', 'DeviceCluster')
+    devicegroup: LazyResource['DeviceGroup'] = LazyResource('.fmc.devicegroup', 'DeviceGroup')
+    devicehapair: LazyResource['DeviceHAPair'] = LazyResource('.fmc.devicehapair', 'DeviceHAPair')
+    health: LazyResource['Health'] = LazyResource('.fmc.health', 'Health')
+    integration: LazyResource['Integration'] = LazyResource('.fmc.integration', 'Integration')
+    intelligence: LazyResource['Intelligence'] = LazyResource('.fmc.intelligence', 'Intelligence')
+    job: LazyResource['Job'] = LazyResource('.fmc.job', 'Job')
+    license: LazyResource['License'] = LazyResource('.fmc.license', 'License')
+    netmap: LazyResource['NetMap'] = LazyResource('.fmc.netmap', 'NetMap')
+    object: LazyResource['Object'] = LazyResource('.fmc.object', 'Object')
+    policy: LazyResource['Policy'] = LazyResource('.fmc.policy', 'Policy')
+    system: LazyResource['System'] = LazyResource('.fmc.system', 'System')
+    systemconfiguration: LazyResource['SystemConfiguration'] = LazyResource(
+        '.fmc.systemconfiguration', 'SystemConfiguration'
+    )
+    troubleshoot: LazyResource['Troubleshoot'] = LazyResource('.fmc.troubleshoot', 'Troubleshoot')
+    update: LazyResource['Update'] = LazyResource('.fmc.update', 'Update')
+    user: LazyResource['User'] = LazyResource('.fmc.user', 'User')
+
     def __init__(
         self,
         hostname: str,
@@ -47,33 +78,79 @@ class FMC:
         dry_run=defaults.DRY_RUN,
         cdo=False,
         cdo_domain_id=defaults.API_CDO_DEFAULT_DOMAIN_ID,
+        paging_workers=defaults.API_PAGING_WORKERS,
+        rate_limit=defaults.API_RATE_LIMIT,
+        retry_policy=None,
+        connect_timeout=defaults.API_CONNECT_TIMEOUT,
+        pool_connections=defaults.API_POOL_CONNECTIONS,
+        pool_maxsize=defaults.API_POOL_MAXSIZE,
+        pool_block=defaults.API_POOL_BLOCK,
+        token_cache=None,
+        name_cache_ttl=defaults.API_NAME_CACHE_TTL,
+        name_cache_maxsize=defaults.API_NAME_CACHE_MAXSIZE,
+        json_codec=defaults.API_JSON_CODEC,
+        response_cache=False,
+        response_cache_maxsize=defaults.API_RESPONSE_CACHE_MAXSIZE,
+        reference_store=None,
+        hooks=None,
     ):
         self.conn = Connection(
-            hostname, username, password, protocol, verify_cert, domain, timeout, dry_run, cdo, cdo_domain_id
+            hostname,
+            username,
+            password,
+            protocol,
+            verify_cert,
+            domain,
+            timeout,
+            dry_run,
+            cdo,
+            cdo_domain_id,
+            paging_workers=paging_workers,
+            rate_limit=rate_limit,
+            retry_policy=retry_policy,
+            connect_timeout=connect_timeout,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            token_cache=token_cache,
+            name_cache_ttl=name_cache_ttl,
+            name_cache_maxsize=name_cache_maxsize,
+            json_codec=json_codec,
+            response_cache=response_cache,
+            response_cache_maxsize=response_cache_maxsize,
+            reference_store=reference_store,
+            hooks=hooks,
         )
         self.domain = self.conn.domain
         self.version = self.conn.version
-        self.analysis = Analysis(self.conn)
-        self.assignment = Assignment(self.conn)
-        self.audit = Audit(self.conn)
-        self.backup = Backup(self.conn)
-        self.changemanagement = ChangeManagement(self.conn)
-        self.chassis = Chassis(self.conn)
-        self.deployment = Deployment(self.conn)
-        self.device = Device(self.conn)
-        self.devicecluster = DeviceCluster(self.conn)
-        self.devicegroup = DeviceGroup(self.conn)
-        self.devicehapair = DeviceHAPair(self.conn)
-        self.health = Health(self.conn)
-        self.integration = Integration(self.conn)
-        self.intelligence = Intelligence(self.conn)
-        self.job = Job(self.conn)
-        self.license = License(self.conn)
-        self.netmap = NetMap(self.conn)
-        self.object = Object(self.conn)
-        self.policy = Policy(self.conn)
-        self.system = System(self.conn)
-        self.systemconfiguration = SystemConfiguration(self.conn)
-        self.troubleshoot = Troubleshoot(self.conn)
-        self.update = Update(self.conn)
-        self.user = User(self.conn)
+        self._capabilities = None
+
+    def profile(self):
+        """Profile all api operations performed within the context, see `Connection.profile`
+
+        Example: `with fmc.profile() as profile: fmc.object.network.get(); print(profile.report())`
+
+        :return: context manager that yields a `profiling.Profile`
+        """
+        return self.conn.profile()
+
+    def capabilities(self):
+        """list operations supported by the fmc version of the connection for all api resources. Allows to skip
+        unsupported operations up front instead of handling `UnsupportedOperationError`. The map is built on first
+        use since it requires all resource modules to be imported, subsequent calls return the cached map
+
+        Example: `[path for path, ops in fmc.capabilities().items() if ops['create']]`
+
+        :return: mapping of resource path (e.g. `object.network`) to supported operations (create, get, update, delete)
+        :rtype: Dict[str, Dict[str, bool]]
+        """
+        if self._capabilities is None:
+            self._capabilities = capability_map(type(self), self.version)
+        return self._capabilities
+
+
+def __getattr__(name: str):
+    if name == 'AsyncFMC':
+        # asyncio is only imported when the async interface is used
+        return importlib.import_module('fireREST.fmc.aio').AsyncFMC
+    return lazy_getattr(__name__, name)
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+
+import contextvars
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
+from logging import getLogger
+from typing import Any, Callable, Iterable, List, Optional, Sequence, Tuple
+
+from requests.exceptions import RequestException
+
+from . import exceptions as exc
+from . import profiling
+
+logger = getLogger(__name__)
+
+#: errors that are not caused by individual items of a bulk request. Chunks failing with one of these errors are not
+#: split, all items of the chunk are reported as failed
+REQUEST_ERRORS = (
+    exc.AuthError,
+    exc.AuthorizationError,
+    exc.AuthRefreshError,
+    exc.DomainNotFoundError,
+    exc.RateLimitException,
+    exc.UnsupportedOperationError,
+    RequestException,
+)
+
+#: errors caused by the payload of a bulk request. Only chunks failing with one of these errors (or any other error
+#: fmc responded to with status 400) are split to isolate the invalid items. All other errors, e.g. internal server
+#: errors after which fmc might have applied the request partially, fail all items of the chunk without resending them
+PAYLOAD_ERRORS = (
+    exc.PayloadLimitExceededError,
+    exc.ResourceAlreadyExistsError,
+    exc.UnprocessableEntityError,
+)
+
+#: chunk of a bulk operation. Each entry consists of the item provided by the caller and the payload sent to fmc
+#: (for create and update operations the sanitized api object and its serialized form)
+Chunk = List[Tuple[Any, Any]]
+
+
+class BulkResult:
+    """Result of a bulk operation. Every item provided to the operation is either listed in `succeeded` together with
+    the api object returned by fmc or in `failed` together with the error that occurred. Items are listed in the order
+    in which their requests completed
+
+    Example: `result = fmc.object.network.bulk_create(networks); result = result.retry()`
+    """
+
+    def __init__(self, retry: Optional[Callable[[List], 'BulkResult']] = None):
+        """Initialize bulk result
+
+        :param retry: callable that repeats the bulk operation for a list of items
+        :type retry: Callable, optional
+        """
+        self.succeeded: List[Tuple[Any, Any]] = []
+        self.failed: List[Tuple[Any, Exception]] = []
+        self._retry = retry
+
+    def __repr__(self):
+        return f'<BulkResult succeeded={len(self.succeeded)} failed={len(self.failed)}>'
+
+    @property
+    def ok(self):
+        """True if the operation succeeded for all items"""
+        return not self.failed
+
+    @property
+    def items(self):
+        """api objects returned by fmc for all successful items"""
+        return [result for _, result in self.succeeded]
+
+    @property
+    def failed_items(self):
+        """items provided by the caller for which the operation failed"""
+        return [item for item, _ in self.failed]
+
+    @property
+    def errors(self):
+        """errors that occurred for the failed items"""
+        return [error for _, error in self.failed]
+
+    def retry(self):
+        """repeat the bulk operation for all failed items. Successful items are not sent again
+
+        :return: result containing the successful items of both operations and all items that failed again
+        :rtype: BulkResult
+        """
+        if not self.failed or self._retry is None:
+            return self
+        result = self._retry(self.failed_items)
+        result.succeeded = self.succeeded + result.succeeded
+        return result
+
+
+def payload_error(error: Exception) -> bool:
+    """check if a bulk request was rejected by fmc because of its payload
+
+    :param error: error raised for the bulk request
+    :type error: Exception
+    :return: True if the error was caused by the items of the request
+    :rtype: bool
+    """
+    return isinstance(error, PAYLOAD_ERRORS) or getattr(error, 'status_code', None) == 400
+
+
+def execute(send: Callable[[Chunk], Sequence], chunks: Iterable[Chunk], max_workers: int, retry=None) -> BulkResult:
+    """execute a bulk operation chunk by chunk using a bounded number of concurrent requests
+
+    If a chunk is rejected by fmc because of its payload (see `PAYLOAD_ERRORS`) it is split in half and both halves
+    are sent again until the items that caused the error are isolated. All other errors fail all items of the chunk
+    without sending them again
+
+    :param send: callable that sends a single chunk and returns the api objects created, updated or deleted by the
+                 request in the same order as the chunk (or an empty sequence if fmc does not return them)
+    :type send: Callable
+    :param chunks: chunks of the bulk operation
+    :type chunks: Iterable[Chunk]
+    :param max_workers: max. number of chunks sent concurrently
+    :type max_workers: int
+    :param retry: callable that repeats the bulk operation for a list of items, used by `BulkResult.retry`
+    :type retry: Callable, optional
+    :return: result of the bulk operation
+    :rtype: BulkResult
+    """
+    result = BulkResult(retry)
+    chunks = iter(chunks)
+    # chunks are sent within the context of the caller, e.g. to attribute requests to the resource operation
+    context = contextvars.copy_context()
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='fireREST-bulk') as executor:
+        pending = {}
+
+        def submit(chunk: Chunk):
+            pending[executor.submit(context.copy().run, send, chunk)] = chunk
+
+        for chunk in islice(chunks, max_workers):
+            submit(chunk)
+        while pending:
+            with profiling.section(profiling.WORKERS):
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                chunk = pending.pop(future)
+                try:
+                    objects = future.result()
+                except REQUEST_ERRORS as error:
+                    result.failed.extend((item, error) for item, _ in chunk)
+                except exc.GenericApiError as error:
+                    if len(chunk) == 1 or not payload_error(error):
+                        result.failed.extend((item, error) for item, _ in chunk)
+                    else:
+                        logger.info('Bulk request with %s items failed (%s). Splitting request', len(chunk), error)
+                        half = len(chunk) // 2
+                        submit(chunk[:half])
+                        submit(chunk[half:])
+                else:
+                    objects = objects if objects and len(objects) == len(chunk) else [None] * len(chunk)
+                    result.succeeded.extend((item, obj) for (item, _), obj in zip(chunk, objects))
+            for chunk in islice(chunks, max(max_workers - len(pending), 0)):
+                submit(chunk)
+    return result
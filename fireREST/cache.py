@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+_MISSING = object()
+
+_bypass: ContextVar[bool] = ContextVar('fireREST_cache_bypass', default=False)
+
+
+@contextmanager
+def bypass():
+    """Skip cache lookups for all operations performed within the context. Operations that would have been
+    answered from a cache query the api instead and refresh the cached data with the result
+
+    Example: `with cache.bypass(): fmc.policy.accesspolicy.accessrule.create(data, container_name='ACP')`
+    """
+    token = _bypass.set(True)
+    try:
+        yield
+    finally:
+        _bypass.reset(token)
+
+
+def bypassed():
+    """verify if cache lookups are currently bypassed
+
+    :return: True if called within `cache.bypass()`
+    :rtype: bool
+    """
+    return _bypass.get()
+
+
+class TTLCache:
+    """Thread-safe cache with least-recently-used eviction. Entries expire `ttl` seconds after they have been stored"""
+
+    def __init__(self, maxsize: int, ttl: float):
+        """Initialize cache
+
+        :param maxsize: max. number of entries. The least recently used entry is evicted once the limit is reached
+        :type maxsize: int
+        :param ttl: time in seconds an entry is valid
+        :type ttl: float
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, default=None):
+        """get cached value
+
+        :param key: cache key
+        :param default: value returned if key is not cached or expired
+        :return: cached value or `default`
+        """
+        with self._lock:
+            expires, value = self._entries.get(key, (0.0, _MISSING))
+            if value is _MISSING or expires <= time.monotonic():
+                self._entries.pop(key, None)
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value, ttl: Optional[float] = None):
+        """store value in cache
+
+        :param key: cache key
+        :param value: value that will be cached
+        :param ttl: time in seconds the entry is valid. Defaults to the ttl of the cache
+        :type ttl: float, optional
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def pop(self, key, default=None):
+        """remove entry from cache
+
+        :param key: cache key
+        :param default: value returned if key is not cached
+        :return: removed value or `default`
+        """
+        with self._lock:
+            return self._entries.pop(key, (0.0, default))[1]
+
+    def invalidate(self, predicate):
+        """remove all entries whose key matches `predicate`
+
+        :param predicate: callable invoked with each key, entries are removed if it returns True
+        :type predicate: Callable
+        :return: number of removed entries
+        :rtype: int
+        """
+        with self._lock:
+            keys = [key for key in self._entries if predicate(key)]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def clear(self):
+        """remove all entries from cache"""
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+
+import json
+from typing import Dict, Type, Union
+
+from . import defaults
+
+
+class JsonCodec:
+    """Json codec based on the python standard library. Payloads are serialized to compact utf-8 encoded bytes that
+    are sent as request body and response bodies are decoded directly from the raw response content
+
+    Decoding errors are raised as `ValueError` (or a subclass of it) by all codecs
+    """
+
+    #: name used to select the codec
+    name = 'json'
+
+    def dumps(self, obj) -> bytes:
+        """serialize object to json
+
+        :param obj: object that will be serialized
+        :return: utf-8 encoded json document
+        :rtype: bytes
+        """
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+    def loads(self, data: Union[bytes, str]):
+        """deserialize json document
+
+        :param data: json document
+        :type data: Union[bytes, str]
+        :return: deserialized object
+        """
+        return json.loads(data)
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__} {self.name}>'
+
+
+class SimplejsonCodec(JsonCodec):
+    """Json codec based on `simplejson`"""
+
+    name = 'simplejson'
+
+    def __init__(self):
+        import simplejson
+
+        self._json = simplejson
+
+    def dumps(self, obj) -> bytes:
+        return self._json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+    def loads(self, data: Union[bytes, str]):
+        if isinstance(data, bytes):
+            data = data.decode('utf-8')
+        return self._json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """Json codec based on `orjson`. Requires the optional `orjson` package"""
+
+    name = 'orjson'
+
+    def __init__(self):
+        import orjson
+
+        self._json = orjson
+
+    def dumps(self, obj) -> bytes:
+        return self._json.dumps(obj)
+
+    def loads(self, data: Union[bytes, str]):
+        return self._json.loads(data)
+
+
+#: codecs that can be selected by name
+CODECS: Dict[str, Type[JsonCodec]] = {
+    JsonCodec.name: JsonCodec,
+    SimplejsonCodec.name: SimplejsonCodec,
+    OrjsonCodec.name: OrjsonCodec,
+}
+
+
+def get_codec(codec: Union[str, JsonCodec, None] = None) -> JsonCodec:
+    """get json codec used to serialize requests and deserialize responses
+
+    :param codec: codec instance or name of the codec (`orjson`, `simplejson`, `json`). `auto` uses `orjson` if it
+                  is installed and falls back to the standard library otherwise. Defaults to `auto`
+    :type codec: Union[str, JsonCodec], optional
+    :return: json codec
+    :rtype: JsonCodec
+    """
+    if isinstance(codec, JsonCodec):
+        return codec
+    codec = codec or defaults.API_JSON_CODEC
+    if codec == 'auto':
+        try:
+            return OrjsonCodec()
+        except ImportError:
+            return JsonCodec()
+    if codec not in CODECS:
+        raise ValueError(f'Unsupported json codec {codec}. Supported codecs: auto, {", ".join(CODECS)}')
+    return CODECS[codec]()
@@ -35,12 +35,30 @@ API_CONTENT_TYPE = 'application/json'
 #: paging limit for get requests that contain multiple items
 API_PAGING_LIMIT = 1000
 
+#: max. number of pages that are fetched concurrently for get requests that contain multiple items
+API_PAGING_WORKERS = 1
+
+#: max. number of api calls executed concurrently by async connections
+API_ASYNC_MAX_CONCURRENCY = 10
+
 #: expansion mode for get requests
 API_EXPANSION_MODE = True
 
 #: http request timeout
 API_REQUEST_TIMEOUT = 120
 
+#: http connect timeout. `None` applies `API_REQUEST_TIMEOUT` to both connect and read
+API_CONNECT_TIMEOUT = None
+
+#: number of host connection pools cached by the http session
+API_POOL_CONNECTIONS = 10
+
+#: max. number of connections kept alive per host. Should be >= number of concurrent workers
+API_POOL_MAXSIZE = 10
+
+#: block instead of opening additional (non-pooled) connections if all pooled connections are in use
+API_POOL_BLOCK = False
+
 #: name of fmc default domain for api requests
 API_DEFAULT_DOMAIN = 'Global'
 
@@ -53,9 +71,79 @@ API_REFRESH_COUNTER_INIT = 0
 #: max no. of authorization token refresh operations
 API_REFRESH_COUNTER_MAX = 3
 
+#: max. number of api requests per rate limit period. FMC allows 120 requests per minute
+API_RATE_LIMIT = 120
+
+#: rate limit period in seconds
+API_RATE_LIMIT_PERIOD = 60
+
+#: number of requests that can be sent immediately before the client-side rate limiter starts pacing requests
+API_RATE_LIMIT_BURST = 10
+
+#: max. number of retries per request and status code. `connection` applies to connection errors and timeouts
+API_RETRY_BUDGET = {429: 5, 502: 3, 503: 3, 504: 3, 'connection': 3}
+
+#: delay in seconds before the first retry of a failed request
+API_RETRY_BACKOFF_BASE = 1.0
+
+#: multiplier applied to the retry delay after each attempt
+API_RETRY_BACKOFF_FACTOR = 2.0
+
+#: max. delay in seconds between two attempts of a failed request
+API_RETRY_BACKOFF_MAX = 60.0
+
+#: min. delay in seconds between two attempts per status code if the response does not include a `Retry-After` header.
+#: Retries of requests rejected by the rate limit of FMC (429) span at least one rate limit period
+API_RETRY_BACKOFF_MIN = {429: API_RATE_LIMIT_PERIOD / API_RETRY_BUDGET[429]}
+
+#: file name of the token cache within the fireREST cache directory
+API_TOKEN_CACHE_FILE = 'tokens.json'
+
+#: max. age in seconds of cached sessions. FMC access tokens can be refreshed 3 times and expire after 30 minutes
+API_TOKEN_CACHE_MAX_AGE = 7200
+
+#: max. age in seconds of a cached server version before it is verified again
+API_TOKEN_CACHE_VERSION_MAX_AGE = 86400
+
+#: file name of the reference store within the fireREST cache directory
+API_REFERENCE_STORE_FILE = 'references.sqlite'
+
+#: max. age in seconds of responses persisted in the reference store
+API_REFERENCE_STORE_MAX_AGE = 604800
+
+#: time in seconds to wait for a lock on the reference store database
+API_REFERENCE_STORE_TIMEOUT = 10.0
+
+#: time in seconds name to uuid mappings are cached by `utils.resolve_by_name`. `0` disables the cache
+API_NAME_CACHE_TTL = 0
+
+#: max. number of collections (resource type, domain and container) a name index is cached for
+API_NAME_CACHE_MAXSIZE = 256
+
+#: max. number of responses kept by the response cache of a connection
+API_RESPONSE_CACHE_MAXSIZE = 1024
+
+#: time in seconds responses of reference data resources (e.g. countries, applications) are cached
+API_RESPONSE_CACHE_TTL = 3600
+
+#: number of recent requests per resource and http method used by `metrics.MetricsCollector` for latency quantiles
+API_METRICS_SAMPLES = 1024
+
+#: json codec used to serialize requests and deserialize responses. `auto` uses orjson if installed
+API_JSON_CODEC = 'auto'
+
 #: max size of api payload in bytes
 API_PAYLOAD_SIZE_MAX = 2048000
 
+#: max. number of items per bulk request. Bulk payloads with more items are split into multiple requests
+API_BULK_ITEMS_MAX = 1000
+
+#: max. number of items per bulk delete request. Items are passed as `ids` filter within the url
+API_BULK_DELETE_ITEMS_MAX = 100
+
+#: max. number of requests that are sent concurrently by bulk operations
+API_BULK_WORKERS = 4
+
 # software releases
 API_RELEASE_610 = '6.1.0'
 API_RELEASE_620 = '6.2.0'
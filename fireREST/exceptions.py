@@ -6,6 +6,9 @@ from . import defaults
 class GenericApiError(Exception):
     """Generic api error"""
 
+    #: http status code of the fmc response that caused the error (None if the error was not raised for a response)
+    status_code = None
+
     def __init__(self, msg='', *args, **kwargs):
         self.__dict__.update(kwargs)
         super().__init__(msg, *args)
@@ -1,9 +1,17 @@
 # -*- coding: utf-8 -*-
 
+import contextvars
+import importlib
 import json
 import logging
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from http.client import responses as http_responses
-from typing import Dict, Union, Optional
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Callable, Dict, Generic, Iterable, List, Optional, Type, TypeVar, Union, overload
 from urllib.parse import urlencode
 
 import requests
@@ -11,18 +19,35 @@ import simplejson
 import simplejson.errors
 import urllib3
 from packaging import version
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
 
-from fireREST import defaults
+from fireREST import bulk, cache, defaults, profiling
 from fireREST import exceptions as exc
 from fireREST import utils
+from fireREST.cache import TTLCache
+from fireREST.codec import JsonCodec, get_codec
+from fireREST.hooks import POST_RESPONSE, PRE_REQUEST, RATE_LIMIT, REFRESH, Hooks
+from fireREST.ratelimit import RateLimiter
+from fireREST.retry import RetryPolicy
+from fireREST.tokencache import TokenCache
+
+if TYPE_CHECKING:
+    from fireREST.referencestore import ReferenceStore
 
 logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
 
+T = TypeVar('T')
+
 
 class Connection:
-    """API Connection object used to interact with Firepower Management Center REST API"""
+    """API Connection object used to interact with Firepower Management Center REST API
+
+    A `Connection` is safe for concurrent use by multiple threads. Authentication token refresh is
+    single-flight: if several requests detect an expired access token at the same time only one
+    refresh (or re-authentication) is performed, all other requests wait and are repeated using the new token
+    """
 
     def __init__(
         self,
@@ -36,6 +61,21 @@ class Connection:
         dry_run=defaults.DRY_RUN,
         cdo=False,
         cdo_domain_id=defaults.API_CDO_DEFAULT_DOMAIN_ID,
+        paging_workers=defaults.API_PAGING_WORKERS,
+        rate_limit: Union[int, RateLimiter, None] = defaults.API_RATE_LIMIT,
+        retry_policy: Optional[RetryPolicy] = None,
+        connect_timeout=defaults.API_CONNECT_TIMEOUT,
+        pool_connections=defaults.API_POOL_CONNECTIONS,
+        pool_maxsize=defaults.API_POOL_MAXSIZE,
+        pool_block=defaults.API_POOL_BLOCK,
+        token_cache: Union[bool, str, TokenCache, None] = None,
+        name_cache_ttl=defaults.API_NAME_CACHE_TTL,
+        name_cache_maxsize=defaults.API_NAME_CACHE_MAXSIZE,
+        json_codec: Union[str, JsonCodec, None] = defaults.API_JSON_CODEC,
+        response_cache=False,
+        response_cache_maxsize=defaults.API_RESPONSE_CACHE_MAXSIZE,
+        reference_store: Union[bool, str, 'ReferenceStore', None] = None,
+        hooks: Optional[Hooks] = None,
     ):
         """Initialize connection object. It is highly recommended to use a
         dedicated user for api operations
@@ -54,12 +94,64 @@ class Connection:
         :type domain: str
         :param timeout: timeout value for http requests. Defaults to `120` seconds
         :type timeout: int, optional
+        :param connect_timeout: timeout value for establishing connections. Defaults to `timeout`
+        :type connect_timeout: int, optional
         :param dry_run: only log POST,PUT and DELETE api calls
         :type dry_run: bool, optional
         :param cdo: True when connecting to cdFMC
         :type cdo: bool, optional
         :param cdo_domain_id: CDO domain ID
         :type cdo_domain_id: str, optional
+        :param paging_workers: max. number of pages fetched concurrently for paginated GET operations.
+                               Defaults to `1` (pages are fetched sequentially)
+        :type paging_workers: int, optional
+        :param rate_limit: max. number of requests per minute or a `RateLimiter` shared with other connections.
+                           Requests are paced client-side to stay below the limit. `None` disables rate limiting.
+                           Defaults to `120`
+        :type rate_limit: Union[int, RateLimiter], optional
+        :param retry_policy: policy used to retry failed requests. Defaults to `RetryPolicy()`
+        :type retry_policy: RetryPolicy, optional
+        :param pool_connections: number of host connection pools cached by the http session. Defaults to `10`
+        :type pool_connections: int, optional
+        :param pool_maxsize: max. number of connections kept alive per host. Should be at least the number of
+                             concurrent workers to avoid repeated tls handshakes. Defaults to `10`
+        :type pool_maxsize: int, optional
+        :param pool_block: block requests instead of opening additional connections if the pool is exhausted.
+                           Defaults to `False`
+        :type pool_block: bool, optional
+        :param token_cache: persist access/refresh tokens, domains and server version on disk and reuse them across
+                            processes. `True` uses the default cache location, a `str` is used as path to the cache
+                            file. Cached tokens are validated on first use and refreshed transparently. Not
+                            applicable for CDO. Defaults to `None` (disabled)
+        :type token_cache: Union[bool, str, TokenCache], optional
+        :param name_cache_ttl: time in seconds name to uuid mappings used to resolve `name` and `container_name`
+                               arguments are cached. Mappings of a resource are invalidated by create, update and
+                               delete operations of this client, changes by other clients are not detected until
+                               the ttl expires. Defaults to `0` (disabled)
+        :type name_cache_ttl: float, optional
+        :param name_cache_maxsize: max. number of collections for which name to uuid mappings are cached.
+                                   Defaults to `256`
+        :type name_cache_maxsize: int, optional
+        :param json_codec: json codec (`orjson`, `simplejson`, `json` or a `codec.JsonCodec` instance) used to
+                           serialize requests and deserialize responses. `auto` uses orjson if it is installed and
+                           falls back to the standard library. Defaults to `auto`
+        :type json_codec: Union[str, JsonCodec], optional
+        :param response_cache: cache responses of GET operations on resources that define a `CACHE_TTL` (reference
+                               data such as countries or applications). Cached responses of a resource are
+                               invalidated by create, update and delete operations on the resource or one of its
+                               parents. Defaults to `False`
+        :type response_cache: bool, optional
+        :param response_cache_maxsize: max. number of cached responses. Defaults to `1024`
+        :type response_cache_maxsize: int, optional
+        :param reference_store: persist responses of reference data resources (e.g. applications, url categories,
+                                countries) on disk and reuse them across processes as long as fmc software and vdb
+                                version do not change. Both versions are retrieved when the connection is created,
+                                even if a cached session is used. `True` uses the default store location, a `str` is
+                                used as path to the database file. Defaults to `None` (disabled)
+        :type reference_store: Union[bool, str, ReferenceStore], optional
+        :param hooks: callbacks invoked for request events (requests, responses, retries, token refreshes and rate
+                      limiting). Can be shared by multiple connections. Defaults to an empty `Hooks` registry
+        :type hooks: Hooks, optional
         """
         if not verify_cert:
             urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -81,21 +173,70 @@ class Connection:
         self.hostname = hostname
         self.protocol = protocol
         self.refresh_counter = defaults.API_REFRESH_COUNTER_INIT
+        self._auth_lock = threading.RLock()
         self.session = requests.Session()
+        self.adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+        self.session.mount('https://', self.adapter)
+        self.session.mount('http://', self.adapter)
         self.timeout = timeout
+        self.connect_timeout = connect_timeout
         self.dry_run = dry_run
+        self.paging_workers = paging_workers
+        if rate_limit and not isinstance(rate_limit, RateLimiter):
+            rate_limit = RateLimiter(limit=rate_limit)
+        self.rate_limiter = rate_limit or None
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.hooks = hooks if hooks is not None else Hooks()
+        #: profile recording the operations of this connection, see `Connection.profile`
+        self.profiler: Optional[profiling.Profile] = None
         self.verify_cert = verify_cert
+        self.codec = get_codec(json_codec)
         self.domains = None
-        self.login()
+        self.domain = None
+        if token_cache and not isinstance(token_cache, TokenCache):
+            token_cache = TokenCache(token_cache if isinstance(token_cache, str) else None)
+        self.token_cache = token_cache if token_cache and not self.cdo else None
+        self.name_cache = TTLCache(maxsize=name_cache_maxsize, ttl=name_cache_ttl) if name_cache_ttl else None
+        self._inflight: Dict[Any, Future] = {}
+        self._inflight_lock = threading.Lock()
+        self.response_cache = (
+            TTLCache(maxsize=response_cache_maxsize, ttl=defaults.API_RESPONSE_CACHE_TTL) if response_cache else None
+        )
+        if reference_store:
+            # sqlite is only imported if the reference store is used
+            from fireREST.referencestore import ReferenceStore
+
+            if not isinstance(reference_store, ReferenceStore):
+                reference_store = ReferenceStore(reference_store if isinstance(reference_store, str) else None)
+        self.reference_store = reference_store or None
+        self.version = None
+        self.vdb_version = None
+        self._version_checked = 0.0
+        session = self._restore_session()
+        if session is None:
+            self.login()
         if self.cdo:
             self.domains = [{'uuid': cdo_domain_id, 'name': 'Global'}]
             self.domain = {'id': cdo_domain_id, 'name': 'Global'}
         else:
             self.domain = {'id': self.get_domain_id(domain), 'name': domain}
-        self.version = self.get_version()
+        # the version is always retrieved if the reference store is used, responses are keyed by software and vdb
+        # version and must not be reused after an update
+        if (
+            session
+            and self.reference_store is None
+            and time.time() - session.get('version_checked', 0) < defaults.API_TOKEN_CACHE_VERSION_MAX_AGE
+        ):
+            self.version = version.parse(session['version'])
+            self.vdb_version = session.get('vdb_version')
+            self._version_checked = session['version_checked']
+        else:
+            self.version = self.get_version()
+            self._version_checked = time.time()
+        self._save_session()
 
     @utils.handle_errors
-    def _request(self, method: str, url: str, params=None, auth=None, data=None):
+    def _request(self, method: str, url: str, params=None, auth=None, data=None, body: Optional[bytes] = None):
         """Base operation used for all http api calls to firepower management center
 
         :param method: http operation (post, get, put, delete)
@@ -108,12 +249,20 @@ class Connection:
         :type auth: HTTPBasicAuth, optional
         :param data: request body (api payload)
         :type data: dict, optional
+        :param body: serialized request body. `data` is serialized using the json codec of the connection if omitted
+        :type body: bytes, optional
         :return: api response
         :rtype: requests.Response
         """
 
         params = utils.fix_params(params)
 
+        if body is None and data is not None:
+            with profiling.section(profiling.SERIALIZATION):
+                body = self.codec.dumps(data)
+        with profiling.section(profiling.PAYLOAD):
+            utils.validate_data(method, body)
+
         # if payload is of type list the bulk param should be set automatically
         if isinstance(data, list):
             params['bulk'] = True
@@ -132,68 +281,278 @@ class Connection:
             }
             logger.info(msg)
         else:
-            response = self.session.request(
-                method=method,
-                url=url,
-                params=params,
-                data=json.dumps(data),
-                auth=auth,
-                headers=self.headers,
-                timeout=self.timeout,
-                verify=self.verify_cert,
-            )
-            msg = {
+            # events are only built if callbacks are registered
+            hooks = self.hooks if self.hooks.callbacks else None
+            if self.rate_limiter:
+                with profiling.section(profiling.RATE_LIMIT):
+                    delay = self.rate_limiter.acquire()
+                if delay and hooks:
+                    hooks.emit(RATE_LIMIT, {'method': method.upper(), 'url': url, 'delay': delay})
+            if hooks:
+                hooks.emit(PRE_REQUEST, {'method': method.upper(), 'url': url, 'bytes_out': len(body or b'')})
+            start = time.perf_counter()
+            try:
+                with profiling.section(profiling.NETWORK):
+                    response = self.session.request(
+                        method=method,
+                        url=url,
+                        params=params,
+                        data=body,
+                        auth=auth,
+                        headers=self.headers,
+                        timeout=(self.connect_timeout, self.timeout) if self.connect_timeout else self.timeout,
+                        verify=self.verify_cert,
+                    )
+            except requests.RequestException as error:
+                if hooks:
+                    self._emit_response(hooks, method, url, body, None, time.perf_counter() - start, error)
+                raise
+            if hooks:
+                self._emit_response(hooks, method, url, body, response, time.perf_counter() - start)
+            if self.rate_limiter:
+                self.rate_limiter.update(response)
+            # log messages are only built if the log level is enabled. The decoded response body is cached on the
+            # response and reused by the caller, so logging does not decode the payload a second time
+            level = logging.ERROR if response.status_code >= 400 else logging.INFO
+            if logger.isEnabledFor(level):
+                with profiling.section(profiling.LOGGING):
+                    msg = {
+                        'method': method.upper(),
+                        'url': url,
+                        'params': urlencode(params) if params else '',
+                        'data': data if data else '',
+                        'status': f'{http_responses[response.status_code]} ({response.status_code})',
+                    }
+                    logger.log(level, '\n%s', utils.LazyJson(msg, indent=4))
+            if level == logging.INFO and logger.isEnabledFor(logging.DEBUG):
+                with profiling.section(profiling.LOGGING):
+                    try:
+                        payload = utils.response_json(response, self.codec)
+                        logger.debug('\n"response": %s', utils.LazyJson(payload, sort_keys=True, indent=4))
+                    except json.JSONDecodeError:
+                        pass
+                    except simplejson.errors.JSONDecodeError:
+                        pass
+        return response
+
+    def _emit_response(self, hooks: Hooks, method: str, url: str, body, response, latency: float, error=None):
+        """emit `POST_RESPONSE` event. Successful responses are decoded to measure the decode time, the decoded
+        payload is cached on the response and reused by the caller
+
+        :param hooks: hooks of the connection
+        :type hooks: Hooks
+        :param response: api response or None if the request failed
+        :type response: requests.Response, optional
+        :param latency: time in seconds until the response has been received
+        :type latency: float
+        :param error: error raised by the request
+        :type error: Exception, optional
+        """
+        decode_time = 0.0
+        if response is not None and response.status_code < 400 and response.content:
+            start = time.perf_counter()
+            try:
+                utils.response_json(response, self.codec)
+            except ValueError:
+                pass
+            decode_time = time.perf_counter() - start
+        hooks.emit(
+            POST_RESPONSE,
+            {
                 'method': method.upper(),
                 'url': url,
-                'params': urlencode(params) if params else '',
-                'data': data if data else '',
-                'status': f'{http_responses[response.status_code]} ({response.status_code})',
-            }
-            if response.status_code >= 400:
-                logger.error('\n%s', json.dumps(msg, indent=4))
-            else:
-                logger.info('\n%s', json.dumps(msg, indent=4))
-                try:
-                    logger.debug('\n"response": %s', json.dumps(response.json(), sort_keys=True, indent=4))
-                except json.JSONDecodeError:
-                    pass
-                except simplejson.errors.JSONDecodeError:
-                    pass
-        return response
+                'status': response.status_code if response is not None else None,
+                'bytes_out': len(body or b''),
+                'bytes_in': len(response.content) if response is not None else 0,
+                'latency': latency,
+                'decode_time': decode_time,
+                'error': error,
+            },
+        )
 
-    def get(self, url: str, params=None, _items=None):
+    def get(self, url: str, params=None, cache_ttl: Optional[float] = None, persist=False):
         """GET operation with pagination support. If multiple requests are required to
-        get all items responses are squashed a single response
+        get all items responses are squashed a single response. In case `paging_workers` is
+        greater than `1` the remaining pages are fetched concurrently after the first response
+        has been received
+
+        Identical GET operations (same url and params) performed concurrently share a single api request and
+        return the same decoded object
 
         :param url: path to resource that will be queried
         :type url: str
         :param params: dict of parameters for http request. Defaults to `None`
         :type params: dict, optional
-        :param _items: list of items if response includes multiple pages. Used internally for recursion
-        :type _items: list, optional
+        :param cache_ttl: time in seconds the response is stored in the response cache. Ignored if the response
+                          cache is disabled. Defaults to `None` (response is not cached)
+        :type cache_ttl: float, optional
+        :param persist: response is reference data that only changes with software or vdb updates and is persisted
+                        in the reference store. Ignored if the reference store is disabled. Defaults to `False`
+        :type persist: bool, optional
         :return: dictionary or list of returned api objects
         :rtype: Union[dict, list]
         """
-        if not utils.is_getbyid_operation(url) and _items is None:
-            if params is None:
-                params = {}
+        with profiling.attach(self), profiling.section(profiling.CLIENT):
+            key = (url, tuple(sorted((k, str(v)) for k, v in (params or {}).items())))
+            response_cache = self.response_cache if cache_ttl else None
+            reference_store = self.reference_store if persist else None
+            if response_cache is None and reference_store is None:
+                return self._get_shared(key, url, params)[0]
+            # responses are stored serialized, so callers can modify returned objects without altering the cache
+            store_key = f'{url}?{urlencode(key[1])}'
+            fingerprint = reference_store.fingerprint(self.version, self.vdb_version) if reference_store else ''
+            if not cache.bypassed():
+                cached = response_cache.get(key) if response_cache is not None else None
+                if cached is None and reference_store is not None:
+                    cached = reference_store.load(store_key, fingerprint)
+                    if cached is not None and response_cache is not None:
+                        response_cache.set(key, cached, cache_ttl)
+                if cached is not None:
+                    with profiling.section(profiling.SERIALIZATION):
+                        return self.codec.loads(cached)
+            payload, shared = self._get_shared(key, url, params)
+            if shared:
+                # response has been stored by the request that performed the api call
+                return payload
+            with profiling.section(profiling.SERIALIZATION):
+                data = self.codec.dumps(payload)
+            if response_cache is not None:
+                response_cache.set(key, data, cache_ttl)
+            if reference_store is not None:
+                reference_store.store(store_key, fingerprint, data)
+            return payload
+
+    def _get_shared(self, key, url: str, params=None):
+        """perform GET operation unless an identical operation is already in progress. In that case the result
+        (or error) of the running operation is returned instead of sending another request
+
+        :param key: key identifying url and params of the operation
+        :type key: tuple
+        :param url: path to resource that will be queried
+        :type url: str
+        :param params: dict of parameters for http request
+        :type params: dict, optional
+        :return: dictionary or list of returned api objects and True if the result of another operation is returned
+        :rtype: tuple
+        """
+        with self._inflight_lock:
+            running = self._inflight.get(key)
+            if running is None:
+                future: Future = Future()
+                self._inflight[key] = future
+        if running is not None:
+            return running.result(), True
+        try:
+            future.set_result(self._get(url, params))
+        except BaseException as error:
+            future.set_exception(error)
+        finally:
+            with self._inflight_lock:
+                if self._inflight.get(key) is future:
+                    del self._inflight[key]
+        return future.result(), False
+
+    def _get(self, url: str, params=None):
+        """GET operation with pagination support, see `get`"""
+        pages = self._iter_pages(url, params)
+        payload = next(pages)
+        if 'paging' not in payload:
+            return payload
+
+        items = list(payload.get('items', []))
+        for page in pages:
+            items.extend(page.get('items', []))
+        return items
+
+    def iter_get(self, url: str, params=None):
+        """GET operation that yields items page by page instead of squashing all pages into
+        a single response. Only one page (or `paging_workers` pages) is kept in memory at a time
+
+        :param url: path to resource that will be queried
+        :type url: str
+        :param params: dict of parameters for http request. Defaults to `None`
+        :type params: dict, optional
+        :return: generator of returned api objects
+        :rtype: Iterator[dict]
+        """
+        for payload in self._iter_pages(url, params):
+            if 'paging' in payload:
+                yield from payload.get('items', [])
+            else:
+                yield payload
+
+    def _iter_pages(self, url: str, params=None):
+        """yield the decoded payload of each page of a GET operation. Pages are either retrieved by
+        following `paging.next` links or, if `paging_workers` is greater than `1`, by requesting the
+        remaining offsets concurrently. Pages are always yielded in api order
+
+        :param url: path to resource that will be queried
+        :type url: str
+        :param params: dict of parameters for http request. Defaults to `None`
+        :type params: dict, optional
+        :return: generator of page payloads
+        :rtype: Iterator[dict]
+        """
+        if not utils.is_getbyid_operation(url):
+            params = {} if params is None else params
             if 'limit' not in params:
                 params['limit'] = defaults.API_PAGING_LIMIT
             if 'expanded' not in params:
                 params['expanded'] = defaults.API_EXPANSION_MODE
 
-        response = self._request('get', url, params=params)
-        payload = response.json()
+        payload = utils.response_json(self._request('get', url, params=params), self.codec)
+        yield payload
+
+        paging = payload.get('paging', {})
+        if 'items' not in payload or 'next' not in paging:
+            return
+
+        if self.paging_workers > 1 and 'count' in paging:
+            yield from self._iter_remaining_pages(url, params, paging)
+            return
+
+        while 'items' in payload and 'next' in payload.get('paging', {}):
+            payload = utils.response_json(self._request('get', payload['paging']['next'][0]), self.codec)
+            yield payload
+
+    def _iter_remaining_pages(self, url: str, params: Dict, paging: Dict):
+        """fetch all pages following the first page of a paginated GET operation concurrently.
+        offsets are calculated using `count` and `limit` of the first response. At most `paging_workers`
+        pages are requested ahead of the consumer and pages are yielded in api order
+
+        :param url: path to resource that will be queried
+        :type url: str
+        :param params: dict of parameters used for the initial request
+        :type params: dict
+        :param paging: paging information of the first response
+        :type paging: dict
+        :return: generator of page payloads
+        :rtype: Iterator[dict]
+        """
+        limit = paging['limit']
+        offsets = iter(range(paging.get('offset', 0) + limit, paging['count'], limit))
+
+        def get_page(offset):
+            response = self._request('get', url, params={**params, 'offset': offset, 'limit': limit})
+            return utils.response_json(response, self.codec)
 
-        if 'paging' in payload:
-            if _items is None:
-                _items = []
-            if 'items' in payload:
-                _items.extend(payload['items'])
-                if 'next' in payload['paging']:
-                    _items = self.get(payload['paging']['next'][0], params=None, _items=_items)
-            return _items
-        return payload
+        # pages are requested within the context of the caller, e.g. to attribute requests to the resource operation
+        context = contextvars.copy_context()
+
+        with ThreadPoolExecutor(max_workers=self.paging_workers) as executor:
+            pending = deque(
+                executor.submit(context.copy().run, get_page, offset) for offset in islice(offsets, self.paging_workers)
+            )
+            try:
+                while pending:
+                    with profiling.section(profiling.WORKERS):
+                        payload = pending.popleft().result()
+                    for offset in islice(offsets, 1):
+                        pending.append(executor.submit(context.copy().run, get_page, offset))
+                    yield payload
+            finally:
+                for future in pending:
+                    future.cancel()
 
     def delete(self, url: str, params=None):
         """DELETE specified api resource
@@ -205,9 +564,20 @@ class Connection:
         :return: api response
         :rtype: requests.Response
         """
-        return self._request('delete', url, params=params)
+        try:
+            return self._request('delete', url, params=params)
+        finally:
+            self.invalidate(url)
 
-    def post(self, url: str, data: Dict, params=None, ignore_fields=None):
+    def post(
+        self,
+        url: str,
+        data: Dict,
+        params=None,
+        ignore_fields=None,
+        bulk_items_max=defaults.API_BULK_ITEMS_MAX,
+        body: Optional[bytes] = None,
+    ):
         """POST operation that is mostly used to create new resources or trigger tasks
 
         :param url: path to resource on which POST operation will be performed
@@ -218,12 +588,30 @@ class Connection:
         :type params: dict, optional
         :param ignore_fields: list of fields that should be stripped from payload before performing operation
         :type ignore_fields: list, optional
+        :param bulk_items_max: max. number of items per request for bulk payloads. Defaults to `1000`
+        :type bulk_items_max: int, optional
+        :param body: serialized request body of a sanitized payload. If provided, `data` is neither sanitized nor
+                     serialized again and is sent in a single request
+        :type body: bytes, optional
         :return: requests.response object
         """
-        data = utils.sanitize_payload('post', data, ignore_fields)
-        return self._request('post', url, params=params, data=data)
-
-    def put(self, url: str, data: Dict, params=None, ignore_fields=None):
+        if body is None:
+            with profiling.section(profiling.PAYLOAD):
+                data = utils.sanitize_payload('post', data, ignore_fields)
+        try:
+            return self._send('post', url, data, params, bulk_items_max, body)
+        finally:
+            self.invalidate(url)
+
+    def put(
+        self,
+        url: str,
+        data: Dict,
+        params=None,
+        ignore_fields=None,
+        bulk_items_max=defaults.API_BULK_ITEMS_MAX,
+        body: Optional[bytes] = None,
+    ):
         """PUT operation that updates existing resources according to the payload provided
 
         :param url: path to resource on which POST operation will be performed
@@ -234,11 +622,96 @@ class Connection:
         :type params: dict, optional
         :param ignore_fields: list of fields that should be stripped from payload before performing operation
         :type ignore_fields: list, optional
+        :param bulk_items_max: max. number of items per request for bulk payloads. Defaults to `1000`
+        :type bulk_items_max: int, optional
+        :param body: serialized request body of a sanitized payload. If provided, `data` is neither sanitized nor
+                     serialized again and is sent in a single request
+        :type body: bytes, optional
+        :return: api response
+        :rtype: requests.Response
+        """
+        if body is None:
+            with profiling.section(profiling.PAYLOAD):
+                data = utils.sanitize_payload('put', data, ignore_fields)
+        try:
+            return self._send('put', url, data, params, bulk_items_max, body)
+        finally:
+            self.invalidate(url)
+
+    def _send(self, method: str, url: str, data, params, bulk_items_max: int, body: Optional[bytes] = None):
+        """send api payload. Bulk payloads that exceed the max. number of items or the max. payload size are split
+        into multiple requests that are sent sequentially. Their responses are aggregated into a `BulkResponse`.
+        Payloads that have already been serialized (`body`) are sent as is
+
+        If a request of a split payload fails, sending stops and the error is raised with two additional attributes:
+        `bulk_response` contains the responses of all previous requests (None if the first request failed) and
+        `pending_items` the items of the failed request and all requests that have not been sent
+
         :return: api response
         :rtype: requests.Response
         """
-        data = utils.sanitize_payload('put', data, ignore_fields)
-        return self._request('put', url, data=data, params=params)
+        if body is not None:
+            return self._request(method, url, params=params, data=data, body=body)
+        if not isinstance(data, list):
+            return self._request(method, url, params=params, data=data)
+        with profiling.section(profiling.PAYLOAD):
+            chunks = list(utils.chunk_payload(data, self.codec, bulk_items_max))
+        if len(chunks) < 2:
+            return self._request(method, url, params=params, data=data, body=chunks[0][1] if chunks else None)
+        responses = []
+        for i, (items, body) in enumerate(chunks):
+            try:
+                responses.append(self._request(method, url, params=params, data=items, body=body))
+            except Exception as error:
+                # report objects created or updated by previous requests, they are not rolled back by fmc
+                partial = BulkResponse(responses, self.codec) if responses else None
+                error.bulk_response = partial  # type: ignore[attr-defined]
+                error.pending_items = [item for chunk, _ in chunks[i:] for item in chunk]  # type: ignore[attr-defined]
+                raise
+        if responses[0] is None:
+            # dry_run
+            return None
+        return BulkResponse(responses, self.codec)
+
+    def profile(self):
+        """Profile all api operations performed within the context. Wall time is split into network wait, rate
+        limiting, retry backoff, (de)serialization, payload preparation, logging, decorator overhead and remaining
+        client time per resource operation (e.g. `Network.get`) and user code. The profile covers all operations of
+        this connection, including operations performed by other threads. Only one profile can be active at a time
+
+        Example: `with fmc.conn.profile() as profile: ...; print(profile.report())`
+
+        :return: context manager that yields a `profiling.Profile`
+        """
+        return profiling.profile(self)
+
+    def invalidate(self, url: str):
+        """remove cached name to uuid mappings and cached responses affected by a change of the api resource at
+        `url`. This includes the resource itself, the collection it belongs to and all resources nested below it.
+        Identical GET operations in progress are no longer shared with subsequent operations
+
+        :param url: url of a collection or resource
+        :type url: str
+        """
+        self.invalidate_names(url)
+        affected = _affected_by(url)
+        with self._inflight_lock:
+            # GET operations in progress may return outdated data, subsequent operations send a new request
+            for key in [key for key in self._inflight if affected(key[0])]:
+                del self._inflight[key]
+        if self.response_cache is not None:
+            self.response_cache.invalidate(lambda key: affected(key[0]))
+
+    def invalidate_names(self, url: str):
+        """remove cached name to uuid mappings affected by a change of the api resource at `url`. This includes
+        the collection the resource belongs to and all collections nested below the resource
+
+        :param url: url of a collection or resource
+        :type url: str
+        """
+        if self.name_cache is None:
+            return
+        self.name_cache.invalidate(_affected_by(url))
 
     def login(self):
         """Basic authentication to firepower management center rest api
@@ -246,50 +719,151 @@ class Connection:
         the `Connection` object. Subsequent api calls will be performed using the access token
 
         """
-        logger.info('Attempting authentication with Firepower Management Center (%s)', self.hostname)
-        if self.cdo:
-            self.headers['Authorization'] = f'Bearer {self.cred}'
-        else:
-            url = f'{self.protocol}://{self.hostname}{defaults.API_AUTH_URL}'
-            response = self._request('post', url, auth=self.cred)
-            self.headers['X-auth-access-token'] = response.headers['X-auth-access-token']
-            self.headers['X-auth-refresh-token'] = response.headers['X-auth-refresh-token']
-            self.domains = json.loads(response.headers['DOMAINS'])
-        self.refresh_counter = defaults.API_REFRESH_COUNTER_INIT
-
-    def refresh(self):
+        with self._auth_lock:
+            logger.info('Attempting authentication with Firepower Management Center (%s)', self.hostname)
+            if self.cdo:
+                self.headers = {**self.headers, 'Authorization': f'Bearer {self.cred}'}
+            else:
+                url = f'{self.protocol}://{self.hostname}{defaults.API_AUTH_URL}'
+                response = self._request('post', url, auth=self.cred)
+                self._update_tokens(response)
+                self.domains = json.loads(response.headers['DOMAINS'])
+            self.refresh_counter = defaults.API_REFRESH_COUNTER_INIT
+            self._save_session()
+
+    def refresh(self, expired_token: Optional[str] = None):
         """Refresh authorization token. This operation is performed for up to three
         times, afterwards a re-authentication using `self.login()` will be performed
         Note: CDO does not require token refresh
 
+        Only one refresh is performed at a time. If `expired_token` is provided and the access token has
+        already been replaced by another thread no refresh is performed
+
+        :param expired_token: access token that has been rejected by the api
+        :type expired_token: str, optional
         """
         if self.cdo:
             return
-        if self.refresh_counter < defaults.API_REFRESH_COUNTER_MAX:
-            logger.info('Access token is invalid. Refreshing authentication token')
-            self.refresh_counter += 1
-            url = f'{self.protocol}://{self.hostname}{defaults.API_REFRESH_URL}'
-            try:
-                response = self._request('post', url)
-                self.headers['X-auth-access-token'] = response.headers['X-auth-access-token']
-                self.headers['X-auth-refresh-token'] = response.headers['X-auth-refresh-token']
-            except exc.GenericApiError:
-                logger.error('Failed to refresh authentication token. Trying to re-authenticate.')
+        with self._auth_lock:
+            if expired_token is not None and self.headers.get('X-auth-access-token') != expired_token:
+                logger.debug('Access token has already been refreshed by another request')
+                return
+            session = self._restore_session() if expired_token is not None else None
+            if session is not None and session['access_token'] != expired_token:
+                logger.debug('Access token has already been refreshed by another process')
+                return
+            if self.refresh_counter < defaults.API_REFRESH_COUNTER_MAX:
+                logger.info('Access token is invalid. Refreshing authentication token')
+                self.refresh_counter += 1
+                url = f'{self.protocol}://{self.hostname}{defaults.API_REFRESH_URL}'
+                try:
+                    response = self._request('post', url)
+                    self._update_tokens(response)
+                    self._save_session()
+                    login = False
+                except exc.GenericApiError:
+                    logger.error('Failed to refresh authentication token. Trying to re-authenticate.')
+                    self.login()
+                    login = True
+            else:
+                logger.info('Maximum number of authentication refresh operations reached (%s)', self.hostname)
                 self.login()
-        else:
-            logger.info('Maximum number of authentication refresh operations reached', self.hostname)
-            self.login()
+                login = True
+            self.hooks.emit(
+                REFRESH, {'hostname': self.hostname, 'refresh_counter': self.refresh_counter, 'login': login}
+            )
+
+    def _restore_session(self):
+        """restore tokens and domains from token cache
+
+        :return: cached session or None if token cache is disabled or no session is cached
+        :rtype: dict, optional
+        """
+        if self.token_cache is None:
+            return None
+        session = self.token_cache.load(self._session_key())
+        if session is None:
+            return None
+        logger.info('Using cached authentication token for Firepower Management Center (%s)', self.hostname)
+        self.headers = {
+            **self.headers,
+            'X-auth-access-token': session['access_token'],
+            'X-auth-refresh-token': session['refresh_token'],
+        }
+        self.domains = session['domains']
+        self.refresh_counter = session['refresh_counter']
+        return session
+
+    def _save_session(self):
+        """persist tokens, domains and server version in token cache"""
+        if self.token_cache is None or 'X-auth-access-token' not in self.headers:
+            return
+        self.token_cache.store(
+            self._session_key(),
+            {
+                'access_token': self.headers['X-auth-access-token'],
+                'refresh_token': self.headers['X-auth-refresh-token'],
+                'domains': self.domains,
+                'refresh_counter': self.refresh_counter,
+                'version': str(self.version) if self.version else None,
+                'vdb_version': self.vdb_version,
+                'version_checked': self._version_checked,
+            },
+        )
+
+    def _session_key(self):
+        """key of this connection within the token cache"""
+        return TokenCache.key(self.protocol, self.hostname, getattr(self.cred, 'username', ''))
+
+    def _update_tokens(self, response):
+        """replace access and refresh token using the headers of an authentication response. headers are
+        replaced instead of modified so concurrent requests always send a consistent set of tokens
+
+        :param response: api response of an authentication or refresh request
+        :type response: requests.Response
+        """
+        self.headers = {
+            **self.headers,
+            'X-auth-access-token': response.headers['X-auth-access-token'],
+            'X-auth-refresh-token': response.headers['X-auth-refresh-token'],
+        }
+
+    def pool_stats(self):
+        """Get statistics of the http connection pools used by this connection
+
+        :return: list of connection pool statistics (host, connections opened, requests sent, idle connections)
+        :rtype: list
+        """
+        stats = []
+        pools = self.adapter.poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            stats.append(
+                {
+                    'scheme': pool.scheme,
+                    'host': pool.host,
+                    'port': pool.port,
+                    'maxsize': pool.pool.maxsize if pool.pool else 0,
+                    'num_connections': pool.num_connections,
+                    'num_requests': pool.num_requests,
+                    'idle_connections': sum(1 for c in pool.pool.queue if c is not None) if pool.pool else 0,
+                }
+            )
+        return stats
 
     def get_version(self):
-        """Get version of fmc
+        """Get version of fmc. The vdb version reported by fmc is stored in `vdb_version`
 
         :return: server version of firepower management center
         :rtype: version.Version
         """
         url = f'{self.protocol}://{self.hostname}{defaults.API_PLATFORM_URL}/info/serverversion'
-        payload = self._request('get', url).json()
+        payload = utils.response_json(self._request('get', url), self.codec)
 
         if 'items' in payload:
+            self.vdb_version = payload['items'][0].get('vdbVersion')
             return version.parse(payload['items'][0]['serverVersion'].split(' ')[0])
 
         msg = 'Could not determine server version'
@@ -329,6 +903,245 @@ class Connection:
         msg = f'Could not find domain with uuid {uuid}. Available Domains: {uuids}'
         raise exc.DomainNotFoundError(msg=msg)
 
+    @property
+    def domain(self):
+        """domain (`id` and `name`) used for api calls"""
+        return self._domain
+
+    @domain.setter
+    def domain(self, value: Optional[Dict]):
+        self._domain = value
+        self._base_urls = None
+
+    @property
+    def base_urls(self):
+        """base url of each api namespace. The urls are generated once and regenerated if the domain is changed
+
+        :return: mapping of namespace to base url
+        :rtype: dict
+        """
+        if self._base_urls is None:
+            host = f'{self.protocol}://{self.hostname}'
+            domain = self.domain['id'] if self.domain else None
+            self._base_urls = {
+                'base': host,
+                'config': f'{host}{defaults.API_CONFIG_URL}/domain/{domain}',
+                'netmap': f'{host}{defaults.API_NETMAP_URL}/domain/{domain}',
+                'platform': f'{host}{defaults.API_PLATFORM_URL}',
+                'platform_with_domain': f'{host}{defaults.API_PLATFORM_URL}/domain/{domain}',
+                'tid': f'{host}{defaults.API_TID_URL}',
+                'refresh': f'{host}{defaults.API_REFRESH_URL}',
+                'troubleshoot': f'{host}{defaults.API_TROUBLESHOOT_URL}/domain/{domain}',
+            }
+        return self._base_urls
+
+
+class LazyResource(Generic[T]):
+    """Descriptor for sub-resources of api namespaces and resources. The module of the sub-resource is imported
+    and the sub-resource is instantiated on first access using the `conn` of the owning object. The instance is
+    cached on the owning object afterwards, so neither `import fireREST` nor creating an `FMC` object builds the
+    complete resource tree. Declare the attribute as `LazyResource['Cls']` to let static type checkers and
+    autocompletion resolve it to an instance of the wrapped class
+    """
+
+    def __init__(self, module: str, name: str):
+        """Initialize lazy resource
+
+        :param module: module containing the resource or namespace class. Relative paths are resolved against
+                       the module of the owning class
+        :type module: str
+        :param name: name of the resource or namespace class that will be instantiated on first access
+        :type name: str
+        """
+        self.module = module
+        self.name = name
+        self.package: Optional[str] = None
+        self.attr = ''
+        self._cls: Optional[Type[T]] = None
+
+    def __set_name__(self, owner, name: str):
+        self.package = owner.__module__
+        self.attr = name
+
+    def resolve(self) -> Type[T]:
+        """import module and return the wrapped class
+
+        :return: resource or namespace class
+        :rtype: type
+        """
+        if self._cls is None:
+            self._cls = getattr(importlib.import_module(self.module, self.package), self.name)
+        return self._cls
+
+    @overload
+    def __get__(self, instance: None, owner=None) -> 'LazyResource[T]': ...
+
+    @overload
+    def __get__(self, instance: object, owner=None) -> T: ...
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        # the instance attribute shadows this (non-data) descriptor, so the resource is only created once.
+        # setdefault ensures concurrent first accesses end up with the same object
+        return instance.__dict__.setdefault(self.attr, self.resolve()(instance.conn))
+
+
+def lazy_getattr(module: str, name: str):
+    """resolve classes of sub-resources declared as `LazyResource` within a module. Used as module `__getattr__`
+    (PEP 562) by api packages, so sub-resource classes can still be imported from their parent package without
+    importing all sub-resources when the package is loaded
+
+    :param module: name of the module
+    :type module: str
+    :param name: name of the requested attribute
+    :type name: str
+    :return: sub-resource class
+    :rtype: type
+    """
+    for obj in list(vars(sys.modules[module]).values()):
+        if isinstance(obj, type) and obj.__module__ == module:
+            for attr in vars(obj).values():
+                if isinstance(attr, LazyResource) and attr.name == name:
+                    return attr.resolve()
+    raise AttributeError(f'module {module!r} has no attribute {name!r}')
+
+
+def _affected_by(url: str):
+    """get predicate that matches urls of cached data affected by a change of the api resource at `url`
+
+    :param url: url of a collection or resource
+    :type url: str
+    :return: callable that returns True for urls of the resource, its collection and resources nested below it
+    :rtype: Callable[[str], bool]
+    """
+    url = url.split('?')[0].rstrip('/')
+    collection = url.rsplit('/', 1)[0]
+    return lambda key: key.split('?')[0].rstrip('/') in (url, collection) or key.startswith(f'{url}/')
+
+
+def capability_map(owner: type, installed_version, prefix=''):
+    """list operations supported by `installed_version` for all api resources below `owner`. All resource modules
+    below `owner` are imported
+
+    :param owner: class of the api namespace or resource
+    :type owner: type
+    :param installed_version: fmc software version
+    :type installed_version: packaging.version.Version
+    :param prefix: path of `owner` within the resource tree
+    :type prefix: str, optional
+    :return: mapping of resource path (e.g. `object.network`) to supported operations
+    :rtype: Dict[str, Dict[str, bool]]
+    """
+    capabilities = {}
+    for name, attr in vars(owner).items():
+        if isinstance(attr, LazyResource):
+            cls = attr.resolve()
+            path = f'{prefix}{name}'
+            if issubclass(cls, Resource):
+                capabilities[path] = cls.capabilities(installed_version)
+            capabilities.update(capability_map(cls, installed_version, f'{path}.'))
+    return capabilities
+
+
+class NameResolution(dict):
+    """Result of a batch name lookup. Maps every name that matched exactly one item to its uuid (or reference).
+    Names without a match are listed in `missing`, names that matched multiple items are listed in `ambiguous`
+    together with all candidates
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.missing: List[str] = []
+        self.ambiguous: Dict[str, List[Dict]] = {}
+
+    @classmethod
+    def build(cls, names: Iterable[str], candidates: Dict[str, List[Dict]], value: Callable[[Dict], Any]):
+        """create name resolution from candidates found for each name
+
+        :param names: names that were looked up
+        :type names: Iterable[str]
+        :param candidates: items found for each name
+        :type candidates: dict
+        :param value: callable that converts a matching item to the value stored for its name
+        :type value: Callable
+        :return: name resolution
+        :rtype: NameResolution
+        """
+        result = cls()
+        for name in dict.fromkeys(names):
+            matches = candidates.get(name, [])
+            if not matches:
+                result.missing.append(name)
+            elif len(matches) > 1:
+                result.ambiguous[name] = matches
+            else:
+                result[name] = value(matches[0])
+        return result
+
+
+def resolve_names(resources: List['Resource'], names: Iterable[str]):
+    """Resolve names of objects of different types to references (`id`, `name` and `type`), e.g. network objects
+    referenced by access rules. Each resource is listed once, regardless of the number of names
+
+    Example: `resolve_names([fmc.object.host, fmc.object.network], ['srv-01', 'net-dmz'])`
+
+    :param resources: resources that are searched for the names
+    :type resources: list
+    :param names: names that will be resolved
+    :type names: Iterable[str]
+    :return: mapping of name to reference. Names that match objects of multiple types are reported as ambiguous
+    :rtype: NameResolution
+    """
+    names = list(names)
+    candidates: Dict[str, List[Dict]] = {}
+    seen = set()
+    for resource in resources:
+        url = resource.url(resource.PATH.format(uuid=None))
+        for name, items in resource.find_names(url, names).items():
+            for item in items:
+                if item['id'] not in seen:
+                    seen.add(item['id'])
+                    candidates.setdefault(name, []).append(item)
+    return NameResolution.build(
+        names, candidates, lambda item: {'id': item['id'], 'name': item['name'], 'type': item.get('type')}
+    )
+
+
+class BulkResponse(requests.Response):
+    """Aggregated response of a bulk operation that has been split into multiple requests. The response body
+    contains the items of all responses, the individual responses are available in `responses`
+    """
+
+    def __init__(self, responses: List[requests.Response], codec: JsonCodec):
+        """Initialize bulk response
+
+        :param responses: responses of the individual requests
+        :type responses: List[requests.Response]
+        :param codec: json codec used to decode the individual responses and encode the aggregated body
+        :type codec: JsonCodec
+        """
+        super().__init__()
+        last = responses[-1]
+        self.responses = responses
+        self.status_code = last.status_code
+        self.headers = last.headers
+        self.url = last.url
+        self.reason = last.reason
+        self.request = last.request
+        self.encoding = 'utf-8'
+        self.elapsed = sum((response.elapsed for response in responses), self.elapsed)
+        items = []
+        for response in responses:
+            try:
+                items.extend(utils.response_json(response, codec).get('items', []))
+            except ValueError:
+                pass
+        payload = {'items': items}
+        self.__dict__['_decoded_json'] = payload
+        self._content = codec.dumps(payload)
+        self._content_consumed = True
+
 
 class Resource:
     """Base class for api resources. `Resource` can be used for all api resources
@@ -349,6 +1162,14 @@ class Resource:
     IGNORE_FOR_CREATE: list[str] = []
     # ignore fields for put operations
     IGNORE_FOR_UPDATE: list[str] = []
+    # max. number of items per request for bulk create and update operations
+    BULK_ITEMS_MAX = defaults.API_BULK_ITEMS_MAX
+    # operations that accept multiple items per request. options: create, update, delete
+    BULK_OPERATIONS: list[str] = []
+    # time in seconds get() responses are kept in the response cache of the connection. None disables caching
+    CACHE_TTL: Optional[float] = None
+    # get() responses only change with software or vdb updates and are persisted in the reference store
+    REFERENCE_DATA = False
     # minimum version required for create()
     MINIMUM_VERSION_REQUIRED_CREATE = '99.99.99'
     # minimum version required for get()
@@ -370,6 +1191,30 @@ class Resource:
         self.conn = conn
         self.version = conn.version
 
+    @classmethod
+    def capabilities(cls, installed_version):
+        """list crud operations of the resource supported by an fmc version
+
+        :param installed_version: fmc software version
+        :type installed_version: packaging.version.Version
+        :return: mapping of operation (create, get, update, delete) to True if supported
+        :rtype: Dict[str, bool]
+        """
+        return {
+            operation: installed_version >= utils.minimum_version(cls, operation)
+            for operation in ('create', 'get', 'update', 'delete')
+        }
+
+    def supports(self, operation: str):
+        """verify if an operation is supported by the fmc version of the connection without performing it
+
+        :param operation: name of the operation, e.g. `create`, `get`, `update`, `delete`, `bulk_create`
+        :type operation: str
+        :return: True if the operation is supported
+        :rtype: bool
+        """
+        return self.version >= utils.minimum_version(self, operation)
+
     def url(self, path, namespace=None):
         """Generate url for requests to fmc rest api
 
@@ -380,25 +1225,13 @@ class Resource:
         :return: formatted url used for api call
         :rtype: str
         """
-        if not namespace:
-            namespace = self.NAMESPACE
-        options = {
-            'base': f'{self.conn.protocol}://{self.conn.hostname}{path}',
-            'config': f'{self.conn.protocol}://{self.conn.hostname}{defaults.API_CONFIG_URL}/domain/'
-            f'{self.conn.domain["id"]}{path}',
-            'netmap': f'{self.conn.protocol}://{self.conn.hostname}{defaults.API_NETMAP_URL}/domain/'
-            f'{self.conn.domain["id"]}{path}',
-            'platform': f'{self.conn.protocol}://{self.conn.hostname}{defaults.API_PLATFORM_URL}{path}',
-            'platform_with_domain': f'{self.conn.protocol}://{self.conn.hostname}{defaults.API_PLATFORM_URL}/domain/'
-            f'{self.conn.domain["id"]}{path}',
-            'tid': f'{self.conn.protocol}://{self.conn.hostname}{defaults.API_TID_URL}{path}',
-            'refresh': f'{self.conn.protocol}://{self.conn.hostname}{defaults.API_REFRESH_URL}',
-            'troubleshoot': f'{self.conn.protocol}://{self.conn.hostname}{defaults.API_TROUBLESHOOT_URL}/domain/'
-            f'{self.conn.domain["id"]}{path}',
-        }
-        if namespace not in options.keys():
-            raise exc.InvalidNamespaceError(f'Invalid namespace "{namespace}" provided. Options: {options.keys()}')
-        return utils.fix_url(options[namespace])
+        base_urls = self.conn.base_urls
+        namespace = namespace or self.NAMESPACE
+        if namespace not in base_urls:
+            raise exc.InvalidNamespaceError(f'Invalid namespace "{namespace}" provided. Options: {base_urls.keys()}')
+        if namespace == 'refresh':
+            return base_urls[namespace]
+        return utils.fix_url(base_urls[namespace] + path)
 
     @utils.minimum_version_required
     def create(self, data: Union[dict, list], params=None):
@@ -411,7 +1244,7 @@ class Resource:
         :rtype: requests.Response
         """
         url = self.url(self.PATH.format(uuid=None))
-        return self.conn.post(url, data, params, self.IGNORE_FOR_CREATE)
+        return self.conn.post(url, data, params, self.IGNORE_FOR_CREATE, self.BULK_ITEMS_MAX)
 
     @utils.resolve_by_name
     @utils.minimum_version_required
@@ -429,7 +1262,27 @@ class Resource:
         :rtype: Union[dict, list]
         """
         url = self.url(self.PATH.format(uuid=uuid))
-        return self.conn.get(url, params)
+        return self.conn.get(url, params, self.CACHE_TTL, self.REFERENCE_DATA)
+
+    @utils.support_params
+    @utils.resolve_by_name
+    @utils.minimum_version_required
+    def iter(self, uuid=None, name=None, params=None, **kwargs):
+        """Iterate over api resource in json format. Works like `get` but yields items page by page
+        instead of returning a list of all available resources. Filter and param arguments supported
+        by the `Resource` can be passed as keyword arguments
+
+        :param uuid: id of resource
+        :type uuid: str, optional
+        :param name: name of resource
+        :type name: str, optional
+        :param params: dict of parameters for http request
+        :type params: dict, optional
+        :return: generator of api objects
+        :rtype: Iterator[dict]
+        """
+        url = self.url(self.PATH.format(uuid=uuid))
+        return self.conn.iter_get(url, params)
 
     @utils.minimum_version_required
     def update(self, data: Dict, params=None):
@@ -445,7 +1298,7 @@ class Resource:
         :rtype: requests.Response
         """
         url = self.url(self.PATH.format(uuid=data['id']))
-        return self.conn.put(url, data, params, self.IGNORE_FOR_UPDATE)
+        return self.conn.put(url, data, params, self.IGNORE_FOR_UPDATE, self.BULK_ITEMS_MAX)
 
     @utils.resolve_by_name
     @utils.minimum_version_required
@@ -465,6 +1318,152 @@ class Resource:
         url = self.url(self.PATH.format(uuid=uuid))
         return self.conn.delete(url, params)
 
+    @utils.minimum_version_required
+    def resolve_names(self, names: Iterable[str]):
+        """Resolve multiple names to uuids using a single list operation instead of one lookup per name
+
+        :param names: names of resources
+        :type names: Iterable[str]
+        :return: mapping of name to uuid, names that cannot be resolved are listed in `missing` and `ambiguous`
+        :rtype: NameResolution
+        """
+        names = list(names)
+        url = self.url(self.PATH.format(uuid=None))
+        return NameResolution.build(names, self.find_names(url, names), lambda item: item['id'])
+
+    def find_names(self, url: str, names: Iterable[str]):
+        """List collection once and collect all items matching one of the names. Only uuid, name and type of
+        items are requested. The name to uuid mappings of the collection are stored in `Connection.name_cache`
+
+        :param url: url of the collection
+        :type url: str
+        :param names: names of resources
+        :type names: Iterable[str]
+        :return: matching items for each name that has been found
+        :rtype: dict
+        """
+        names = set(names)
+        index: Dict[str, str] = {}
+        candidates: Dict[str, List[Dict]] = {}
+        for item in self.conn.iter_get(url, {'expanded': False}):
+            if 'name' not in item or 'id' not in item:
+                continue
+            index.setdefault(item['name'], item['id'])
+            if item['name'] in names:
+                candidates.setdefault(item['name'], []).append(item)
+        if self.conn.name_cache is not None:
+            self.conn.name_cache.set(url, index)
+        return candidates
+
+    @utils.minimum_version_required
+    def bulk_create(self, items: Iterable[Dict], params=None, max_workers=defaults.API_BULK_WORKERS):
+        """Create many api resources. Items are sent in chunks that comply with the bulk limits of the resource using
+        up to `max_workers` concurrent requests. Chunks rejected by fmc are split to isolate the items that caused the
+        error, all other items are created. Resources that do not support bulk create are created one by one
+
+        :param items: data of the resources that will be created
+        :type items: Iterable[dict]
+        :param params: dict of parameters for http request
+        :type params: dict, optional
+        :param max_workers: max. number of concurrent requests. Defaults to `4`
+        :type max_workers: int, optional
+        :return: result mapping each item to the created api object or the error that occurred
+        :rtype: BulkResult
+        """
+        return self._bulk('create', items, lambda uuid=None: self.url(self.PATH.format(uuid=uuid)), params, max_workers)
+
+    @utils.minimum_version_required
+    def bulk_update(self, items: Iterable[Dict], params=None, max_workers=defaults.API_BULK_WORKERS):
+        """Update many existing api resources. See `bulk_create`. Resources that do not support bulk update are
+        updated one by one
+
+        :param items: data of the resources that will be updated. Each item must contain the `id` of the resource
+        :type items: Iterable[dict]
+        :param params: dict of parameters for http request
+        :type params: dict, optional
+        :param max_workers: max. number of concurrent requests. Defaults to `4`
+        :type max_workers: int, optional
+        :return: result mapping each item to the updated api object or the error that occurred
+        :rtype: BulkResult
+        """
+        return self._bulk('update', items, lambda uuid=None: self.url(self.PATH.format(uuid=uuid)), params, max_workers)
+
+    @utils.minimum_version_required
+    def bulk_delete(self, items: Iterable[Union[str, Dict]], params=None, max_workers=defaults.API_BULK_WORKERS):
+        """Delete many existing api resources. See `bulk_create`. Resources that support bulk delete are deleted
+        using the `ids` filter, all other resources are deleted one by one
+
+        :param items: uuids of the resources or api objects containing the `id` of the resource
+        :type items: Iterable[Union[str, dict]]
+        :param params: dict of parameters for http request
+        :type params: dict, optional
+        :param max_workers: max. number of concurrent requests. Defaults to `4`
+        :type max_workers: int, optional
+        :return: result mapping each item to the deleted api object (if returned by fmc) or the error that occurred
+        :rtype: BulkResult
+        """
+        return self._bulk('delete', items, lambda uuid=None: self.url(self.PATH.format(uuid=uuid)), params, max_workers)
+
+    def _bulk(self, operation: str, items: Iterable, url: Callable[..., str], params, max_workers: int):
+        """split items of a bulk operation into chunks and execute them using `bulk.execute`
+
+        :param operation: bulk operation. Options: ['create', 'update', 'delete']
+        :type operation: str
+        :param items: items provided by the caller
+        :type items: Iterable
+        :param url: callable returning the url of the collection or the url of a single resource if a uuid is passed
+        :type url: Callable
+        :return: result of the bulk operation
+        :rtype: BulkResult
+        """
+        items = list(items)
+        supported = operation in self.BULK_OPERATIONS
+        if operation == 'delete':
+            payload = [item['id'] if isinstance(item, dict) else item for item in items]
+            size = min(self.BULK_ITEMS_MAX, defaults.API_BULK_DELETE_ITEMS_MAX) if supported else 1
+            chunks = [list(zip(items[i : i + size], payload[i : i + size])) for i in range(0, len(items), size)]
+        else:
+            if operation == 'create':
+                payload = utils.sanitize_payload('post', items, self.IGNORE_FOR_CREATE)
+            else:
+                payload = utils.sanitize_payload('put', items, self.IGNORE_FOR_UPDATE)
+            # items are sanitized and serialized once. the payload of each item is sent together with its serialized
+            # form, so chunks that are split after a failed request do not need to be serialized again
+            chunks, start = [], 0
+            size = self.BULK_ITEMS_MAX if supported else 1
+            for chunk, encoded in utils.chunk_items(payload, self.conn.codec, size):
+                chunks.append(list(zip(items[start : start + len(chunk)], zip(chunk, encoded))))
+                start += len(chunk)
+
+        def send(chunk: bulk.Chunk):
+            data = [entry for _, entry in chunk]
+            if operation == 'delete' and len(data) == 1:
+                response = self.conn.delete(url(data[0]), params)
+            elif operation == 'delete':
+                response = self.conn.delete(url(), {**(params or {}), 'bulk': True, 'filter': f'ids:{",".join(data)}'})
+            else:
+                objects = [obj for obj, _ in data]
+                body = utils.json_array([encoded for _, encoded in data]) if len(data) > 1 else data[0][1]
+                if operation == 'create':
+                    response = self.conn.post(url(), objects if len(data) > 1 else objects[0], params, body=body)
+                elif len(data) > 1:
+                    response = self.conn.put(url(), objects, params, body=body)
+                else:
+                    response = self.conn.put(url(objects[0]['id']), objects[0], params, body=body)
+            if response is None:
+                # dry_run
+                return []
+            try:
+                payload = utils.response_json(response, self.conn.codec)
+            except ValueError:
+                return []
+            return payload.get('items', []) if len(data) > 1 else [payload]
+
+        def retry(failed: List):
+            return self._bulk(operation, failed, url, params, max_workers)
+
+        return bulk.execute(send, chunks, max_workers, retry)
+
 
 class ChildResource(Resource):
     """Base class for api resources located within a container"""
@@ -475,6 +1474,34 @@ class ChildResource(Resource):
     # path to container class that hosts the ChildResource
     CONTAINER_PATH = '/'
 
+    # resource class of the container, determined on first use by container_resource()
+    _container_resource: Optional[type] = None
+
+    @classmethod
+    def container_resource(cls):
+        """Get resource class of the container. The container is located within the parent packages of the
+        ChildResource by comparing its `PATH` with `CONTAINER_PATH`
+
+        :return: resource class of the container or None if it cannot be determined
+        :rtype: type, optional
+        """
+        if '_container_resource' not in cls.__dict__:
+            cls._container_resource = None
+            container_path = cls.CONTAINER_PATH.format(uuid='')
+            module = cls.__module__
+            while '.' in module and cls._container_resource is None:
+                module = module.rsplit('.', 1)[0]
+                for obj in list(vars(sys.modules[module]).values()):
+                    if (
+                        isinstance(obj, type)
+                        and issubclass(obj, Resource)
+                        and obj.__module__ == module
+                        and obj.PATH.format(container_uuid='', uuid='') == container_path
+                    ):
+                        cls._container_resource = obj
+                        break
+        return cls._container_resource
+
     @utils.resolve_by_name
     @utils.minimum_version_required
     def create(self, data: Union[dict, list], container_uuid=None, container_name=None, params=None):
@@ -493,7 +1520,7 @@ class ChildResource(Resource):
         :rtype: requests.Response
         """
         url = self.url(self.PATH.format(container_uuid=container_uuid, uuid=None))
-        return self.conn.post(url, data, params, self.IGNORE_FOR_CREATE)
+        return self.conn.post(url, data, params, self.IGNORE_FOR_CREATE, self.BULK_ITEMS_MAX)
 
     @utils.resolve_by_name
     @utils.minimum_version_required
@@ -516,7 +1543,31 @@ class ChildResource(Resource):
         :rtype: Union[dict, list]
         """
         url = self.url(self.PATH.format(container_uuid=container_uuid, uuid=uuid))
-        return self.conn.get(url, params)
+        return self.conn.get(url, params, self.CACHE_TTL, self.REFERENCE_DATA)
+
+    @utils.support_params
+    @utils.resolve_by_name
+    @utils.minimum_version_required
+    def iter(self, container_uuid=None, container_name=None, uuid=None, name=None, params=None, **kwargs):
+        """Iterate over api resource in json format. Either name or uuid of container resource must
+        be provided to search for resources within the container scope. Works like `get` but yields
+        items page by page instead of returning a list of all available resources
+
+        :param container_uuid: uuid of container resource
+        :type container_uuid: str, optional
+        :param container_name: name of container resource
+        :type container_name: str, optional
+        :param uuid: id of resource
+        :type uuid: str, optional
+        :param name: name of resource
+        :type name: str, optional
+        :param params: dict of parameters for http request
+        :type params: dict, optional
+        :return: generator of api objects
+        :rtype: Iterator[dict]
+        """
+        url = self.url(self.PATH.format(container_uuid=container_uuid, uuid=uuid))
+        return self.conn.iter_get(url, params)
 
     @utils.resolve_by_name
     @utils.minimum_version_required
@@ -540,7 +1591,7 @@ class ChildResource(Resource):
             url = self.url(self.PATH.format(container_uuid=container_uuid, uuid=None))
         else:
             url = self.url(self.PATH.format(container_uuid=container_uuid, uuid=data['id']))
-        return self.conn.put(url, data, params, self.IGNORE_FOR_UPDATE)
+        return self.conn.put(url, data, params, self.IGNORE_FOR_UPDATE, self.BULK_ITEMS_MAX)
 
     @utils.resolve_by_name
     @utils.minimum_version_required
@@ -562,6 +1613,121 @@ class ChildResource(Resource):
         url = self.url(self.PATH.format(container_uuid=container_uuid, uuid=uuid))
         return self.conn.delete(url)
 
+    @utils.resolve_by_name
+    @utils.minimum_version_required
+    def resolve_names(self, names: Iterable[str], container_uuid=None, container_name=None):
+        """Resolve multiple names to uuids using a single list operation instead of one lookup per name.
+        Either name or uuid of container resource must be provided
+
+        :param names: names of resources
+        :type names: Iterable[str]
+        :param container_uuid: uuid of container resource
+        :type container_uuid: str, optional
+        :param container_name: name of container resource
+        :type container_name: str, optional
+        :return: mapping of name to uuid, names that cannot be resolved are listed in `missing` and `ambiguous`
+        :rtype: NameResolution
+        """
+        names = list(names)
+        url = self.url(self.PATH.format(container_uuid=container_uuid, uuid=None))
+        return NameResolution.build(names, self.find_names(url, names), lambda item: item['id'])
+
+    @utils.resolve_by_name
+    @utils.minimum_version_required
+    def bulk_create(
+        self,
+        items: Iterable[Dict],
+        container_uuid=None,
+        container_name=None,
+        params=None,
+        max_workers=defaults.API_BULK_WORKERS,
+    ):
+        """Create many api resources within a container. Either name or uuid of container resource must be provided.
+        See `Resource.bulk_create`
+
+        :param items: data of the resources that will be created
+        :type items: Iterable[dict]
+        :param container_uuid: uuid of container resource
+        :type container_uuid: str, optional
+        :param container_name: name of container resource
+        :type container_name: str, optional
+        :param params: dict of parameters for http request
+        :type params: dict, optional
+        :param max_workers: max. number of concurrent requests. Defaults to `4`
+        :type max_workers: int, optional
+        :return: result mapping each item to the api object or the error that occurred
+        :rtype: BulkResult
+        """
+
+        def url(uuid=None):
+            return self.url(self.PATH.format(container_uuid=container_uuid, uuid=uuid))
+
+        return self._bulk('create', items, url, params, max_workers)
+
+    @utils.resolve_by_name
+    @utils.minimum_version_required
+    def bulk_update(
+        self,
+        items: Iterable[Dict],
+        container_uuid=None,
+        container_name=None,
+        params=None,
+        max_workers=defaults.API_BULK_WORKERS,
+    ):
+        """Update many api resources within a container. Either name or uuid of container resource must be provided.
+        See `Resource.bulk_update`
+
+        :param items: data of the resources that will be updated. Each item must contain the `id` of the resource
+        :type items: Iterable[dict]
+        :param container_uuid: uuid of container resource
+        :type container_uuid: str, optional
+        :param container_name: name of container resource
+        :type container_name: str, optional
+        :param params: dict of parameters for http request
+        :type params: dict, optional
+        :param max_workers: max. number of concurrent requests. Defaults to `4`
+        :type max_workers: int, optional
+        :return: result mapping each item to the api object or the error that occurred
+        :rtype: BulkResult
+        """
+
+        def url(uuid=None):
+            return self.url(self.PATH.format(container_uuid=container_uuid, uuid=uuid))
+
+        return self._bulk('update', items, url, params, max_workers)
+
+    @utils.resolve_by_name
+    @utils.minimum_version_required
+    def bulk_delete(
+        self,
+        items: Iterable[Union[str, Dict]],
+        container_uuid=None,
+        container_name=None,
+        params=None,
+        max_workers=defaults.API_BULK_WORKERS,
+    ):
+        """Delete many api resources within a container. Either name or uuid of container resource must be provided.
+        See `Resource.bulk_delete`
+
+        :param items: uuids of the resources or api objects containing the `id` of the resource
+        :type items: Iterable[Union[str, dict]]
+        :param container_uuid: uuid of container resource
+        :type container_uuid: str, optional
+        :param container_name: name of container resource
+        :type container_name: str, optional
+        :param params: dict of parameters for http request
+        :type params: dict, optional
+        :param max_workers: max. number of concurrent requests. Defaults to `4`
+        :type max_workers: int, optional
+        :return: result mapping each item to the api object or the error that occurred
+        :rtype: BulkResult
+        """
+
+        def url(uuid=None):
+            return self.url(self.PATH.format(container_uuid=container_uuid, uuid=uuid))
+
+        return self._bulk('delete', items, url, params, max_workers)
+
 
 class NestedChildResource(ChildResource):
     """Base class for api resources located within a ChildResource"""
@@ -604,7 +1770,7 @@ class NestedChildResource(ChildResource):
         url = self.url(
             self.PATH.format(container_uuid=container_uuid, child_container_uuid=child_container_uuid, uuid=None)
         )
-        return self.conn.post(url, data, params, self.IGNORE_FOR_CREATE)
+        return self.conn.post(url, data, params, self.IGNORE_FOR_CREATE, self.BULK_ITEMS_MAX)
 
     @utils.resolve_by_name
     @utils.minimum_version_required
@@ -642,7 +1808,47 @@ class NestedChildResource(ChildResource):
         url = self.url(
             self.PATH.format(container_uuid=container_uuid, child_container_uuid=child_container_uuid, uuid=uuid)
         )
-        return self.conn.get(url, params)
+        return self.conn.get(url, params, self.CACHE_TTL, self.REFERENCE_DATA)
+
+    @utils.support_params
+    @utils.resolve_by_name
+    @utils.minimum_version_required
+    def iter(
+        self,
+        container_uuid=None,
+        container_name=None,
+        child_container_name=None,
+        child_container_uuid=None,
+        uuid=None,
+        name=None,
+        params=None,
+        **kwargs,
+    ):
+        """Iterate over api resource in json format. Either name or uuid of container resource must
+        be provided to search for resources within the container scope. Works like `get` but yields
+        items page by page instead of returning a list of all available resources
+
+        :param container_uuid: uuid of container resource
+        :type container_uuid: str, optional
+        :param container_name: name of container resource
+        :type container_name: str, optional
+        :param child_container_uuid: uuid of child container resource
+        :type child_container_uuid: str, optional
+        :param child_container_name: name of child container resource
+        :type child_container_name: str, optional
+        :param uuid: id of resource
+        :type uuid: str, optional
+        :param name: name of resource
+        :type name: str, optional
+        :param params: dict of parameters for http request
+        :type params: dict, optional
+        :return: generator of api objects
+        :rtype: Iterator[dict]
+        """
+        url = self.url(
+            self.PATH.format(container_uuid=container_uuid, child_container_uuid=child_container_uuid, uuid=uuid)
+        )
+        return self.conn.iter_get(url, params)
 
     @utils.resolve_by_name
     @utils.minimum_version_required
@@ -712,3 +1918,143 @@ class NestedChildResource(ChildResource):
             self.PATH.format(container_uuid=container_uuid, child_container_uuid=child_container_uuid, uuid=uuid)
         )
         return self.conn.delete(url)
+
+    @utils.resolve_by_name
+    @utils.minimum_version_required
+    def resolve_names(
+        self,
+        names: Iterable[str],
+        container_uuid=None,
+        container_name=None,
+        child_container_uuid=None,
+    ):
+        """Resolve multiple names to uuids using a single list operation instead of one lookup per name.
+        Either name or uuid of container resource and the uuid of the child container resource must be provided
+
+        :param names: names of resources
+        :type names: Iterable[str]
+        :param container_uuid: uuid of container resource
+        :type container_uuid: str, optional
+        :param container_name: name of container resource
+        :type container_name: str, optional
+        :param child_container_uuid: uuid of child container resource
+        :type child_container_uuid: str, optional
+        :return: mapping of name to uuid, names that cannot be resolved are listed in `missing` and `ambiguous`
+        :rtype: NameResolution
+        """
+        names = list(names)
+        url = self.url(
+            self.PATH.format(container_uuid=container_uuid, child_container_uuid=child_container_uuid, uuid=None)
+        )
+        return NameResolution.build(names, self.find_names(url, names), lambda item: item['id'])
+
+    @utils.resolve_by_name
+    @utils.minimum_version_required
+    def bulk_create(
+        self,
+        items: Iterable[Dict],
+        container_uuid=None,
+        container_name=None,
+        child_container_uuid=None,
+        params=None,
+        max_workers=defaults.API_BULK_WORKERS,
+    ):
+        """Create many api resources within a child container. Either name or uuid of container resource and the uuid
+        of the child container resource must be provided. See `Resource.bulk_create`
+
+        :param items: data of the resources that will be created
+        :type items: Iterable[dict]
+        :param container_uuid: uuid of container resource
+        :type container_uuid: str, optional
+        :param container_name: name of container resource
+        :type container_name: str, optional
+        :param child_container_uuid: uuid of child container resource
+        :type child_container_uuid: str, optional
+        :param params: dict of parameters for http request
+        :type params: dict, optional
+        :param max_workers: max. number of concurrent requests. Defaults to `4`
+        :type max_workers: int, optional
+        :return: result mapping each item to the api object or the error that occurred
+        :rtype: BulkResult
+        """
+
+        def url(uuid=None):
+            return self.url(
+                self.PATH.format(container_uuid=container_uuid, child_container_uuid=child_container_uuid, uuid=uuid)
+            )
+
+        return self._bulk('create', items, url, params, max_workers)
+
+    @utils.resolve_by_name
+    @utils.minimum_version_required
+    def bulk_update(
+        self,
+        items: Iterable[Dict],
+        container_uuid=None,
+        container_name=None,
+        child_container_uuid=None,
+        params=None,
+        max_workers=defaults.API_BULK_WORKERS,
+    ):
+        """Update many api resources within a child container. Either name or uuid of container resource and the uuid
+        of the child container resource must be provided. See `Resource.bulk_update`
+
+        :param items: data of the resources that will be updated. Each item must contain the `id` of the resource
+        :type items: Iterable[dict]
+        :param container_uuid: uuid of container resource
+        :type container_uuid: str, optional
+        :param container_name: name of container resource
+        :type container_name: str, optional
+        :param child_container_uuid: uuid of child container resource
+        :type child_container_uuid: str, optional
+        :param params: dict of parameters for http request
+        :type params: dict, optional
+        :param max_workers: max. number of concurrent requests. Defaults to `4`
+        :type max_workers: int, optional
+        :return: result mapping each item to the api object or the error that occurred
+        :rtype: BulkResult
+        """
+
+        def url(uuid=None):
+            return self.url(
+                self.PATH.format(container_uuid=container_uuid, child_container_uuid=child_container_uuid, uuid=uuid)
+            )
+
+        return self._bulk('update', items, url, params, max_workers)
+
+    @utils.resolve_by_name
+    @utils.minimum_version_required
+    def bulk_delete(
+        self,
+        items: Iterable[Union[str, Dict]],
+        container_uuid=None,
+        container_name=None,
+        child_container_uuid=None,
+        params=None,
+        max_workers=defaults.API_BULK_WORKERS,
+    ):
+        """Delete many api resources within a child container. Either name or uuid of container resource and the uuid
+        of the child container resource must be provided. See `Resource.bulk_delete`
+
+        :param items: uuids of the resources or api objects containing the `id` of the resource
+        :type items: Iterable[Union[str, dict]]
+        :param container_uuid: uuid of container resource
+        :type container_uuid: str, optional
+        :param container_name: name of container resource
+        :type container_name: str, optional
+        :param child_container_uuid: uuid of child container resource
+        :type child_container_uuid: str, optional
+        :param params: dict of parameters for http request
+        :type params: dict, optional
+        :param max_workers: max. number of concurrent requests. Defaults to `4`
+        :type max_workers: int, optional
+        :return: result mapping each item to the api object or the error that occurred
+        :rtype: BulkResult
+        """
+
+        def url(uuid=None):
+            return self.url(
+                self.PATH.format(container_uuid=container_uuid, child_container_uuid=child_container_uuid, uuid=uuid)
+            )
+
+        return self._bulk('delete', items, url, params, max_workers)
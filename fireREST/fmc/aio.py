@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import contextvars
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import islice
+
+from fireREST import FMC, defaults
+from fireREST.fmc import Connection
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+
+def _next_batch(iterator, batch_size: int):
+    """retrieve the next items of an iterator
+
+    :return: up to `batch_size` items, less if the iterator is exhausted
+    :rtype: list
+    """
+    return list(islice(iterator, batch_size))
+
+
+class AsyncConnection:
+    """Asyncio interface for `Connection`. All requests are performed by the underlying `Connection`
+    in a bounded pool of worker threads, which means authentication, token refresh, error handling and
+    version checks behave exactly the same as for synchronous operations
+    """
+
+    def __init__(self, *args, max_concurrency=defaults.API_ASYNC_MAX_CONCURRENCY, conn=None, **kwargs):
+        """Initialize async connection object. Arguments are passed to `Connection`. Authentication is
+        performed synchronously, use `AsyncConnection.connect` to authenticate without blocking the event loop
+
+        :param max_concurrency: max. number of api calls that are executed concurrently. Defaults to `10`
+        :type max_concurrency: int, optional
+        :param conn: existing connection object that should be used instead of creating a new one
+        :type conn: fireREST.fmc.Connection, optional
+        """
+        if conn is None:
+            kwargs.setdefault('pool_maxsize', max(max_concurrency, defaults.API_POOL_MAXSIZE))
+            conn = Connection(*args, **kwargs)
+        self.conn = conn
+        self.max_concurrency = max_concurrency
+        self.executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix='fireREST')
+
+    @classmethod
+    async def connect(cls, *args, max_concurrency=defaults.API_ASYNC_MAX_CONCURRENCY, **kwargs):
+        """Create async connection object without blocking the event loop during authentication
+
+        :return: authenticated async connection object
+        :rtype: AsyncConnection
+        """
+        kwargs.setdefault('pool_maxsize', max(max_concurrency, defaults.API_POOL_MAXSIZE))
+        conn = await asyncio.get_running_loop().run_in_executor(None, partial(Connection, *args, **kwargs))
+        return cls(max_concurrency=max_concurrency, conn=conn)
+
+    def __getattr__(self, name):
+        # expose attributes of the underlying connection (hostname, domain, version, ...)
+        if name == 'conn':
+            raise AttributeError(name)
+        return getattr(self.conn, name)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        self.close()
+
+    async def run(self, func, *args, **kwargs):
+        """Execute a synchronous callable in the worker pool of the async connection. The callable is executed within
+        a copy of the context of the caller, e.g. to preserve `cache.bypass()` or the profile of the connection
+
+        :param func: callable that should be executed
+        :type func: Callable
+        :return: return value of `func`
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            self.executor, contextvars.copy_context().run, partial(func, *args, **kwargs)
+        )
+
+    async def iterate(self, func, *args, batch_size=defaults.API_PAGING_LIMIT, **kwargs):
+        """Consume a synchronous generator returned by `func` in the worker pool of the async connection.
+        Items are retrieved in batches of up to one page per worker call. The generator is closed if the
+        async generator is closed before it is exhausted, e.g. if the consumer breaks out of the loop
+
+        :param func: callable that returns an iterator
+        :type func: Callable
+        :param batch_size: max. number of items retrieved per worker call. Defaults to `1000`
+        :type batch_size: int, optional
+        :return: async generator yielding the items of the iterator
+        :rtype: AsyncIterator
+        """
+        iterator = await self.run(func, *args, **kwargs)
+        try:
+            while True:
+                items = await self.run(_next_batch, iterator, batch_size)
+                for item in items:
+                    yield item
+                if len(items) < batch_size:
+                    return
+        finally:
+            close = getattr(iterator, 'close', None)
+            if close is not None:
+                await self.run(close)
+
+    async def get(self, url: str, params=None):
+        """Async variant of `Connection.get`"""
+        return await self.run(self.conn.get, url, params)
+
+    def iter_get(self, url: str, params=None):
+        """Async variant of `Connection.iter_get`"""
+        return self.iterate(self.conn.iter_get, url, params)
+
+    async def post(self, url: str, data, params=None, ignore_fields=None, bulk_items_max=defaults.API_BULK_ITEMS_MAX):
+        """Async variant of `Connection.post`"""
+        return await self.run(self.conn.post, url, data, params, ignore_fields, bulk_items_max)
+
+    async def put(self, url: str, data, params=None, ignore_fields=None, bulk_items_max=defaults.API_BULK_ITEMS_MAX):
+        """Async variant of `Connection.put`"""
+        return await self.run(self.conn.put, url, data, params, ignore_fields, bulk_items_max)
+
+    async def delete(self, url: str, params=None):
+        """Async variant of `Connection.delete`"""
+        return await self.run(self.conn.delete, url, params)
+
+    async def login(self):
+        """Async variant of `Connection.login`"""
+        return await self.run(self.conn.login)
+
+    async def refresh(self):
+        """Async variant of `Connection.refresh`"""
+        return await self.run(self.conn.refresh)
+
+    def close(self):
+        """Shutdown worker pool and close http session"""
+        self.executor.shutdown(wait=True)
+        self.conn.session.close()
+
+
+class AsyncResource:
+    """Asyncio proxy for `Resource`, `ChildResource`, `NestedChildResource` and api namespaces.
+    Nested resources are proxied as well, methods are returned as coroutine functions and `iter`
+    is returned as async generator
+    """
+
+    def __init__(self, target, conn: AsyncConnection):
+        """Initialize async proxy
+
+        :param target: resource or namespace object that will be proxied
+        :type target: Union[fireREST.fmc.Resource, object]
+        :param conn: async connection used to execute operations
+        :type conn: AsyncConnection
+        """
+        self._target = target
+        self._conn = conn
+
+    def __getattr__(self, name):
+        if name in ('_target', '_conn'):
+            raise AttributeError(name)
+        attr = getattr(self._target, name)
+        if callable(attr):
+            if name == 'iter':
+                value = partial(self._conn.iterate, attr)
+            else:
+                value = partial(self._conn.run, attr)
+        elif type(attr).__module__.startswith('fireREST.fmc.'):
+            value = AsyncResource(attr, self._conn)
+        else:
+            return attr
+        self.__dict__[name] = value
+        return value
+
+    def __dir__(self):
+        return sorted(set(dir(self._target)) | set(self.__dict__))
+
+    def __repr__(self):
+        return f'<AsyncResource {self._target.__class__.__name__}>'
+
+
+class AsyncFMC:
+    """Asyncio interface for `FMC`. The resource tree mirrors `FMC`, all operations are awaitable and
+    `iter` operations return async generators
+
+    Example: `await afmc.object.network.get(name='NetObjViaAPI')`
+    """
+
+    def __init__(self, *args, max_concurrency=defaults.API_ASYNC_MAX_CONCURRENCY, fmc=None, **kwargs):
+        """Initialize async fmc object. Arguments are passed to `FMC`. Authentication is performed
+        synchronously, use `AsyncFMC.connect` to authenticate without blocking the event loop
+
+        :param max_concurrency: max. number of api calls that are executed concurrently. Defaults to `10`
+        :type max_concurrency: int, optional
+        :param fmc: existing fmc object that should be used instead of creating a new one
+        :type fmc: FMC, optional
+        """
+        if fmc is None:
+            kwargs.setdefault('pool_maxsize', max(max_concurrency, defaults.API_POOL_MAXSIZE))
+            fmc = FMC(*args, **kwargs)
+        self.fmc = fmc
+        self.conn = AsyncConnection(max_concurrency=max_concurrency, conn=self.fmc.conn)
+        self.domain = self.fmc.domain
+        self.version = self.fmc.version
+
+    @classmethod
+    async def connect(cls, *args, max_concurrency=defaults.API_ASYNC_MAX_CONCURRENCY, **kwargs):
+        """Create async fmc object without blocking the event loop during authentication
+
+        :return: authenticated async fmc object
+        :rtype: AsyncFMC
+        """
+        kwargs.setdefault('pool_maxsize', max(max_concurrency, defaults.API_POOL_MAXSIZE))
+        fmc = await asyncio.get_running_loop().run_in_executor(None, partial(FMC, *args, **kwargs))
+        return cls(max_concurrency=max_concurrency, fmc=fmc)
+
+    def __getattr__(self, name):
+        if name == 'fmc':
+            raise AttributeError(name)
+        value = AsyncResource(getattr(self.fmc, name), self.conn)
+        self.__dict__[name] = value
+        return value
+
+    def __dir__(self):
+        return sorted(set(dir(self.fmc)) | set(self.__dict__))
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        self.close()
+
+    def close(self):
+        """Shutdown worker pool and close http session"""
+        self.conn.close()
@@ -1,9 +1,19 @@
-from fireREST.fmc import Connection
-from fireREST.fmc.analysis.activesessions import ActiveSessions
-from fireREST.fmc.analysis.useractivity import UserActivity
+from typing import TYPE_CHECKING
+
+from fireREST.fmc import Connection, LazyResource, lazy_getattr
+
+if TYPE_CHECKING:
+    from fireREST.fmc.analysis.activesessions import ActiveSessions
+    from fireREST.fmc.analysis.useractivity import UserActivity
 
 
 class Analysis:
+    activesessions: LazyResource['ActiveSessions'] = LazyResource('.activesessions', 'ActiveSessions')
+    useractivity: LazyResource['UserActivity'] = LazyResource('.useractivity', 'UserActivity')
+
     def __init__(self, conn: Connection):
-        self.activesessions = ActiveSessions(conn)
-        self.useractivity = UserActivity(conn)
+        self.conn = conn
+
+
+def __getattr__(name: str):
+    return lazy_getattr(__name__, name)
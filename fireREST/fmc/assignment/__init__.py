@@ -1,7 +1,17 @@
-from fireREST.fmc import Connection
-from fireREST.fmc.assignment.policyassignment import PolicyAssignment
+from typing import TYPE_CHECKING
+
+from fireREST.fmc import Connection, LazyResource, lazy_getattr
+
+if TYPE_CHECKING:
+    from fireREST.fmc.assignment.policyassignment import PolicyAssignment
 
 
 class Assignment:
+    policyassignment: LazyResource['PolicyAssignment'] = LazyResource('.policyassignment', 'PolicyAssignment')
+
     def __init__(self, conn: Connection):
-        self.policyassignment = PolicyAssignment(conn)
+        self.conn = conn
+
+
+def __getattr__(name: str):
+    return lazy_getattr(__name__, name)
@@ -1,9 +1,19 @@
-from fireREST.fmc import Connection
-from fireREST.fmc.audit.auditrecord import AuditRecord
-from fireREST.fmc.audit.configchanges import ConfigChanges
+from typing import TYPE_CHECKING
+
+from fireREST.fmc import Connection, LazyResource, lazy_getattr
+
+if TYPE_CHECKING:
+    from fireREST.fmc.audit.auditrecord import AuditRecord
+    from fireREST.fmc.audit.configchanges import ConfigChanges
 
 
 class Audit:
+    auditrecord: LazyResource['AuditRecord'] = LazyResource('.auditrecord', 'AuditRecord')
+    configchanges: LazyResource['ConfigChanges'] = LazyResource('.configchanges', 'ConfigChanges')
+
     def __init__(self, conn: Connection):
-        self.auditrecord = AuditRecord(conn)
-        self.configchanges = ConfigChanges(conn)
+        self.conn = conn
+
+
+def __getattr__(name: str):
+    return lazy_getattr(__name__, name)
@@ -1,10 +1,12 @@
-from typing import Dict
+from typing import TYPE_CHECKING, Dict
 
 from fireREST import utils
 from fireREST.defaults import API_RELEASE_730
-from fireREST.fmc import Connection, Resource
-from fireREST.fmc.backup.downloadbackup import DownloadBackup
-from fireREST.fmc.backup.file import BackupFile
+from fireREST.fmc import LazyResource, Resource, lazy_getattr
+
+if TYPE_CHECKING:
+    from fireREST.fmc.backup.downloadbackup import DownloadBackup
+    from fireREST.fmc.backup.file import BackupFile
 
 
 class Backup(Resource):
@@ -30,13 +32,14 @@ class Backup(Resource):
 
     PATH = '/backup/files/{uuid}'
 
-    def __init__(self, conn: Connection):
-        super().__init__(conn)
-
-        self.downloadbackup = DownloadBackup(conn)
-        self.file = BackupFile(conn)
+    downloadbackup: LazyResource['DownloadBackup'] = LazyResource('.downloadbackup', 'DownloadBackup')
+    file: LazyResource['BackupFile'] = LazyResource('.file', 'BackupFile')
 
     @utils.minimum_version_required(version=API_RELEASE_730)
     def create_device_backup(self, data: Dict, params=None):
         url = self.url('/backup/operational/devicebackup')
         return self.conn.post(url=url, data=data, params=params)
+
+
+def __getattr__(name: str):
+    return lazy_getattr(__name__, name)
@@ -1,7 +1,17 @@
-from fireREST.fmc import Connection
-from fireREST.fmc.changemanagement.ticket import Ticket
+from typing import TYPE_CHECKING
+
+from fireREST.fmc import Connection, LazyResource, lazy_getattr
+
+if TYPE_CHECKING:
+    from fireREST.fmc.changemanagement.ticket import Ticket
 
 
 class ChangeManagement:
+    ticket: LazyResource['Ticket'] = LazyResource('.ticket', 'Ticket')
+
     def __init__(self, conn: Connection):
-        self.ticket = Ticket(conn)
+        self.conn = conn
+
+
+def __getattr__(name: str):
+    return lazy_getattr(__name__, name)
@@ -1,7 +1,11 @@
+from typing import TYPE_CHECKING
+
 from fireREST.defaults import API_RELEASE_740
-from fireREST.fmc import Connection, Resource
-from fireREST.fmc.changemanagement.ticket.previewchanges import PreviewChanges
-from fireREST.fmc.changemanagement.ticket.validationresults import ValidationResults
+from fireREST.fmc import LazyResource, Resource, lazy_getattr
+
+if TYPE_CHECKING:
+    from fireREST.fmc.changemanagement.ticket.previewchanges import PreviewChanges
+    from fireREST.fmc.changemanagement.ticket.validationresults import ValidationResults
 
 
 class Ticket(Resource):
@@ -33,7 +37,9 @@ class Ticket(Resource):
     MINIMUM_VERSION_REQUIRED_GET = API_RELEASE_740
     MINIMUM_VERSION_REQUIRED_UPDATE = API_RELEASE_740
 
-    def __init__(self, conn: Connection):
-        super().__init__(conn)
-        self.previewchanges = PreviewChanges(conn)
-        self.validationresults = ValidationResults(conn)
+    previewchanges: LazyResource['PreviewChanges'] = LazyResource('.previewchanges', 'PreviewChanges')
+    validationresults: LazyResource['ValidationResults'] = LazyResource('.validationresults', 'ValidationResults')
+
+
+def __getattr__(name: str):
+    return lazy_getattr(__name__, name)
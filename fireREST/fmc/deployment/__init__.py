@@ -1,15 +1,27 @@
-from fireREST.fmc import Connection
-from fireREST.fmc.deployment.deployabledevice import DeployableDevice
-from fireREST.fmc.deployment.deploymentrequest import DeploymentRequest
-from fireREST.fmc.deployment.jobhistory import JobHistory
-from fireREST.fmc.deployment.pendingchangesrequest import PendingChangesRequest
-from fireREST.fmc.deployment.rollbackrequest import RollbackRequest
+from typing import TYPE_CHECKING
+
+from fireREST.fmc import Connection, LazyResource, lazy_getattr
+
+if TYPE_CHECKING:
+    from fireREST.fmc.deployment.deployabledevice import DeployableDevice
+    from fireREST.fmc.deployment.deploymentrequest import DeploymentRequest
+    from fireREST.fmc.deployment.jobhistory import JobHistory
+    from fireREST.fmc.deployment.pendingchangesrequest import PendingChangesRequest
+    from fireREST.fmc.deployment.rollbackrequest import RollbackRequest
 
 
 class Deployment:
+    deployabledevices: LazyResource['DeployableDevice'] = LazyResource('.deployabledevice', 'DeployableDevice')
+    deploymentrequest: LazyResource['DeploymentRequest'] = LazyResource('.deploymentrequest', 'DeploymentRequest')
+    jobhistory: LazyResource['JobHistory'] = LazyResource('.jobhistory', 'JobHistory')
+    pendingchangesrequest: LazyResource['PendingChangesRequest'] = LazyResource(
+        '.pendingchangesrequest', 'PendingChangesRequest'
+    )
+    rollbackrequest: LazyResource['RollbackRequest'] = LazyResource('.rollbackrequest', 'RollbackRequest')
+
     def __init__(self, conn: Connection):
-        self.deployabledevices = DeployableDevice(conn)
-        self.deploymentrequest = DeploymentRequest(conn)
-        self.jobhistory = JobHistory(conn)
-        self.pendingchangesrequest = PendingChangesRequest(conn)
-        self.rollbackrequest = RollbackRequest(conn)
+        self.conn = conn
+
+
+def __getattr__(name: str):
+    return lazy_getattr(__name__, name)
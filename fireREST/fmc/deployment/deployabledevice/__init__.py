@@ -1,7 +1,11 @@
+from typing import TYPE_CHECKING
+
 from fireREST.defaults import API_RELEASE_610
-from fireREST.fmc import Connection, Resource
-from fireREST.fmc.deployment.deployabledevice.deployment import Deployment
-from fireREST.fmc.deployment.deployabledevice.pendingchanges import PendingChanges
+from fireREST.fmc import LazyResource, Resource, lazy_getattr
+
+if TYPE_CHECKING:
+    from fireREST.fmc.deployment.deployabledevice.deployment import Deployment
+    from fireREST.fmc.deployment.deployabledevice.pendingchanges import PendingChanges
 
 
 class DeployableDevice(Resource):
@@ -27,7 +31,9 @@ class DeployableDevice(Resource):
     SUPPORTED_PARAMS = ['group_dependency']
     MINIMUM_VERSION_REQUIRED_GET = API_RELEASE_610
 
-    def __init__(self, conn: Connection):
-        self.deployment = Deployment(conn)
-        self.pendingchanges = PendingChanges(conn)
-        super().__init__(conn)
+    deployment: LazyResource['Deployment'] = LazyResource('.deployment', 'Deployment')
+    pendingchanges: LazyResource['PendingChanges'] = LazyResource('.pendingchanges', 'PendingChanges')
+
+
+def __getattr__(name: str):
+    return lazy_getattr(__name__, name)
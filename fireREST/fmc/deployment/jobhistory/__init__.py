@@ -1,7 +1,11 @@
+from typing import TYPE_CHECKING
+
 from fireREST.defaults import API_RELEASE_670
-from fireREST.fmc import Connection, Resource
-from fireREST.fmc.deployment.jobhistory.downloadreport import DownloadReport
-from fireREST.fmc.deployment.jobhistory.emailreport import EmailReport
+from fireREST.fmc import LazyResource, Resource, lazy_getattr
+
+if TYPE_CHECKING:
+    from fireREST.fmc.deployment.jobhistory.downloadreport import DownloadReport
+    from fireREST.fmc.deployment.jobhistory.emailreport import EmailReport
 
 
 class JobHistory(Resource):
@@ -29,8 +33,9 @@ class JobHistory(Resource):
     SUPPORTED_FILTERS = ['device_uuid']
     MINIMUM_VERSION_REQUIRED_GET = API_RELEASE_670
 
-    def __init__(self, conn: Connection):
-        super().__init__(conn)
+    downloadreport: LazyResource['DownloadReport'] = LazyResource('.downloadreport', 'DownloadReport')
+    emailreport: LazyResource['EmailReport'] = LazyResource('.emailreport', 'EmailReport')
+
 
-        self.downloadreport = DownloadReport(conn)
-        self.emailreport = EmailReport(conn)
+def __getattr__(name: str):
+    return lazy_getattr(__name__, name)
@@ -1,18 +1,17 @@
-from typing import Dict
+from typing import TYPE_CHECKING, Dict
 
 from fireREST import utils
 from fireREST.defaults import API_RELEASE_630, API_RELEASE_720
-from fireREST.fmc import Connection, Resource
-from fireREST.fmc.device.devicerecord import DeviceRecord
-from fireREST.fmc.device.devicesettings import DeviceSettings
+from fireREST.fmc import LazyResource, Resource, lazy_getattr
 
+if TYPE_CHECKING:
+    from fireREST.fmc.device.devicerecord import DeviceRecord
+    from fireREST.fmc.device.devicesettings import DeviceSettings
 
-class Device(Resource):
-    def __init__(self, conn: Connection):
-        super().__init__(conn)
 
-        self.devicerecord = DeviceRecord(conn)
-        self.devicesettings = DeviceSettings(conn)
+class Device(Resource):
+    devicerecord: LazyResource['DeviceRecord'] = LazyResource('.devicerecord', 'DeviceRecord')
+    devicesettings: LazyResource['DeviceSettings'] = LazyResource('.devicesettings', 'DeviceSettings')
 
     @utils.minimum_version_required(version=API_RELEASE_630)
     def copyconfigrequest(self, data: Dict):
@@ -23,3 +22,7 @@ class Device(Resource):
     def changemanager(self, data: Dict):
         url = self.url(path='/devices/changemanagers')
         return self.conn.post(url=url, data=data)
+
+
+def __getattr__(name: str):
+    return lazy_getattr(__name__, name)
@@ -1,23 +1,27 @@
+from typing import TYPE_CHECKING
+
 from fireREST.defaults import API_RELEASE_610
-from fireREST.fmc import Connection, Resource
-from fireREST.fmc.device.devicerecord.bridgegroupinterface import BridgeGroupInterface
-from fireREST.fmc.device.devicerecord.dhcp import Dhcp
-from fireREST.fmc.device.devicerecord.etherchannelinterface import EtherChannelInterface
-from fireREST.fmc.device.devicerecord.fpinterfacestatistics import FpInterfaceStatistics
-from fireREST.fmc.device.devicerecord.fplogicalinterface import FpLogicalInterface
-from fireREST.fmc.device.devicerecord.fpphysicalinterface import FpPhysicalInterface
-from fireREST.fmc.device.devicerecord.inlineset import InlineSet
-from fireREST.fmc.device.devicerecord.interfaceevent import InterfaceEvent
-from fireREST.fmc.device.devicerecord.loopbackinterface import LoopbackInterface
-from fireREST.fmc.device.devicerecord.managementconvergencemode import ManagementConvergenceMode
-from fireREST.fmc.device.devicerecord.operational import Operational
-from fireREST.fmc.device.devicerecord.physicalinterface import PhysicalInterface
-from fireREST.fmc.device.devicerecord.redundantinterface import RedundantInterface
-from fireREST.fmc.device.devicerecord.routing import Routing
-from fireREST.fmc.device.devicerecord.subinterface import SubInterface
-from fireREST.fmc.device.devicerecord.virtualswitch import VirtualSwitch
-from fireREST.fmc.device.devicerecord.virtualtunnelinterface import VirtualTunnelInterface
-from fireREST.fmc.device.devicerecord.vlaninterface import VlanInterface
+from fireREST.fmc import LazyResource, Resource, lazy_getattr
+
+if TYPE_CHECKING:
+    from fireREST.fmc.device.devicerecord.bridgegroupinterface import BridgeGroupInterface
+    from fireREST.fmc.device.devicerecord.dhcp import Dhcp
+    from fireREST.fmc.device.devicerecord.etherchannelinterface import EtherChannelInterface
+    from fireREST.fmc.device.devicerecord.fpinterfacestatistics import FpInterfaceStatistics
+    from fireREST.fmc.device.devicerecord.fplogicalinterface import FpLogicalInterface
+    from fireREST.fmc.device.devicerecord.fpphysicalinterface import FpPhysicalInterface
+    from fireREST.fmc.device.devicerecord.inlineset import InlineSet
+    from fireREST.fmc.device.devicerecord.interfaceevent import InterfaceEvent
+    from fireREST.fmc.device.devicerecord.loopbackinterface import LoopbackInterface
+    from fireREST.fmc.device.devicerecord.managementconvergencemode import ManagementConvergenceMode
+    from fireREST.fmc.device.devicerecord.operational import Operational
+    from fireREST.fmc.device.devicerecord.physicalinterface import PhysicalInterface
+    from fireREST.fmc.device.devicerecord.redundantinterface import RedundantInterface
+    from fireREST.fmc.device.devicerecord.routing import Routing
+    from fireREST.fmc.device.devicerecord.subinterface import SubInterface
+    from fireREST.fmc.device.devicerecord.virtualswitch import VirtualSwitch
+    from fireREST.fmc.device.devicerecord.virtualtunnelinterface import VirtualTunnelInterface
+    from fireREST.fmc.device.devicerecord.vlaninterface import VlanInterface
 
 
 class DeviceRecord(Resource):
@@ -51,25 +55,39 @@ class DeviceRecord(Resource):
     MINIMUM_VERSION_REQUIRED_UPDATE = API_RELEASE_610
     MINIMUM_VERSION_REQUIRED_DELETE = API_RELEASE_610
     SUPPORTED_PARAMS = ['hostname']
+    BULK_OPERATIONS = ['create', 'delete']
+
+    bridgegroupinterface: LazyResource['BridgeGroupInterface'] = LazyResource(
+        '.bridgegroupinterface', 'BridgeGroupInterface'
+    )
+    dhcp: LazyResource['Dhcp'] = LazyResource('.dhcp', 'Dhcp')
+    etherchannelinterface: LazyResource['EtherChannelInterface'] = LazyResource(
+        '.etherchannelinterface', 'EtherChannelInterface'
+    )
+    fpinterfacestatistics: LazyResource['FpInterfaceStatistics'] = LazyResource(
+        '.fpinterfacestatistics', 'FpInterfaceStatistics'
+    )
+    fplogicalinterface: LazyResource['FpLogicalInterface'] = LazyResource('.fplogicalinterface', 'FpLogicalInterface')
+    fpphysicalinterface: LazyResource['FpPhysicalInterface'] = LazyResource(
+        '.fpphysicalinterface', 'FpPhysicalInterface'
+    )
+    inlineset: LazyResource['InlineSet'] = LazyResource('.inlineset', 'InlineSet')
+    interfaceevent: LazyResource['InterfaceEvent'] = LazyResource('.interfaceevent', 'InterfaceEvent')
+    loopbackinterface: LazyResource['LoopbackInterface'] = LazyResource('.loopbackinterface', 'LoopbackInterface')
+    managementconvergencemode: LazyResource['ManagementConvergenceMode'] = LazyResource(
+        '.managementconvergencemode', 'ManagementConvergenceMode'
+    )
+    operational: LazyResource['Operational'] = LazyResource('.operational', 'Operational')
+    physicalinterface: LazyResource['PhysicalInterface'] = LazyResource('.physicalinterface', 'PhysicalInterface')
+    redundantinterface: LazyResource['RedundantInterface'] = LazyResource('.redundantinterface', 'RedundantInterface')
+    routing: LazyResource['Routing'] = LazyResource('.routing', 'Routing')
+    subinterface: LazyResource['SubInterface'] = LazyResource('.subinterface', 'SubInterface')
+    virtualswitch: LazyResource['VirtualSwitch'] = LazyResource('.virtualswitch', 'VirtualSwitch')
+    virtualtunnelinterface: LazyResource['VirtualTunnelInterface'] = LazyResource(
+        '.virtualtunnelinterface', 'VirtualTunnelInterface'
+    )
+    vlaninterface: LazyResource['VlanInterface'] = LazyResource('.vlaninterface', 'VlanInterface')
 
-    def __init__(self, conn: Connection):
-        super().__init__(conn)
 
-        self.bridgegroupinterface = BridgeGroupInterface(conn)
-        self.dhcp = Dhcp(conn)
-        self.etherchannelinterface = EtherChannelInterface(conn)
-        self.fpinterfacestatistics = FpInterfaceStatistics(conn)
-        self.fplogicalinterface = FpLogicalInterface(conn)
-        self.fpphysicalinterface = FpPhysicalInterface(conn)
-        self.inlineset = InlineSet(conn)
-        self.interfaceevent = InterfaceEvent(conn)
-        self.loopbackinterface = LoopbackInterface(conn)
-        self.managementconvergencemode = ManagementConvergenceMode(conn)
-        self.operational = Operational(conn)
-        self.physicalinterface = PhysicalInterface(conn)
-        self.redundantinterface = RedundantInterface(conn)
-        self.routing = Routing(conn)
-        self.subinterface = SubInterface(conn)
-        self.virtualswitch = VirtualSwitch(conn)
-        self.virtualtunnelinterface = VirtualTunnelInterface(conn)
-        self.vlaninterface = VlanInterface(conn)
+def __getattr__(name: str):
+    return lazy_getattr(__name__, name)
@@ -1,11 +1,21 @@
-from fireREST.fmc import Connection
-from fireREST.fmc.device.devicerecord.dhcp.ddnssettings import DdnsSettings
-from fireREST.fmc.device.devicerecord.dhcp.dhcprelaysettings import DhcpRelaySettings
-from fireREST.fmc.device.devicerecord.dhcp.dhcpserver import DhcpServer
+from typing import TYPE_CHECKING
+
+from fireREST.fmc import Connection, LazyResource, lazy_getattr
+
+if TYPE_CHECKING:
+    from fireREST.fmc.device.devicerecord.dhcp.ddnssettings import DdnsSettings
+    from fireREST.fmc.device.devicerecord.dhcp.dhcprelaysettings import DhcpRelaySettings
+    from fireREST.fmc.device.devicerecord.dhcp.dhcpserver import DhcpServer
 
 
 class Dhcp:
+    ddnssettings: LazyResource['DdnsSettings'] = LazyResource('.ddnssettings', 'DdnsSettings')
+    dhcprelaysettings: LazyResource['DhcpRelaySettings'] = LazyResource('.dhcprelaysettings', 'DhcpRelaySettings')
+    dhcpserver: LazyResource['DhcpServer'] = LazyResource('.dhcpserver', 'DhcpServer')
+
     def __init__(self, conn: Connection):
-        self.ddnssettings = DdnsSettings(conn)
-        self.dhcprelaysettings = DhcpRelaySettings(conn)
-        self.dhcpserver = DhcpServer(conn)
+        self.conn = conn
+
+
+def __getattr__(name: str):
+    return lazy_getattr(__name__, name)
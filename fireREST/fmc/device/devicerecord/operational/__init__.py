@@ -1,11 +1,23 @@
-from fireREST.fmc import Connection
-from fireREST.fmc.device.devicerecord.operational.command import Command
-from fireREST.fmc.device.devicerecord.operational.metric import Metric
-from fireREST.fmc.device.devicerecord.operational.virtualaccessinterface import VirtualAccessInterface
+from typing import TYPE_CHECKING
+
+from fireREST.fmc import Connection, LazyResource, lazy_getattr
+
+if TYPE_CHECKING:
+    from fireREST.fmc.device.devicerecord.operational.command import Command
+    from fireREST.fmc.device.devicerecord.operational.metric import Metric
+    from fireREST.fmc.device.devicerecord.operational.virtualaccessinterface import VirtualAccessInterface
 
 
 class Operational:
+    command: LazyResource['Command'] = LazyResource('.command', 'Command')
+    metric: LazyResource['Metric'] = LazyResource('.metric', 'Metric')
+    virtualaccessinterface: LazyResource['VirtualAccessInterface'] = LazyResource(
+        '.virtualaccessinterface', 'VirtualAccessInterface'
+    )
+
     def __init__(self, conn: Connection):
-        self.command = Command(conn)
-        self.metric = Metric(conn)
-        self.virtualaccessinterface = VirtualAccessInterface(conn)
+        self.conn = conn
+
+
+def __getattr__(name: str):
+    return lazy_getattr(__name__, name)
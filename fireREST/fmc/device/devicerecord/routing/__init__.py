@@ -1,29 +1,39 @@
-from fireREST.fmc import Connection
-from fireREST.fmc.device.devicerecord.routing.bfdpolicy import BfdPolicy
-from fireREST.fmc.device.devicerecord.routing.bgp import Bgp
-from fireREST.fmc.device.devicerecord.routing.bgpgeneralsettings import BgpGeneralSettings
-from fireREST.fmc.device.devicerecord.routing.eigrproute import EigrpRoute
-from fireREST.fmc.device.devicerecord.routing.ipv4staticroute import Ipv4StaticRoute
-from fireREST.fmc.device.devicerecord.routing.ipv6staticroute import Ipv6StaticRoute
-from fireREST.fmc.device.devicerecord.routing.ospfinterface import OspfInterface
-from fireREST.fmc.device.devicerecord.routing.ospfv2route import Ospfv2Route
-from fireREST.fmc.device.devicerecord.routing.ospfv3interface import Ospfv3Interface
-from fireREST.fmc.device.devicerecord.routing.policybasedroute import PolicyBasedRoute
-from fireREST.fmc.device.devicerecord.routing.staticroute import StaticRoute
-from fireREST.fmc.device.devicerecord.routing.virtualrouter import VirtualRouter
+from typing import TYPE_CHECKING
+
+from fireREST.fmc import Connection, LazyResource, lazy_getattr
+
+if TYPE_CHECKING:
+    from fireREST.fmc.device.devicerecord.routing.bfdpolicy import BfdPolicy
+    from fireREST.fmc.device.devicerecord.routing.bgp import Bgp
+    from fireREST.fmc.device.devicerecord.routing.bgpgeneralsettings import BgpGeneralSettings
+    from fireREST.fmc.device.devicerecord.routing.eigrproute import EigrpRoute
+    from fireREST.fmc.device.devicerecord.routing.ipv4staticroute import Ipv4StaticRoute
+    from fireREST.fmc.device.devicerecord.routing.ipv6staticroute import Ipv6StaticRoute
+    from fireREST.fmc.device.devicerecord.routing.ospfinterface import OspfInterface
+    from fireREST.fmc.device.devicerecord.routing.ospfv2route import Ospfv2Route
+    from fireREST.fmc.device.devicerecord.routing.ospfv3interface import Ospfv3Interface
+    from fireREST.fmc.device.devicerecord.routing.policybasedroute import PolicyBasedRoute
+    from fireREST.fmc.device.devicerecord.routing.staticroute import StaticRoute
+    from fireREST.fmc.device.devicerecord.routing.virtualrouter import VirtualRouter
 
 
 class Routing:
+    bfdpolicy: LazyResource['BfdPolicy'] = LazyResource('.bfdpolicy', 'BfdPolicy')
+    bgp: LazyResource['Bgp'] = LazyResource('.bgp', 'Bgp')
+    bgpgeneralsettings: LazyResource['BgpGeneralSettings'] = LazyResource('.bgpgeneralsettings', 'BgpGeneralSettings')
+    eigrproute: LazyResource['EigrpRoute'] = LazyResource('.eigrproute', 'EigrpRoute')
+    ipv4staticroute: LazyResource['Ipv4StaticRoute'] = LazyResource('.ipv4staticroute', 'Ipv4StaticRoute')
+    ipv6staticroute: LazyResource['Ipv6StaticRoute'] = LazyResource('.ipv6staticroute', 'Ipv6StaticRoute')
+    ospfinterface: LazyResource['OspfInterface'] = LazyResource('.ospfinterface', 'OspfInterface')
+    ospfv2route: LazyResource['Ospfv2Route'] = LazyResource('.ospfv2route', 'Ospfv2Route')
+    ospfv3interface: LazyResource['Ospfv3Interface'] = LazyResource('.ospfv3interface', 'Ospfv3Interface')
+    policybasedroute: LazyResource['PolicyBasedRoute'] = LazyResource('.policybasedroute', 'PolicyBasedRoute')
+    staticroute: LazyResource['StaticRoute'] = LazyResource('.staticroute', 'StaticRoute')
+    virtualrouter: LazyResource['VirtualRouter'] = LazyResource('.virtualrouter', 'VirtualRouter')
+
     def __init__(self, conn: Connection):
-        self.bfdpolicy = BfdPolicy(conn)
-        self.bgp = Bgp(conn)
-        self.bgpgeneralsettings = BgpGeneralSettings(conn)
-        self.eigrproute = EigrpRoute(conn)
-        self.ipv4staticroute = Ipv4StaticRoute(conn)
-        self.ipv6staticroute = Ipv6StaticRoute(conn)
-        self.ospfinterface = OspfInterface(conn)
-        self.ospfv2route = Ospfv2Route(conn)
-        self.ospfv3interface = Ospfv3Interface(conn)
-        self.policybasedroute = PolicyBasedRoute(conn)
-        self.staticroute = StaticRoute(conn)
-        self.virtualrouter = VirtualRouter(conn)
+        self.conn = conn
+
+
+def __getattr__(name: str):
+    return lazy_getattr(__name__, name)
@@ -32,3 +32,4 @@ class Ipv4StaticRoute(ChildResource):
     MINIMUM_VERSION_REQUIRED_GET = API_RELEASE_623
     MINIMUM_VERSION_REQUIRED_UPDATE = API_RELEASE_623
     MINIMUM_VERSION_REQUIRED_DELETE = API_RELEASE_623
+    BULK_OPERATIONS = ['create']
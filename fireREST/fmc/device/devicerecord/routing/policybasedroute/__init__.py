@@ -32,3 +32,4 @@ class PolicyBasedRoute(ChildResource):
     MINIMUM_VERSION_REQUIRED_GET = API_RELEASE_710
     MINIMUM_VERSION_REQUIRED_UPDATE = API_RELEASE_710
     MINIMUM_VERSION_REQUIRED_DELETE = API_RELEASE_710
+    BULK_OPERATIONS = ['create']
@@ -1,15 +1,19 @@
+from typing import TYPE_CHECKING
+
 from fireREST.defaults import API_RELEASE_660
-from fireREST.fmc import ChildResource, Connection
-from fireREST.fmc.device.devicerecord.routing.virtualrouter.bfdpolicy import BfdPolicy
-from fireREST.fmc.device.devicerecord.routing.virtualrouter.bgp import Bgp
-from fireREST.fmc.device.devicerecord.routing.virtualrouter.eigrproute import EigrpRoute
-from fireREST.fmc.device.devicerecord.routing.virtualrouter.ipv4staticroute import Ipv4StaticRoute
-from fireREST.fmc.device.devicerecord.routing.virtualrouter.ipv6staticroute import Ipv6StaticRoute
-from fireREST.fmc.device.devicerecord.routing.virtualrouter.ospfinterface import OspfInterface
-from fireREST.fmc.device.devicerecord.routing.virtualrouter.ospfv2route import Ospfv2Route
-from fireREST.fmc.device.devicerecord.routing.virtualrouter.ospfv3interface import Ospfv3Interface
-from fireREST.fmc.device.devicerecord.routing.virtualrouter.ospfv3route import Ospfv3Route
-from fireREST.fmc.device.devicerecord.routing.virtualrouter.policybasedroute import PolicyBasedRoute
+from fireREST.fmc import ChildResource, LazyResource, lazy_getattr
+
+if TYPE_CHECKING:
+    from fireREST.fmc.device.devicerecord.routing.virtualrouter.bfdpolicy import BfdPolicy
+    from fireREST.fmc.device.devicerecord.routing.virtualrouter.bgp import Bgp
+    from fireREST.fmc.device.devicerecord.routing.virtualrouter.eigrproute import EigrpRoute
+    from fireREST.fmc.device.devicerecord.routing.virtualrouter.ipv4staticroute import Ipv4StaticRoute
+    from fireREST.fmc.device.devicerecord.routing.virtualrouter.ipv6staticroute import Ipv6StaticRoute
+    from fireREST.fmc.device.devicerecord.routing.virtualrouter.ospfinterface import OspfInterface
+    from fireREST.fmc.device.devicerecord.routing.virtualrouter.ospfv2route import Ospfv2Route
+    from fireREST.fmc.device.devicerecord.routing.virtualrouter.ospfv3interface import Ospfv3Interface
+    from fireREST.fmc.device.devicerecord.routing.virtualrouter.ospfv3route import Ospfv3Route
+    from fireREST.fmc.device.devicerecord.routing.virtualrouter.policybasedroute import PolicyBasedRoute
 
 
 class VirtualRouter(ChildResource):
@@ -42,16 +46,17 @@ class VirtualRouter(ChildResource):
     MINIMUM_VERSION_REQUIRED_UPDATE = API_RELEASE_660
     MINIMUM_VERSION_REQUIRED_DELETE = API_RELEASE_660
 
-    def __init__(self, conn: Connection):
-        super().__init__(conn)
-
-        self.bfdpolicy = BfdPolicy(conn)
-        self.bgp = Bgp(conn)
-        self.eigrproute = EigrpRoute(conn)
-        self.ipv4staticroute = Ipv4StaticRoute(conn)
-        self.ipv6staticroute = Ipv6StaticRoute(conn)
-        self.ospfinterface = OspfInterface(conn)
-        self.ospfv2route = Ospfv2Route(conn)
-        self.ospfv3interface = Ospfv3Interface(conn)
-        self.ospfv3route = Ospfv3Route(conn)
-        self.policybasedroute = PolicyBasedRoute(conn)
+    bfdpolicy: LazyResource['BfdPolicy'] = LazyResource('.bfdpolicy', 'BfdPolicy')
+    bgp: LazyResource['Bgp'] = LazyResource('.bgp', 'Bgp')
+    eigrproute: LazyResource['EigrpRoute'] = LazyResource('.eigrproute', 'EigrpRoute')
+    ipv4staticroute: LazyResource['Ipv4StaticRoute'] = LazyResource('.ipv4staticroute', 'Ipv4StaticRoute')
+    ipv6staticroute: LazyResource['Ipv6StaticRoute'] = LazyResource('.ipv6staticroute', 'Ipv6StaticRoute')
+    ospfinterface: LazyResource['OspfInterface'] = LazyResource('.ospfinterface', 'OspfInterface')
+    ospfv2route: LazyResource['Ospfv2Route'] = LazyResource('.ospfv2route', 'Ospfv2Route')
+    ospfv3interface: LazyResource['Ospfv3Interface'] = LazyResource('.ospfv3interface', 'Ospfv3Interface')
+    ospfv3route: LazyResource['Ospfv3Route'] = LazyResource('.ospfv3route', 'Ospfv3Route')
+    policybasedroute: LazyResource['PolicyBasedRoute'] = LazyResource('.policybasedroute', 'PolicyBasedRoute')
+
+
+def __getattr__(name: str):
+    return lazy_getattr(__name__, name)
@@ -34,6 +34,7 @@ class VirtualTunnelInterface(ChildResource):
     MINIMUM_VERSION_REQUIRED_GET = API_RELEASE_670
     MINIMUM_VERSION_REQUIRED_UPDATE = API_RELEASE_670
     MINIMUM_VERSION_REQUIRED_DELETE = API_RELEASE_670
+    BULK_OPERATIONS = ['create']
 
     @utils.support_params
     def get(self, container_uuid=None, container_name=None, uuid=None, name=None, params=None):
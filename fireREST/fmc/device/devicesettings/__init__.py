@@ -27,3 +27,4 @@ class DeviceSettings(Resource):
     PATH = '/devices/devicesettings/{uuid}'
     MINIMUM_VERSION_REQUIRED_GET = API_RELEASE_720
     MINIMUM_VERSION_REQUIRED_UPDATE = API_RELEASE_720
+    BULK_OPERATIONS = ['update']
@@ -1,7 +1,17 @@
-from fireREST.fmc import Connection
-from fireREST.fmc.devicecluster.ftddevicecluster import FtdDeviceCluster
+from typing import TYPE_CHECKING
+
+from fireREST.fmc import Connection, LazyResource, lazy_getattr
+
+if TYPE_CHECKING:
+    from fireREST.fmc.devicecluster.ftddevicecluster import FtdDeviceCluster
 
 
 class DeviceCluster:
+    ftddevicecluster: LazyResource['FtdDeviceCluster'] = LazyResource('.ftddevicecluster', 'FtdDeviceCluster')
+
     def __init__(self, conn: Connection):
-        self.ftddevicecluster = FtdDeviceCluster(conn)
+        self.conn = conn
+
+
+def __getattr__(name: str):
+    return lazy_getattr(__name__, name)
@@ -1,10 +1,12 @@
-from typing import Dict
+from typing import TYPE_CHECKING, Dict
 
 from fireREST import utils
 from fireREST.defaults import API_RELEASE_640, API_RELEASE_710
-from fireREST.fmc import Connection, Resource
-from fireREST.fmc.devicecluster.ftddevicecluster.clusterhealthmonitorsettings import ClusterHealthMonitorSettings
-from fireREST.fmc.devicecluster.ftddevicecluster.operational import Operational
+from fireREST.fmc import LazyResource, Resource, lazy_getattr
+
+if TYPE_CHECKING:
+    from fireREST.fmc.devicecluster.ftddevicecluster.clusterhealthmonitorsettings import ClusterHealthMonitorSettings
+    from fireREST.fmc.devicecluster.ftddevicecluster.operational import Operational
 
 
 class FtdDeviceCluster(Resource):
@@ -39,12 +41,16 @@ class FtdDeviceCluster(Resource):
     MINIMUM_VERSION_REQUIRED_DELETE = API_RELEASE_710
     SUPPORTED_PARAMS = ['skip_control_readiness']
 
-    def __init__(self, conn: Connection):
-        super().__init__(conn)
-        self.clusterhealthmonitorsettings = ClusterHealthMonitorSettings(conn)
-        self.operational = Operational(conn)
+    clusterhealthmonitorsettings: LazyResource['ClusterHealthMonitorSettings'] = LazyResource(
+        '.clusterhealthmonitorsettings', 'ClusterHealthMonitorSettings'
+    )
+    operational: LazyResource['Operational'] = LazyResource('.operational', 'Operational')
 
     @utils.minimum_version_required(version=API_RELEASE_710)
     def readiness_check(self, data: Dict, skip_control_readiness=None, params=None):
         url = self.url(path='/deviceclusters/ftdclusterreadinesscheck')
         return self.conn.post(url=url, data=data, params=params)
+
+
+def __getattr__(name: str):
+    return lazy_getattr(__name__, name)
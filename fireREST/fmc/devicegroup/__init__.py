@@ -1,7 +1,17 @@
-from fireREST.fmc import Connection
-from fireREST.fmc.devicegroup.devicegrouprecord import DeviceGroupRecord
+from typing import TYPE_CHECKING
+
+from fireREST.fmc import Connection, LazyResource, lazy_getattr
+
+if TYPE_CHECKING:
+    from fireREST.fmc.devicegroup.devicegrouprecord import DeviceGroupRecord
 
 
 class DeviceGroup:
+    devicegrouprecord: LazyResource['DeviceGroupRecord'] = LazyResource('.devicegrouprecord', 'DeviceGroupRecord')
+
     def __init__(self, conn: Connection):
-        self.devicegrouprecord = DeviceGroupRecord(conn)
+        self.conn = conn
+
+
+def __getattr__(name: str):
+    return lazy_getattr(__name__, name)
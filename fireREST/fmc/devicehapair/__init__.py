@@ -1,7 +1,17 @@
-from fireREST.fmc import Connection
-from fireREST.fmc.devicehapair.ftddevicehapair import FtdHAPair
+from typing import TYPE_CHECKING
+
+from fireREST.fmc import Connection, LazyResource, lazy_getattr
+
+if TYPE_CHECKING:
+    from fireREST.fmc.devicehapair.ftddevicehapair import FtdHAPair
 
 
 class DeviceHAPair:
+    ftdhapair: LazyResource['FtdHAPair'] = LazyResource('.ftddevicehapair', 'FtdHAPair')
+
     def __init__(self, conn: Connection):
-        self.ftdhapair = FtdHAPair(conn)
+        self.conn = conn
+
+
+def __getattr__(name: str):
+    return lazy_getattr(__name__, name)
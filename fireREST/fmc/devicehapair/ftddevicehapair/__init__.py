@@ -1,9 +1,13 @@
+from typing import TYPE_CHECKING
+
 from fireREST.defaults import API_RELEASE_623
-from fireREST.fmc import Connection, Resource
-from fireREST.fmc.devicehapair.ftddevicehapair.failoverinterfacemacaddressconfig import (
-    FailoverInterfaceMacAddressConfig,
-)
-from fireREST.fmc.devicehapair.ftddevicehapair.monitoredinterface import MonitoredInterface
+from fireREST.fmc import LazyResource, Resource, lazy_getattr
+
+if TYPE_CHECKING:
+    from fireREST.fmc.devicehapair.ftddevicehapair.failoverinterfacemacaddressconfig import (
+        FailoverInterfaceMacAddressConfig,
+    )
+    from fireREST.fmc.devicehapair.ftddevicehapair.monitoredinterface import MonitoredInterface
 
 
 class FtdHAPair(Resource):
@@ -36,8 +40,11 @@ class FtdHAPair(Resource):
     MINIMUM_VERSION_REQUIRED_DELETE = API_RELEASE_623
     SUPPORTED_PARAMS = ['name']
 
-    def __init__(self, conn: Connection):
-        super().__init__(conn)
+    failoverinterfacemacaddressconfig: LazyResource['FailoverInterfaceMacAddressConfig'] = LazyResource(
+        '.failoverinterfacemacaddressconfig', 'FailoverInterfaceMacAddressConfig'
+    )
+    monitoredinterface: LazyResource['MonitoredInterface'] = LazyResource('.monitoredinterface', 'MonitoredInterface')
+
 
-        self.failoverinterfacemacaddressconfig = FailoverInterfaceMacAddressConfig(conn)
-        self.monitoredinterface = MonitoredInterface(conn)
+def __getattr__(name: str):
+    return lazy_getattr(__name__, name)
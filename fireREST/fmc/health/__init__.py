@@ -1,21 +1,33 @@
-from fireREST.fmc import Connection
-from fireREST.fmc.health.alert import Alert
-from fireREST.fmc.health.csdac import Csdac
-from fireREST.fmc.health.metric import Metric
-from fireREST.fmc.health.pathmonitoredinterface import PathMonitoredInterface
-from fireREST.fmc.health.ravpngateway import RaVpnGateway
-from fireREST.fmc.health.ravpnsession import RaVpnSession
-from fireREST.fmc.health.tunnelstatus import TunnelStatus
-from fireREST.fmc.health.tunnelsummary import TunnelSummary
+from typing import TYPE_CHECKING
+
+from fireREST.fmc import Connection, LazyResource, lazy_getattr
+
+if TYPE_CHECKING:
+    from fireREST.fmc.health.alert import Alert
+    from fireREST.fmc.health.csdac import Csdac
+    from fireREST.fmc.health.metric import Metric
+    from fireREST.fmc.health.pathmonitoredinterface import PathMonitoredInterface
+    from fireREST.fmc.health.ravpngateway import RaVpnGateway
+    from fireREST.fmc.health.ravpnsession import RaVpnSession
+    from fireREST.fmc.health.tunnelstatus import TunnelStatus
+    from fireREST.fmc.health.tunnelsummary import TunnelSummary
 
 
 class Health:
+    alert: LazyResource['Alert'] = LazyResource('.alert', 'Alert')
+    csdac: LazyResource['Csdac'] = LazyResource('.csdac', 'Csdac')
+    metric: LazyResource['Metric'] = LazyResource('.metric', 'Metric')
+    pathmonitoredinterface: LazyResource['PathMonitoredInterface'] = LazyResource(
+        '.pathmonitoredinterface', 'PathMonitoredInterface'
+    )
+    ravpngateway: LazyResource['RaVpnGateway'] = LazyResource('.ravpngateway', 'RaVpnGateway')
+    ravpnsession: LazyResource['RaVpnSession'] = LazyResource('.ravpnsession', 'RaVpnSession')
+    tunnelstatus: LazyResource['TunnelStatus'] = LazyResource('.tunnelstatus', 'TunnelStatus')
+    tunnelsummary: LazyResource['TunnelSummary'] = LazyResource('.tunnelsummary', 'TunnelSummary')
+
     def __init__(self, conn: Connection):
-        self.alert = Alert(conn)
-        self.csdac = Csdac(conn)
-        self.metric = Metric(conn)
-        self.pathmonitoredinterface = PathMonitoredInterface(conn)
-        self.ravpngateway = RaVpnGateway(conn)
-        self.ravpnsession = RaVpnSession(conn)
-        self.tunnelstatus = TunnelStatus(conn)
-        self.tunnelsummary = TunnelSummary(conn)
+        self.conn = conn
+
+
+def __getattr__(name: str):
+    return lazy_getattr(__name__, name)
@@ -1,7 +1,11 @@
+from typing import TYPE_CHECKING
+
 from fireREST import utils
 from fireREST.defaults import API_RELEASE_710
-from fireREST.fmc import Connection, Resource
-from fireREST.fmc.health.tunnelstatus.tunneldetails import TunnelDetails
+from fireREST.fmc import LazyResource, Resource, lazy_getattr
+
+if TYPE_CHECKING:
+    from fireREST.fmc.health.tunnelstatus.tunneldetails import TunnelDetails
 
 
 class TunnelStatus(Resource):
@@ -28,10 +32,12 @@ class TunnelStatus(Resource):
     SUPPORTED_FILTERS = ['device_id', 'deployed_status', 'sort_by', 'status', 'vpn_topology_id']
     MINIMUM_VERSION_REQUIRED_GET = API_RELEASE_710
 
-    def __init__(self, conn: Connection):
-        super().__init__(conn)
-        self.tunneldetails = TunnelDetails(conn)
+    tunneldetails: LazyResource['TunnelDetails'] = LazyResource('.tunneldetails', 'TunnelDetails')
 
     @utils.support_params
     def get(self, device_id=None, deployed_status=None, sort_by=None, status=None, vpn_topology_id=None, params=None):
         return super().get(params=params)
+
+
+def __getattr__(name: str):
+    return lazy_getattr(__name__, name)
@@ -1,9 +1,19 @@
-from fireREST.fmc import Connection
-from fireREST.fmc.integration.umbrella.datacenter import Datacenter
-from fireREST.fmc.integration.umbrella.tunneldeployment import TunnelDeployment
+from typing import TYPE_CHECKING
+
+from fireREST.fmc import Connection, LazyResource, lazy_getattr
+
+if TYPE_CHECKING:
+    from fireREST.fmc.integration.umbrella.datacenter import Datacenter
+    from fireREST.fmc.integration.umbrella.tunneldeployment import TunnelDeployment
 
 
 class Umbrella:
+    datacenter: LazyResource['Datacenter'] = LazyResource('.datacenter', 'Datacenter')
+    tunneldeployment: LazyResource['TunnelDeployment'] = LazyResource('.tunneldeployment', 'TunnelDeployment')
+
     def __init__(self, conn: Connection):
-        self.datacenter = Datacenter(conn)
-        self.tunneldeployment = TunnelDeployment(conn)
+        self.conn = conn
+
+
+def __getattr__(name: str):
+    return lazy_getattr(__name__, name)
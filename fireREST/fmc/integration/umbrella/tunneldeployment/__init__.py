@@ -1,6 +1,10 @@
+from typing import TYPE_CHECKING
+
 from fireREST.defaults import API_RELEASE_730
-from fireREST.fmc import Connection, Resource
-from fireREST.fmc.integration.umbrella.tunneldeployment.transcript import Transcript
+from fireREST.fmc import LazyResource, Resource, lazy_getattr
+
+if TYPE_CHECKING:
+    from fireREST.fmc.integration.umbrella.tunneldeployment.transcript import Transcript
 
 
 class TunnelDeployment(Resource):
@@ -20,7 +24,8 @@ class TunnelDeployment(Resource):
     MINIMUM_VERSION_REQUIRED_CREATE = API_RELEASE_730
     MINIMUM_VERSION_REQUIRED_GET = API_RELEASE_730
 
-    def __init__(self, conn: Connection):
-        super().__init__(conn)
+    transcript: LazyResource['Transcript'] = LazyResource('.transcript', 'Transcript')
+
 
-        self.transcript = Transcript(conn)
+def __getattr__(name: str):
+    return lazy_getattr(__name__, name)
@@ -1,9 +1,19 @@
-from fireREST.fmc import Connection
-from fireREST.fmc.intelligence.taxiiconfig import TaxiiConfig
-from fireREST.fmc.intelligence.tid import Tid
+from typing import TYPE_CHECKING
+
+from fireREST.fmc import Connection, LazyResource, lazy_getattr
+
+if TYPE_CHECKING:
+    from fireREST.fmc.intelligence.taxiiconfig import TaxiiConfig
+    from fireREST.fmc.intelligence.tid import Tid
 
 
 class Intelligence:
+    taxiiconfig: LazyResource['TaxiiConfig'] = LazyResource('.taxiiconfig', 'TaxiiConfig')
+    tid: LazyResource['Tid'] = LazyResource('.tid', 'Tid')
+
     def __init__(self, conn: Connection):
-        self.taxiiconfig = TaxiiConfig(conn)
-        self.tid = Tid(conn)
+        self.conn = conn
+
+
+def __getattr__(name: str):
+    return lazy_getattr(__name__, name)
@@ -1,9 +1,19 @@
-from fireREST.fmc import Connection
-from fireREST.fmc.intelligence.taxiiconfig.collection import Collection
-from fireREST.fmc.intelligence.taxiiconfig.discoveryinfo import DiscoveryInfo
+from typing import TYPE_CHECKING
+
+from fireREST.fmc import Connection, LazyResource, lazy_getattr
+
+if TYPE_CHECKING:
+    from fireREST.fmc.intelligence.taxiiconfig.collection import Collection
+    from fireREST.fmc.intelligence.taxiiconfig.discoveryinfo import DiscoveryInfo
 
 
 class TaxiiConfig:
+    collection: LazyResource['Collection'] = LazyResource('.collection', 'Collection')
+    discoveryinfo: LazyResource['DiscoveryInfo'] = LazyResource('.discoveryinfo', 'DiscoveryInfo')
+
     def __init__(self, conn: Connection):
-        self.collection = Collection(conn)
-        self.discoveryinfo = DiscoveryInfo(conn)
+        self.conn = conn
+
+
+def __getattr__(name: str):
+    return lazy_getattr(__name__, name)
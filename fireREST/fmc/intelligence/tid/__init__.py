@@ -1,17 +1,27 @@
-from fireREST.fmc import Connection
-from fireREST.fmc.intelligence.tid.element import Element
-from fireREST.fmc.intelligence.tid.incident import Incident
-from fireREST.fmc.intelligence.tid.indicator import Indicator
-from fireREST.fmc.intelligence.tid.observable import Observable
-from fireREST.fmc.intelligence.tid.setting import Setting
-from fireREST.fmc.intelligence.tid.source import Source
+from typing import TYPE_CHECKING
+
+from fireREST.fmc import Connection, LazyResource, lazy_getattr
+
+if TYPE_CHECKING:
+    from fireREST.fmc.intelligence.tid.element import Element
+    from fireREST.fmc.intelligence.tid.incident import Incident
+    from fireREST.fmc.intelligence.tid.indicator import Indicator
+    from fireREST.fmc.intelligence.tid.observable import Observable
+    from fireREST.fmc.intelligence.tid.setting import Setting
+    from fireREST.fmc.intelligence.tid.source import Source
 
 
 class Tid:
+    element: LazyResource['Element'] = LazyResource('.element', 'Element')
+    incident: LazyResource['Incident'] = LazyResource('.incident', 'Incident')
+    indicator: LazyResource['Indicator'] = LazyResource('.indicator', 'Indicator')
+    observable: LazyResource['Observable'] = LazyResource('.observable', 'Observable')
+    setting: LazyResource['Setting'] = LazyResource('.setting', 'Setting')
+    source: LazyResource['Source'] = LazyResource('.source', 'Source')
+
     def __init__(self, conn: Connection):
-        self.element = Element(conn)
-        self.incident = Incident(conn)
-        self.indicator = Indicator(conn)
-        self.observable = Observable(conn)
-        self.setting = Setting(conn)
-        self.source = Source(conn)
+        self.conn = conn
+
+
+def __getattr__(name: str):
+    return lazy_getattr(__name__, name)
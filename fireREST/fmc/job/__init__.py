@@ -1,7 +1,17 @@
-from fireREST.fmc import Connection
-from fireREST.fmc.job.taskstatus import TaskStatus
+from typing import TYPE_CHECKING
+
+from fireREST.fmc import Connection, LazyResource, lazy_getattr
+
+if TYPE_CHECKING:
+    from fireREST.fmc.job.taskstatus import TaskStatus
 
 
 class Job:
+    taskstatus: LazyResource['TaskStatus'] = LazyResource('.taskstatus', 'TaskStatus')
+
     def __init__(self, conn: Connection):
-        self.taskstatus = TaskStatus(conn)
+        self.conn = conn
+
+
+def __getattr__(name: str):
+    return lazy_getattr(__name__, name)
@@ -1,9 +1,19 @@
-from fireREST.fmc import Connection
-from fireREST.fmc.license.devicelicense import DeviceLicense
-from fireREST.fmc.license.smartlicense import SmartLicense
+from typing import TYPE_CHECKING
+
+from fireREST.fmc import Connection, LazyResource, lazy_getattr
+
+if TYPE_CHECKING:
+    from fireREST.fmc.license.devicelicense import DeviceLicense
+    from fireREST.fmc.license.smartlicense import SmartLicense
 
 
 class License:
+    devicelicense: LazyResource['DeviceLicense'] = LazyResource('.devicelicense', 'DeviceLicense')
+    smartlicense: LazyResource['SmartLicense'] = LazyResource('.smartlicense', 'SmartLicense')
+
     def __init__(self, conn: Connection):
-        self.devicelicense = DeviceLicense(conn)
-        self.smartlicense = SmartLicense(conn)
+        self.conn = conn
+
+
+def __getattr__(name: str):
+    return lazy_getattr(__name__, name)
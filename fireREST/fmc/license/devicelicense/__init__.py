@@ -29,3 +29,4 @@ class DeviceLicense(Resource):
     PATH = '/license/devicelicenses/{uuid}'
     MINIMUM_VERSION_REQUIRED_GET = API_RELEASE_720
     MINIMUM_VERSION_REQUIRED_UPDATE = API_RELEASE_720
+    BULK_OPERATIONS = ['update']
@@ -1,9 +1,19 @@
-from fireREST.fmc import Connection
-from fireREST.fmc.netmap.host import Host
-from fireREST.fmc.netmap.vulnerability import Vulnerability
+from typing import TYPE_CHECKING
+
+from fireREST.fmc import Connection, LazyResource, lazy_getattr
+
+if TYPE_CHECKING:
+    from fireREST.fmc.netmap.host import Host
+    from fireREST.fmc.netmap.vulnerability import Vulnerability
 
 
 class NetMap:
+    host: LazyResource['Host'] = LazyResource('.host', 'Host')
+    vulnerability: LazyResource['Vulnerability'] = LazyResource('.vulnerability', 'Vulnerability')
+
     def __init__(self, conn: Connection):
-        self.host = Host(conn)
-        self.vulnerability = Vulnerability(conn)
+        self.conn = conn
+
+
+def __getattr__(name: str):
+    return lazy_getattr(__name__, name)
@@ -35,6 +35,7 @@ class Host(Resource):
     MINIMUM_VERSION_REQUIRED_CREATE = API_RELEASE_710
     MINIMUM_VERSION_REQUIRED_GET = API_RELEASE_710
     MINIMUM_VERSION_REQUIRED_DELETE = API_RELEASE_710
+    BULK_OPERATIONS = ['create']
 
     @utils.support_params
     def get(self, uuid: Optional[str] = None, ip_address: Optional[str] = None, params: Optional[Dict] = None):
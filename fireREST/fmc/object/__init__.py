@@ -1,217 +1,277 @@
-from fireREST.fmc import Connection
-from fireREST.fmc.object.anyconnectcustomattribute import AnyconnectCustomAttribute
-from fireREST.fmc.object.azureadreaml import AzureAdRealm
-from fireREST.fmc.object.azureadstatus import AzureAdStatus
-from fireREST.fmc.object.ciphersuitelist import CipherSuiteList
-from fireREST.fmc.object.customsiiplist import CustomSiIpList
-from fireREST.fmc.object.customsiiplistdownload import CustomSiIpListDownload
-from fireREST.fmc.object.customsiurllist import CustomSiUrlList
-from fireREST.fmc.object.customsiurllistdownload import CustomSiUrlListDownload
-from fireREST.fmc.object.distinguishedname import DistinguishedName
-from fireREST.fmc.object.distinguishednamegroup import DistinguishedNameGroup
-from fireREST.fmc.object.externalcacertificate import ExternalCaCertificate
-from fireREST.fmc.object.externalcacertificategroup import ExternalCaCertificateGroup
-from fireREST.fmc.object.externalcertificate import ExternalCertificate
-from fireREST.fmc.object.externalcertificategroup import ExternalCertificateGroup
-from fireREST.fmc.object.filecategory import FileCategory
-from fireREST.fmc.object.filetype import FileType
-from fireREST.fmc.object.internalcertgroup import InternalCertGroup
-from fireREST.fmc.object.networkaddressoverride import NetworkAddressOverride
-from fireREST.fmc.object.ntpserver import NtpServer
-from fireREST.fmc.object.resourceprofile import ResourceProfile
-from fireREST.fmc.object.secureclientcustomization import SecureClientCustomization
-from fireREST.fmc.object.testazureadream import TestAzureAdRealm
-from fireREST.fmc.object.anyconnectexternalbrowserpackage import AnyconnectExternalBrowserPackage
-from fireREST.fmc.object.anyconnectpackage import AnyconnectPackage
-from fireREST.fmc.object.anyconnectprofile import AnyconnectProfile
-from fireREST.fmc.object.bfdtemplate import BfdTemplate
-from fireREST.fmc.object.dhcpipv6pool import DhcpIpv6Pool
-from fireREST.fmc.object.internalca import InternalCa
-from fireREST.fmc.object.internalcertificate import InternalCertificate
-from fireREST.fmc.object.anyprotocolportobject import AnyProtocolPortObject
-from fireREST.fmc.object.application import Application
-from fireREST.fmc.object.applicationcategory import ApplicationCategory
-from fireREST.fmc.object.applicationfilter import ApplicationFilter
-from fireREST.fmc.object.applicationproductivities import ApplicationProductivity
-from fireREST.fmc.object.applicationrisk import ApplicationRisk
-from fireREST.fmc.object.applicationtag import ApplicationTag
-from fireREST.fmc.object.applicationtype import ApplicationType
-from fireREST.fmc.object.aspathlist import AsPathList
-from fireREST.fmc.object.certenrollment import CertEnrollment
-from fireREST.fmc.object.certificatemap import CertificateMap
-from fireREST.fmc.object.communitylist import CommunityList
-from fireREST.fmc.object.continent import Continent
-from fireREST.fmc.object.country import Country
-from fireREST.fmc.object.dnsservergroup import DnsServerGroup
-from fireREST.fmc.object.dynamicobject import DynamicObject
-from fireREST.fmc.object.endpointdevicetype import EndpointDeviceType
-from fireREST.fmc.object.expandedcommunitylist import ExpandedCommunityList
-from fireREST.fmc.object.extendedaccesslist import ExtendedAccessList
-from fireREST.fmc.object.fqdn import Fqdn
-from fireREST.fmc.object.geolocation import GeoLocation
-from fireREST.fmc.object.globaltimezone import GlobalTimeZone
-from fireREST.fmc.object.grouppolicy import GroupPolicy
-from fireREST.fmc.object.host import Host
-from fireREST.fmc.object.hostscanpackage import HostscanPackage
-from fireREST.fmc.object.icmpv4object import Icmpv4Object
-from fireREST.fmc.object.icmpv6object import Icmpv6Object
-from fireREST.fmc.object.ikev1ipsecproposal import Ikev1IpsecProposal
-from fireREST.fmc.object.ikev1policy import Ikev1Policy
-from fireREST.fmc.object.ikev2ipsecproposal import Ikev2IpsecProposal
-from fireREST.fmc.object.ikev2policy import Ikev2Policy
-from fireREST.fmc.object.interface import Interface
-from fireREST.fmc.object.interfacegroup import InterfaceGroup
-from fireREST.fmc.object.intrusionrule import IntrusionRule
-from fireREST.fmc.object.intrusionrulegroup import IntrusionRuleGroup
-from fireREST.fmc.object.ipv4addresspool import Ipv4AddressPool
-from fireREST.fmc.object.ipv4prefixlist import Ipv4PrefixList
-from fireREST.fmc.object.ipv6addresspool import Ipv6AddressPool
-from fireREST.fmc.object.ipv6prefixlist import Ipv6PrefixList
-from fireREST.fmc.object.isesecuritygrouptag import IseSecurityGroupTag
-from fireREST.fmc.object.keychain import KeyChain
-from fireREST.fmc.object.network import Network
-from fireREST.fmc.object.networkaddress import NetworkAddress
-from fireREST.fmc.object.networkgroup import NetworkGroup
-from fireREST.fmc.object.operational import Operational
-from fireREST.fmc.object.policylist import PolicyList
-from fireREST.fmc.object.port import Port
-from fireREST.fmc.object.portobjectgroup import PortObjectGroup
-from fireREST.fmc.object.protocolportobject import ProtocolPortObject
-from fireREST.fmc.object.radiusservergroup import RadiusServerGroup
-from fireREST.fmc.object.range import Range
-from fireREST.fmc.object.realm import Realm
-from fireREST.fmc.object.realmuser import RealmUser
-from fireREST.fmc.object.realmusergroup import RealmUserGroup
-from fireREST.fmc.object.routemap import RouteMap
-from fireREST.fmc.object.securitygrouptag import SecurityGroupTag
-from fireREST.fmc.object.securityzone import SecurityZone
-from fireREST.fmc.object.sidnsfeed import SiDnsFeed
-from fireREST.fmc.object.sidnslist import SiDnsList
-from fireREST.fmc.object.sinetworkfeed import SiNetworkFeed
-from fireREST.fmc.object.sinetworklist import SiNetworkList
-from fireREST.fmc.object.sinkhole import Sinkhole
-from fireREST.fmc.object.siurlfeed import SiUrlFeed
-from fireREST.fmc.object.siurllist import SiUrlList
-from fireREST.fmc.object.slamonitor import SlaMonitor
-from fireREST.fmc.object.ssoserver import SsoServer
-from fireREST.fmc.object.standardaccesslist import StandardAccessList
-from fireREST.fmc.object.standardcommunitylist import StandardCommunityList
-from fireREST.fmc.object.timerange import Timerange
-from fireREST.fmc.object.timezone import Timezone
-from fireREST.fmc.object.tunneltag import TunnelTag
-from fireREST.fmc.object.url import Url
-from fireREST.fmc.object.urlcategory import UrlCategory
-from fireREST.fmc.object.urlgroup import UrlGroup
-from fireREST.fmc.object.variableset import VariableSet
-from fireREST.fmc.object.vlangrouptag import VlanGroupTag
-from fireREST.fmc.object.vlantag import VlanTag
+from typing import TYPE_CHECKING, Iterable, List, Optional
+
+from fireREST.fmc import Connection, LazyResource, Resource, lazy_getattr, resolve_names
+
+if TYPE_CHECKING:
+    from fireREST.fmc.object.anyconnectcustomattribute import AnyconnectCustomAttribute
+    from fireREST.fmc.object.anyconnectexternalbrowserpackage import AnyconnectExternalBrowserPackage
+    from fireREST.fmc.object.anyconnectpackage import AnyconnectPackage
+    from fireREST.fmc.object.anyconnectprofile import AnyconnectProfile
+    from fireREST.fmc.object.anyprotocolportobject import AnyProtocolPortObject
+    from fireREST.fmc.object.application import Application
+    from fireREST.fmc.object.applicationcategory import ApplicationCategory
+    from fireREST.fmc.object.applicationfilter import ApplicationFilter
+    from fireREST.fmc.object.applicationproductivities import ApplicationProductivity
+    from fireREST.fmc.object.applicationrisk import ApplicationRisk
+    from fireREST.fmc.object.applicationtag import ApplicationTag
+    from fireREST.fmc.object.applicationtype import ApplicationType
+    from fireREST.fmc.object.aspathlist import AsPathList
+    from fireREST.fmc.object.azureadreaml import AzureAdRealm
+    from fireREST.fmc.object.azureadstatus import AzureAdStatus
+    from fireREST.fmc.object.bfdtemplate import BfdTemplate
+    from fireREST.fmc.object.certenrollment import CertEnrollment
+    from fireREST.fmc.object.certificatemap import CertificateMap
+    from fireREST.fmc.object.ciphersuitelist import CipherSuiteList
+    from fireREST.fmc.object.communitylist import CommunityList
+    from fireREST.fmc.object.continent import Continent
+    from fireREST.fmc.object.country import Country
+    from fireREST.fmc.object.customsiiplist import CustomSiIpList
+    from fireREST.fmc.object.customsiiplistdownload import CustomSiIpListDownload
+    from fireREST.fmc.object.customsiurllist import CustomSiUrlList
+    from fireREST.fmc.object.customsiurllistdownload import CustomSiUrlListDownload
+    from fireREST.fmc.object.dhcpipv6pool import DhcpIpv6Pool
+    from fireREST.fmc.object.distinguishedname import DistinguishedName
+    from fireREST.fmc.object.distinguishednamegroup import DistinguishedNameGroup
+    from fireREST.fmc.object.dnsservergroup import DnsServerGroup
+    from fireREST.fmc.object.dynamicobject import DynamicObject
+    from fireREST.fmc.object.endpointdevicetype import EndpointDeviceType
+    from fireREST.fmc.object.expandedcommunitylist import ExpandedCommunityList
+    from fireREST.fmc.object.extendedaccesslist import ExtendedAccessList
+    from fireREST.fmc.object.externalcacertificate import ExternalCaCertificate
+    from fireREST.fmc.object.externalcacertificategroup import ExternalCaCertificateGroup
+    from fireREST.fmc.object.externalcertificate import ExternalCertificate
+    from fireREST.fmc.object.externalcertificategroup import ExternalCertificateGroup
+    from fireREST.fmc.object.filecategory import FileCategory
+    from fireREST.fmc.object.filetype import FileType
+    from fireREST.fmc.object.fqdn import Fqdn
+    from fireREST.fmc.object.geolocation import GeoLocation
+    from fireREST.fmc.object.globaltimezone import GlobalTimeZone
+    from fireREST.fmc.object.grouppolicy import GroupPolicy
+    from fireREST.fmc.object.host import Host
+    from fireREST.fmc.object.hostscanpackage import HostscanPackage
+    from fireREST.fmc.object.icmpv4object import Icmpv4Object
+    from fireREST.fmc.object.icmpv6object import Icmpv6Object
+    from fireREST.fmc.object.ikev1ipsecproposal import Ikev1IpsecProposal
+    from fireREST.fmc.object.ikev1policy import Ikev1Policy
+    from fireREST.fmc.object.ikev2ipsecproposal import Ikev2IpsecProposal
+    from fireREST.fmc.object.ikev2policy import Ikev2Policy
+    from fireREST.fmc.object.interface import Interface
+    from fireREST.fmc.object.interfacegroup import InterfaceGroup
+    from fireREST.fmc.object.internalca import InternalCa
+    from fireREST.fmc.object.internalcertgroup import InternalCertGroup
+    from fireREST.fmc.object.internalcertificate import InternalCertificate
+    from fireREST.fmc.object.intrusionrule import IntrusionRule
+    from fireREST.fmc.object.intrusionrulegroup import IntrusionRuleGroup
+    from fireREST.fmc.object.ipv4addresspool import Ipv4AddressPool
+    from fireREST.fmc.object.ipv4prefixlist import Ipv4PrefixList
+    from fireREST.fmc.object.ipv6addresspool import Ipv6AddressPool
+    from fireREST.fmc.object.ipv6prefixlist import Ipv6PrefixList
+    from fireREST.fmc.object.isesecuritygrouptag import IseSecurityGroupTag
+    from fireREST.fmc.object.keychain import KeyChain
+    from fireREST.fmc.object.network import Network
+    from fireREST.fmc.object.networkaddress import NetworkAddress
+    from fireREST.fmc.object.networkaddressoverride import NetworkAddressOverride
+    from fireREST.fmc.object.networkgroup import NetworkGroup
+    from fireREST.fmc.object.ntpserver import NtpServer
+    from fireREST.fmc.object.operational import Operational
+    from fireREST.fmc.object.policylist import PolicyList
+    from fireREST.fmc.object.port import Port
+    from fireREST.fmc.object.portobjectgroup import PortObjectGroup
+    from fireREST.fmc.object.protocolportobject import ProtocolPortObject
+    from fireREST.fmc.object.radiusservergroup import RadiusServerGroup
+    from fireREST.fmc.object.range import Range
+    from fireREST.fmc.object.realm import Realm
+    from fireREST.fmc.object.realmuser import RealmUser
+    from fireREST.fmc.object.realmusergroup import RealmUserGroup
+    from fireREST.fmc.object.resourceprofile import ResourceProfile
+    from fireREST.fmc.object.routemap import RouteMap
+    from fireREST.fmc.object.secureclientcustomization import SecureClientCustomization
+    from fireREST.fmc.object.securitygrouptag import SecurityGroupTag
+    from fireREST.fmc.object.securityzone import SecurityZone
+    from fireREST.fmc.object.sidnsfeed import SiDnsFeed
+    from fireREST.fmc.object.sidnslist import SiDnsList
+    from fireREST.fmc.object.sinetworkfeed import SiNetworkFeed
+    from fireREST.fmc.object.sinetworklist import SiNetworkList
+    from fireREST.fmc.object.sinkhole import Sinkhole
+    from fireREST.fmc.object.siurlfeed import SiUrlFeed
+    from fireREST.fmc.object.siurllist import SiUrlList
+    from fireREST.fmc.object.slamonitor import SlaMonitor
+    from fireREST.fmc.object.ssoserver import SsoServer
+    from fireREST.fmc.object.standardaccesslist import StandardAccessList
+    from fireREST.fmc.object.standardcommunitylist import StandardCommunityList
+    from fireREST.fmc.object.testazureadream import TestAzureAdRealm
+    from fireREST.fmc.object.timerange import Timerange
+    from fireREST.fmc.object.timezone import Timezone
+    from fireREST.fmc.object.tunneltag import TunnelTag
+    from fireREST.fmc.object.url import Url
+    from fireREST.fmc.object.urlcategory import UrlCategory
+    from fireREST.fmc.object.urlgroup import UrlGroup
+    from fireREST.fmc.object.variableset import VariableSet
+    from fireREST.fmc.object.vlangrouptag import VlanGroupTag
+    from fireREST.fmc.object.vlantag import VlanTag
 
 
 class Object:
+    anyprotocolportobject: LazyResource['AnyProtocolPortObject'] = LazyResource(
+        '.anyprotocolportobject', 'AnyProtocolPortObject'
+    )
+    anyconnectcustomattribute: LazyResource['AnyconnectCustomAttribute'] = LazyResource(
+        '.anyconnectcustomattribute', 'AnyconnectCustomAttribute'
+    )
+    anyconnectexternalbrowserpackage: LazyResource['AnyconnectExternalBrowserPackage'] = LazyResource(
+        '.anyconnectexternalbrowserpackage', 'AnyconnectExternalBrowserPackage'
+    )
+    anyconnectpackage: LazyResource['AnyconnectPackage'] = LazyResource('.anyconnectpackage', 'AnyconnectPackage')
+    bfdtemplate: LazyResource['BfdTemplate'] = LazyResource('.bfdtemplate', 'BfdTemplate')
+    dhcpipv6pool: LazyResource['DhcpIpv6Pool'] = LazyResource('.dhcpipv6pool', 'DhcpIpv6Pool')
+    anyconnectprofile: LazyResource['AnyconnectProfile'] = LazyResource('.anyconnectprofile', 'AnyconnectProfile')
+    application: LazyResource['Application'] = LazyResource('.application', 'Application')
+    applicationcategory: LazyResource['ApplicationCategory'] = LazyResource(
+        '.applicationcategory', 'ApplicationCategory'
+    )
+    applicationfilter: LazyResource['ApplicationFilter'] = LazyResource('.applicationfilter', 'ApplicationFilter')
+    applicationproductivities: LazyResource['ApplicationProductivity'] = LazyResource(
+        '.applicationproductivities', 'ApplicationProductivity'
+    )
+    applicationrisk: LazyResource['ApplicationRisk'] = LazyResource('.applicationrisk', 'ApplicationRisk')
+    applicationtag: LazyResource['ApplicationTag'] = LazyResource('.applicationtag', 'ApplicationTag')
+    applicationtype: LazyResource['ApplicationType'] = LazyResource('.applicationtype', 'ApplicationType')
+    aspathlist: LazyResource['AsPathList'] = LazyResource('.aspathlist', 'AsPathList')
+    certenrollment: LazyResource['CertEnrollment'] = LazyResource('.certenrollment', 'CertEnrollment')
+    certificatemap: LazyResource['CertificateMap'] = LazyResource('.certificatemap', 'CertificateMap')
+    communitylist: LazyResource['CommunityList'] = LazyResource('.communitylist', 'CommunityList')
+    continent: LazyResource['Continent'] = LazyResource('.continent', 'Continent')
+    country: LazyResource['Country'] = LazyResource('.country', 'Country')
+    dnsservergroup: LazyResource['DnsServerGroup'] = LazyResource('.dnsservergroup', 'DnsServerGroup')
+    dynamicobject: LazyResource['DynamicObject'] = LazyResource('.dynamicobject', 'DynamicObject')
+    endpointdevicetype: LazyResource['EndpointDeviceType'] = LazyResource('.endpointdevicetype', 'EndpointDeviceType')
+    expandedcommunitylist: LazyResource['ExpandedCommunityList'] = LazyResource(
+        '.expandedcommunitylist', 'ExpandedCommunityList'
+    )
+    extendedaccesslist: LazyResource['ExtendedAccessList'] = LazyResource('.extendedaccesslist', 'ExtendedAccessList')
+    fqdn: LazyResource['Fqdn'] = LazyResource('.fqdn', 'Fqdn')
+    geolocation: LazyResource['GeoLocation'] = LazyResource('.geolocation', 'GeoLocation')
+    globaltimezone: LazyResource['GlobalTimeZone'] = LazyResource('.globaltimezone', 'GlobalTimeZone')
+    grouppolicy: LazyResource['GroupPolicy'] = LazyResource('.grouppolicy', 'GroupPolicy')
+    host: LazyResource['Host'] = LazyResource('.host', 'Host')
+    hostscanpackage: LazyResource['HostscanPackage'] = LazyResource('.hostscanpackage', 'HostscanPackage')
+    icmpv4object: LazyResource['Icmpv4Object'] = LazyResource('.icmpv4object', 'Icmpv4Object')
+    icmpv6object: LazyResource['Icmpv6Object'] = LazyResource('.icmpv6object', 'Icmpv6Object')
+    ikev1ipsecproposal: LazyResource['Ikev1IpsecProposal'] = LazyResource('.ikev1ipsecproposal', 'Ikev1IpsecProposal')
+    ikev1policy: LazyResource['Ikev1Policy'] = LazyResource('.ikev1policy', 'Ikev1Policy')
+    ikev2ipsecproposal: LazyResource['Ikev2IpsecProposal'] = LazyResource('.ikev2ipsecproposal', 'Ikev2IpsecProposal')
+    ikev2policy: LazyResource['Ikev2Policy'] = LazyResource('.ikev2policy', 'Ikev2Policy')
+    interface: LazyResource['Interface'] = LazyResource('.interface', 'Interface')
+    interfacegroup: LazyResource['InterfaceGroup'] = LazyResource('.interfacegroup', 'InterfaceGroup')
+    internalca: LazyResource['InternalCa'] = LazyResource('.internalca', 'InternalCa')
+    internalcertificate: LazyResource['InternalCertificate'] = LazyResource(
+        '.internalcertificate', 'InternalCertificate'
+    )
+    intrusionrule: LazyResource['IntrusionRule'] = LazyResource('.intrusionrule', 'IntrusionRule')
+    intrusionrulegroup: LazyResource['IntrusionRuleGroup'] = LazyResource('.intrusionrulegroup', 'IntrusionRuleGroup')
+    ipv4addresspool: LazyResource['Ipv4AddressPool'] = LazyResource('.ipv4addresspool', 'Ipv4AddressPool')
+    ipv4prefixlist: LazyResource['Ipv4PrefixList'] = LazyResource('.ipv4prefixlist', 'Ipv4PrefixList')
+    ipv6addresspool: LazyResource['Ipv6AddressPool'] = LazyResource('.ipv6addresspool', 'Ipv6AddressPool')
+    ipv6prefixlist: LazyResource['Ipv6PrefixList'] = LazyResource('.ipv6prefixlist', 'Ipv6PrefixList')
+    isesecuritygrouptag: LazyResource['IseSecurityGroupTag'] = LazyResource(
+        '.isesecuritygrouptag', 'IseSecurityGroupTag'
+    )
+    keychain: LazyResource['KeyChain'] = LazyResource('.keychain', 'KeyChain')
+    network: LazyResource['Network'] = LazyResource('.network', 'Network')
+    networkaddress: LazyResource['NetworkAddress'] = LazyResource('.networkaddress', 'NetworkAddress')
+    networkgroup: LazyResource['NetworkGroup'] = LazyResource('.networkgroup', 'NetworkGroup')
+    operational: LazyResource['Operational'] = LazyResource('.operational', 'Operational')
+    policylist: LazyResource['PolicyList'] = LazyResource('.policylist', 'PolicyList')
+    port: LazyResource['Port'] = LazyResource('.port', 'Port')
+    portobjectgroup: LazyResource['PortObjectGroup'] = LazyResource('.portobjectgroup', 'PortObjectGroup')
+    protocolportobject: LazyResource['ProtocolPortObject'] = LazyResource('.protocolportobject', 'ProtocolPortObject')
+    radiusservergroup: LazyResource['RadiusServerGroup'] = LazyResource('.radiusservergroup', 'RadiusServerGroup')
+    range: LazyResource['Range'] = LazyResource('.range', 'Range')
+    realm: LazyResource['Realm'] = LazyResource('.realm', 'Realm')
+    realmuser: LazyResource['RealmUser'] = LazyResource('.realmuser', 'RealmUser')
+    realmusergroup: LazyResource['RealmUserGroup'] = LazyResource('.realmusergroup', 'RealmUserGroup')
+    routemap: LazyResource['RouteMap'] = LazyResource('.routemap', 'RouteMap')
+    securitygrouptag: LazyResource['SecurityGroupTag'] = LazyResource('.securitygrouptag', 'SecurityGroupTag')
+    securityzone: LazyResource['SecurityZone'] = LazyResource('.securityzone', 'SecurityZone')
+    sidnsfeed: LazyResource['SiDnsFeed'] = LazyResource('.sidnsfeed', 'SiDnsFeed')
+    sidnslist: LazyResource['SiDnsList'] = LazyResource('.sidnslist', 'SiDnsList')
+    sinetworkfeed: LazyResource['SiNetworkFeed'] = LazyResource('.sinetworkfeed', 'SiNetworkFeed')
+    sinetworklist: LazyResource['SiNetworkList'] = LazyResource('.sinetworklist', 'SiNetworkList')
+    sinkhole: LazyResource['Sinkhole'] = LazyResource('.sinkhole', 'Sinkhole')
+    siurlfeed: LazyResource['SiUrlFeed'] = LazyResource('.siurlfeed', 'SiUrlFeed')
+    siurllist: LazyResource['SiUrlList'] = LazyResource('.siurllist', 'SiUrlList')
+    slamonitor: LazyResource['SlaMonitor'] = LazyResource('.slamonitor', 'SlaMonitor')
+    ssoserver: LazyResource['SsoServer'] = LazyResource('.ssoserver', 'SsoServer')
+    standardaccesslist: LazyResource['StandardAccessList'] = LazyResource('.standardaccesslist', 'StandardAccessList')
+    standardcommunitylist: LazyResource['StandardCommunityList'] = LazyResource(
+        '.standardcommunitylist', 'StandardCommunityList'
+    )
+    timerange: LazyResource['Timerange'] = LazyResource('.timerange', 'Timerange')
+    timezone: LazyResource['Timezone'] = LazyResource('.timezone', 'Timezone')
+    tunneltag: LazyResource['TunnelTag'] = LazyResource('.tunneltag', 'TunnelTag')
+    url: LazyResource['Url'] = LazyResource('.url', 'Url')
+    urlcategory: LazyResource['UrlCategory'] = LazyResource('.urlcategory', 'UrlCategory')
+    urlgroup: LazyResource['UrlGroup'] = LazyResource('.urlgroup', 'UrlGroup')
+    variableset: LazyResource['VariableSet'] = LazyResource('.variableset', 'VariableSet')
+    vlangrouptag: LazyResource['VlanGroupTag'] = LazyResource('.vlangrouptag', 'VlanGroupTag')
+    vlantag: LazyResource['VlanTag'] = LazyResource('.vlantag', 'VlanTag')
+    azureadream: LazyResource['AzureAdRealm'] = LazyResource('.azureadreaml', 'AzureAdRealm')
+    azureadstatus: LazyResource['AzureAdStatus'] = LazyResource('.azureadstatus', 'AzureAdStatus')
+    ciphersuitelist: LazyResource['CipherSuiteList'] = LazyResource('.ciphersuitelist', 'CipherSuiteList')
+    customsiiplist: LazyResource['CustomSiIpList'] = LazyResource('.customsiiplist', 'CustomSiIpList')
+    customsiiplistdownload: LazyResource['CustomSiIpListDownload'] = LazyResource(
+        '.customsiiplistdownload', 'CustomSiIpListDownload'
+    )
+    customsiurllist: LazyResource['CustomSiUrlList'] = LazyResource('.customsiurllist', 'CustomSiUrlList')
+    customsiurllistdownload: LazyResource['CustomSiUrlListDownload'] = LazyResource(
+        '.customsiurllistdownload', 'CustomSiUrlListDownload'
+    )
+    distinguishedname: LazyResource['DistinguishedName'] = LazyResource('.distinguishedname', 'DistinguishedName')
+    distinguishednamegroup: LazyResource['DistinguishedNameGroup'] = LazyResource(
+        '.distinguishednamegroup', 'DistinguishedNameGroup'
+    )
+    externalcacertificate: LazyResource['ExternalCaCertificate'] = LazyResource(
+        '.externalcacertificate', 'ExternalCaCertificate'
+    )
+    externalcacertificategroup: LazyResource['ExternalCaCertificateGroup'] = LazyResource(
+        '.externalcacertificategroup', 'ExternalCaCertificateGroup'
+    )
+    externalcertificate: LazyResource['ExternalCertificate'] = LazyResource(
+        '.externalcertificate', 'ExternalCertificate'
+    )
+    externalcertificategroup: LazyResource['ExternalCertificateGroup'] = LazyResource(
+        '.externalcertificategroup', 'ExternalCertificateGroup'
+    )
+    filecategory: LazyResource['FileCategory'] = LazyResource('.filecategory', 'FileCategory')
+    filetype: LazyResource['FileType'] = LazyResource('.filetype', 'FileType')
+    internalcertgroup: LazyResource['InternalCertGroup'] = LazyResource('.internalcertgroup', 'InternalCertGroup')
+    networkaddressoverride: LazyResource['NetworkAddressOverride'] = LazyResource(
+        '.networkaddressoverride', 'NetworkAddressOverride'
+    )
+    ntpserver: LazyResource['NtpServer'] = LazyResource('.ntpserver', 'NtpServer')
+    resourceprofile: LazyResource['ResourceProfile'] = LazyResource('.resourceprofile', 'ResourceProfile')
+    secureclientcustomization: LazyResource['SecureClientCustomization'] = LazyResource(
+        '.secureclientcustomization', 'SecureClientCustomization'
+    )
+    testazureadream: LazyResource['TestAzureAdRealm'] = LazyResource('.testazureadream', 'TestAzureAdRealm')
+
     def __init__(self, conn: Connection):
-        self.anyprotocolportobject = AnyProtocolPortObject(conn)
-        self.anyconnectcustomattribute = AnyconnectCustomAttribute(conn)
-        self.anyconnectexternalbrowserpackage = AnyconnectExternalBrowserPackage(conn)
-        self.anyconnectpackage = AnyconnectPackage(conn)
-        self.bfdtemplate = BfdTemplate(conn)
-        self.dhcpipv6pool = DhcpIpv6Pool(conn)
-        self.anyconnectprofile = AnyconnectProfile(conn)
-        self.application = Application(conn)
-        self.applicationcategory = ApplicationCategory(conn)
-        self.applicationfilter = ApplicationFilter(conn)
-        self.applicationproductivities = ApplicationProductivity(conn)
-        self.applicationrisk = ApplicationRisk(conn)
-        self.applicationtag = ApplicationTag(conn)
-        self.applicationtype = ApplicationType(conn)
-        self.aspathlist = AsPathList(conn)
-        self.certenrollment = CertEnrollment(conn)
-        self.certificatemap = CertificateMap(conn)
-        self.communitylist = CommunityList(conn)
-        self.continent = Continent(conn)
-        self.country = Country(conn)
-        self.dnsservergroup = DnsServerGroup(conn)
-        self.dynamicobject = DynamicObject(conn)
-        self.endpointdevicetype = EndpointDeviceType(conn)
-        self.expandedcommunitylist = ExpandedCommunityList(conn)
-        self.extendedaccesslist = ExtendedAccessList(conn)
-        self.fqdn = Fqdn(conn)
-        self.geolocation = GeoLocation(conn)
-        self.globaltimezone = GlobalTimeZone(conn)
-        self.grouppolicy = GroupPolicy(conn)
-        self.host = Host(conn)
-        self.hostscanpackage = HostscanPackage(conn)
-        self.icmpv4object = Icmpv4Object(conn)
-        self.icmpv6object = Icmpv6Object(conn)
-        self.ikev1ipsecproposal = Ikev1IpsecProposal(conn)
-        self.ikev1policy = Ikev1Policy(conn)
-        self.ikev2ipsecproposal = Ikev2IpsecProposal(conn)
-        self.ikev2policy = Ikev2Policy(conn)
-        self.interface = Interface(conn)
-        self.interfacegroup = InterfaceGroup(conn)
-        self.internalca = InternalCa(conn)
-        self.internalcertificate = InternalCertificate(conn)
-        self.intrusionrule = IntrusionRule(conn)
-        self.intrusionrulegroup = IntrusionRuleGroup(conn)
-        self.ipv4addresspool = Ipv4AddressPool(conn)
-        self.ipv4prefixlist = Ipv4PrefixList(conn)
-        self.ipv6addresspool = Ipv6AddressPool(conn)
-        self.ipv6prefixlist = Ipv6PrefixList(conn)
-        self.isesecuritygrouptag = IseSecurityGroupTag(conn)
-        self.keychain = KeyChain(conn)
-        self.network = Network(conn)
-        self.networkaddress = NetworkAddress(conn)
-        self.networkgroup = NetworkGroup(conn)
-        self.operational = Operational(conn)
-        self.policylist = PolicyList(conn)
-        self.port = Port(conn)
-        self.portobjectgroup = PortObjectGroup(conn)
-        self.protocolportobject = ProtocolPortObject(conn)
-        self.radiusservergroup = RadiusServerGroup(conn)
-        self.range = Range(conn)
-        self.realm = Realm(conn)
-        self.realmuser = RealmUser(conn)
-        self.realmusergroup = RealmUserGroup(conn)
-        self.routemap = RouteMap(conn)
-        self.securitygrouptag = SecurityGroupTag(conn)
-        self.securityzone = SecurityZone(conn)
-        self.sidnsfeed = SiDnsFeed(conn)
-        self.sidnslist = SiDnsList(conn)
-        self.sinetworkfeed = SiNetworkFeed(conn)
-        self.sinetworklist = SiNetworkList(conn)
-        self.sinkhole = Sinkhole(conn)
-        self.siurlfeed = SiUrlFeed(conn)
-        self.siurllist = SiUrlList(conn)
-        self.slamonitor = SlaMonitor(conn)
-        self.ssoserver = SsoServer(conn)
-        self.standardaccesslist = StandardAccessList(conn)
-        self.standardcommunitylist = StandardCommunityList(conn)
-        self.timerange = Timerange(conn)
-        self.timezone = Timezone(conn)
-        self.tunneltag = TunnelTag(conn)
-        self.url = Url(conn)
-        self.urlcategory = UrlCategory(conn)
-        self.urlgroup = UrlGroup(conn)
-        self.variableset = VariableSet(conn)
-        self.vlangrouptag = VlanGroupTag(conn)
-        self.vlantag = VlanTag(conn)
-        self.azureadream = AzureAdRealm(conn)
-        self.azureadstatus = AzureAdStatus(conn)
-        self.ciphersuitelist = CipherSuiteList(conn)
-        self.customsiiplist = CustomSiIpList(conn)
-        self.customsiiplistdownload = CustomSiIpListDownload(conn)
-        self.customsiurllist = CustomSiUrlList(conn)
-        self.customsiurllistdownload = CustomSiUrlListDownload(conn)
-        self.distinguishedname = DistinguishedName(conn)
-        self.distinguishednamegroup = DistinguishedNameGroup(conn)
-        self.externalcacertificate = ExternalCaCertificate(conn)
-        self.externalcacertificategroup = ExternalCaCertificateGroup(conn)
-        self.externalcertificate = ExternalCertificate(conn)
-        self.externalcertificategroup = ExternalCertificateGroup(conn)
-        self.filecategory = FileCategory(conn)
-        self.filetype = FileType(conn)
-        self.internalcertgroup = InternalCertGroup(conn)
-        self.networkaddressoverride = NetworkAddressOverride(conn)
-        self.ntpserver = NtpServer(conn)
-        self.resourceprofile = ResourceProfile(conn)
-        self.secureclientcustomization = SecureClientCustomization(conn)
-        self.testazureadream = TestAzureAdRealm(conn)
+        self.conn = conn
+
+    def resolve_names(self, names: Iterable[str], resources: Optional[List[Resource]] = None):
+        """Resolve names of network objects (network, host, range, fqdn and networkgroup) to references
+        (`id`, `name` and `type`) that can be used in payloads, e.g. as source or destination networks of
+        access rules. Two list operations are performed regardless of the number of names
+
+        :param names: names of network objects
+        :type names: Iterable[str]
+        :param resources: resources that are searched instead of `networkaddress` and `networkgroup`
+        :type resources: list, optional
+        :return: mapping of name to reference, names that cannot be resolved are listed in `missing` and `ambiguous`
+        :rtype: fireREST.fmc.NameResolution
+        """
+        return resolve_names(resources or [self.networkaddress, self.networkgroup], names)
+
+
+def __getattr__(name: str):
+    return lazy_getattr(__name__, name)
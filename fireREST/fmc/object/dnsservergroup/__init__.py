@@ -1,7 +1,11 @@
+from typing import TYPE_CHECKING
+
 from fireREST import utils
 from fireREST.defaults import API_RELEASE_630
-from fireREST.fmc import Resource, Connection
-from fireREST.fmc.object.dnsservergroup.override import Override
+from fireREST.fmc import LazyResource, Resource, lazy_getattr
+
+if TYPE_CHECKING:
+    from fireREST.fmc.object.dnsservergroup.override import Override
 
 
 class DnsServerGroup(Resource):
@@ -35,10 +39,12 @@ class DnsServerGroup(Resource):
 
     SUPPORTED_PARAMS = ['override_target_id']
 
-    def __init__(self, conn: Connection):
-        super().__init__(conn)
-        self.override = Override(conn)
+    override: LazyResource['Override'] = LazyResource('.override', 'Override')
 
     @utils.support_params
     def get(self, uuid=None, name=None, override_target_id=None, params=None):
         return super().get(uuid=uuid, name=name, params=params)
+
+
+def __getattr__(name: str):
+    return lazy_getattr(__name__, name)
@@ -1,6 +1,10 @@
+from typing import TYPE_CHECKING
+
 from fireREST.defaults import API_RELEASE_700
-from fireREST.fmc import Resource, Connection
-from fireREST.fmc.object.dynamicobject.mapping import Mapping
+from fireREST.fmc import LazyResource, Resource, lazy_getattr
+
+if TYPE_CHECKING:
+    from fireREST.fmc.object.dynamicobject.mapping import Mapping
 
 
 class DynamicObject(Resource):
@@ -35,7 +39,10 @@ class DynamicObject(Resource):
     MINIMUM_VERSION_REQUIRED_GET = API_RELEASE_700
     MINIMUM_VERSION_REQUIRED_UPDATE = API_RELEASE_700
     MINIMUM_VERSION_REQUIRED_DELETE = API_RELEASE_700
+    BULK_OPERATIONS = ['create', 'delete']
+
+    mapping: LazyResource['Mapping'] = LazyResource('.mapping', 'Mapping')
+
 
-    def __init__(self, conn: Connection):
-        super().__init__(conn)
-        self.mapping = Mapping(conn)
+def __getattr__(name: str):
+    return lazy_getattr(__name__, name)
@@ -1,4 +1,4 @@
-from fireREST.defaults import API_RELEASE_610
+from fireREST.defaults import API_RELEASE_610, API_RESPONSE_CACHE_TTL
 from fireREST.fmc import Resource
 
 
@@ -22,4 +22,6 @@ class EndpointDeviceType(Resource):
     """
 
     PATH = '/object/endpointdevicetypes/{uuid}'
+    CACHE_TTL = API_RESPONSE_CACHE_TTL
+    REFERENCE_DATA = True
     MINIMUM_VERSION_REQUIRED_GET = API_RELEASE_610
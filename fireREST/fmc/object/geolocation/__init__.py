@@ -1,4 +1,4 @@
-from fireREST.defaults import API_RELEASE_700, API_RELEASE_610
+from fireREST.defaults import API_RELEASE_700, API_RELEASE_610, API_RESPONSE_CACHE_TTL
 from fireREST.fmc import Resource
 
 
@@ -25,6 +25,7 @@ class GeoLocation(Resource):
     """
 
     PATH = '/object/geolocations/{uuid}'
+    CACHE_TTL = API_RESPONSE_CACHE_TTL
     MINIMUM_VERSION_REQUIRED_CREATE = API_RELEASE_700
     MINIMUM_VERSION_REQUIRED_GET = API_RELEASE_610
     MINIMUM_VERSION_REQUIRED_UPDATE = API_RELEASE_700
@@ -1,7 +1,11 @@
+from typing import TYPE_CHECKING
+
 from fireREST import utils
 from fireREST.defaults import API_RELEASE_610
-from fireREST.fmc import Resource, Connection
-from fireREST.fmc.object.host.override import Override
+from fireREST.fmc import LazyResource, Resource, lazy_getattr
+
+if TYPE_CHECKING:
+    from fireREST.fmc.object.host.override import Override
 
 
 class Host(Resource):
@@ -38,11 +42,14 @@ class Host(Resource):
 
     SUPPORTED_FILTERS = ['name_or_value', 'unused_only']
     SUPPORTED_PARAMS = ['override_target_id']
+    BULK_OPERATIONS = ['create', 'delete']
 
-    def __init__(self, conn: Connection):
-        super().__init__(conn)
-        self.override = Override(conn)
+    override: LazyResource['Override'] = LazyResource('.override', 'Override')
 
     @utils.support_params
     def get(self, uuid=None, name=None, name_or_value=None, unused_only=None, override_target_id=None, params=None):
         return super().get(uuid=uuid, name=name, params=params)
+
+
+def __getattr__(name: str):
+    return lazy_getattr(__name__, name)
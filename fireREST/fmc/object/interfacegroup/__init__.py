@@ -32,3 +32,4 @@ class InterfaceGroup(Resource):
     MINIMUM_VERSION_REQUIRED_GET = API_RELEASE_630
     MINIMUM_VERSION_REQUIRED_UPDATE = API_RELEASE_630
     MINIMUM_VERSION_REQUIRED_DELETE = API_RELEASE_630
+    BULK_OPERATIONS = ['create']
@@ -37,6 +37,7 @@ class IntrusionRule(Resource):
     MINIMUM_VERSION_REQUIRED_DELETE = API_RELEASE_700
 
     SUPPORTED_FILTERS = ['gid', 'sid', 'overrides', 'ips_policy', 'fts']
+    BULK_OPERATIONS = ['create', 'update', 'delete']
 
     @utils.support_params
     def get(self, uuid=None, name=None, gid=None, sid=None, overrides=None, ips_policy=None, fts=None, params=None):
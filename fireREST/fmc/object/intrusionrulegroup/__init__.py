@@ -35,6 +35,7 @@ class IntrusionRuleGroup(Resource):
     MINIMUM_VERSION_REQUIRED_DELETE = API_RELEASE_700
 
     SUPPORTED_FILTERS = ['name', 'current_security_level', 'show_only_parents', 'include_count']
+    BULK_OPERATIONS = ['create']
 
     @utils.support_params
     def get(
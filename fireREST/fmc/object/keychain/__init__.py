@@ -1,6 +1,10 @@
+from typing import TYPE_CHECKING
+
 from fireREST.defaults import API_RELEASE_640
-from fireREST.fmc import Resource, Connection
-from fireREST.fmc.object.keychain.override import Override
+from fireREST.fmc import LazyResource, Resource, lazy_getattr
+
+if TYPE_CHECKING:
+    from fireREST.fmc.object.keychain.override import Override
 
 
 class KeyChain(Resource):
@@ -32,7 +36,10 @@ class KeyChain(Resource):
     MINIMUM_VERSION_REQUIRED_GET = API_RELEASE_640
     MINIMUM_VERSION_REQUIRED_UPDATE = API_RELEASE_640
     MINIMUM_VERSION_REQUIRED_DELETE = API_RELEASE_640
+    BULK_OPERATIONS = ['create']
+
+    override: LazyResource['Override'] = LazyResource('.override', 'Override')
+
 
-    def __init__(self, conn: Connection):
-        super().__init__(conn)
-        self.override = Override(conn)
+def __getattr__(name: str):
+    return lazy_getattr(__name__, name)
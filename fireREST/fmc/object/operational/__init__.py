@@ -1,9 +1,19 @@
-from fireREST.fmc import Connection
-from fireREST.fmc.object.operational.findoverlaps import FindOverlaps
-from fireREST.fmc.object.operational.usage import Usage
+from typing import TYPE_CHECKING
+
+from fireREST.fmc import Connection, LazyResource, lazy_getattr
+
+if TYPE_CHECKING:
+    from fireREST.fmc.object.operational.findoverlaps import FindOverlaps
+    from fireREST.fmc.object.operational.usage import Usage
 
 
 class Operational:
+    findoverlaps: LazyResource['FindOverlaps'] = LazyResource('.findoverlaps', 'FindOverlaps')
+    usage: LazyResource['Usage'] = LazyResource('.usage', 'Usage')
+
     def __init__(self, conn: Connection):
-        self.findoverlaps = FindOverlaps(conn)
-        self.usage = Usage(conn)
+        self.conn = conn
+
+
+def __getattr__(name: str):
+    return lazy_getattr(__name__, name)
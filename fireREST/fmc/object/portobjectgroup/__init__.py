@@ -1,6 +1,10 @@
+from typing import TYPE_CHECKING
+
 from fireREST.defaults import API_RELEASE_610
-from fireREST.fmc import Resource, Connection
-from fireREST.fmc.object.portobjectgroup.override import Override
+from fireREST.fmc import LazyResource, Resource, lazy_getattr
+
+if TYPE_CHECKING:
+    from fireREST.fmc.object.portobjectgroup.override import Override
 
 
 class PortObjectGroup(Resource):
@@ -35,7 +39,10 @@ class PortObjectGroup(Resource):
     MINIMUM_VERSION_REQUIRED_GET = API_RELEASE_610
     MINIMUM_VERSION_REQUIRED_UPDATE = API_RELEASE_610
     MINIMUM_VERSION_REQUIRED_DELETE = API_RELEASE_610
+    BULK_OPERATIONS = ['create', 'delete']
+
+    override: LazyResource['Override'] = LazyResource('.override', 'Override')
+
 
-    def __init__(self, conn: Connection):
-        super().__init__(conn)
-        self.override = Override(conn)
+def __getattr__(name: str):
+    return lazy_getattr(__name__, name)
@@ -31,3 +31,4 @@ class RadiusServerGroup(Resource):
     MINIMUM_VERSION_REQUIRED_GET = API_RELEASE_700
     MINIMUM_VERSION_REQUIRED_UPDATE = API_RELEASE_720
     MINIMUM_VERSION_REQUIRED_DELETE = API_RELEASE_720
+    BULK_OPERATIONS = ['create']
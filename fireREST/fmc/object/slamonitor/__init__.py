@@ -30,3 +30,4 @@ class SlaMonitor(Resource):
     MINIMUM_VERSION_REQUIRED_GET = API_RELEASE_623
     MINIMUM_VERSION_REQUIRED_UPDATE = API_RELEASE_623
     MINIMUM_VERSION_REQUIRED_DELETE = API_RELEASE_623
+    BULK_OPERATIONS = ['create']
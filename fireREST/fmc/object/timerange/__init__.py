@@ -30,3 +30,4 @@ class Timerange(Resource):
     MINIMUM_VERSION_REQUIRED_GET = API_RELEASE_660
     MINIMUM_VERSION_REQUIRED_UPDATE = API_RELEASE_660
     MINIMUM_VERSION_REQUIRED_DELETE = API_RELEASE_660
+    BULK_OPERATIONS = ['create']
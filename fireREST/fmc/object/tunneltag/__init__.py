@@ -30,3 +30,4 @@ class TunnelTag(Resource):
     MINIMUM_VERSION_REQUIRED_GET = API_RELEASE_630
     MINIMUM_VERSION_REQUIRED_UPDATE = API_RELEASE_640
     MINIMUM_VERSION_REQUIRED_DELETE = API_RELEASE_640
+    BULK_OPERATIONS = ['create']
@@ -1,51 +1,69 @@
-from fireREST.fmc import Connection
-from fireREST.fmc.policy.accesspolicy import AccessPolicy
-from fireREST.fmc.policy.chassisplatformsettingspolicy import ChassisPlatformSettingsPolicy
-from fireREST.fmc.policy.decryptionpolicy import DecryptionPolicy
-from fireREST.fmc.policy.dnspolicy import DnsPolicy
-from fireREST.fmc.policy.dynamicaccesspolicy import DynamicAccessPolicy
-from fireREST.fmc.policy.filepolicy import FilePolicy
-from fireREST.fmc.policy.flexconfigpolicy import FlexConfigPolicy
-from fireREST.fmc.policy.ftdnatpolicy import FtdNatPolicy
-from fireREST.fmc.policy.ftdplatformsettingspolicy import FtdPlatformSettingsPolicy
-from fireREST.fmc.policy.ftds2svpn import FtdS2sVpn
-from fireREST.fmc.policy.healthpolicy import HealthPolicy
-from fireREST.fmc.policy.identitypolicy import IdentityPolicy
-from fireREST.fmc.policy.intrusionpolicy import IntrusionPolicy
-from fireREST.fmc.policy.natexemptrule import NatExemptRule
-from fireREST.fmc.policy.networkanalysispolicy import NetworkAnalysisPolicy
-from fireREST.fmc.policy.policylock import PolicyLock
-from fireREST.fmc.policy.prefilterpolicy import PrefilterPolicy
-from fireREST.fmc.policy.ravpn import RaVpn
-from fireREST.fmc.policy.snmpalert import SnmpAlert
-from fireREST.fmc.policy.syslogalert import SyslogAlert
-from fireREST.fmc.policy.umbrelladnspolicy import UmbrellaDnsPolicy
-from fireREST.fmc.policy.vpntunnelstatus import VpnTunnelStatus
-from fireREST.fmc.policy.zerotrustpolicy import ZeroTrustPolicy
+from typing import TYPE_CHECKING
+
+from fireREST.fmc import Connection, LazyResource, lazy_getattr
+
+if TYPE_CHECKING:
+    from fireREST.fmc.policy.accesspolicy import AccessPolicy
+    from fireREST.fmc.policy.chassisplatformsettingspolicy import ChassisPlatformSettingsPolicy
+    from fireREST.fmc.policy.decryptionpolicy import DecryptionPolicy
+    from fireREST.fmc.policy.dnspolicy import DnsPolicy
+    from fireREST.fmc.policy.dynamicaccesspolicy import DynamicAccessPolicy
+    from fireREST.fmc.policy.filepolicy import FilePolicy
+    from fireREST.fmc.policy.flexconfigpolicy import FlexConfigPolicy
+    from fireREST.fmc.policy.ftdnatpolicy import FtdNatPolicy
+    from fireREST.fmc.policy.ftdplatformsettingspolicy import FtdPlatformSettingsPolicy
+    from fireREST.fmc.policy.ftds2svpn import FtdS2sVpn
+    from fireREST.fmc.policy.healthpolicy import HealthPolicy
+    from fireREST.fmc.policy.identitypolicy import IdentityPolicy
+    from fireREST.fmc.policy.intrusionpolicy import IntrusionPolicy
+    from fireREST.fmc.policy.natexemptrule import NatExemptRule
+    from fireREST.fmc.policy.networkanalysispolicy import NetworkAnalysisPolicy
+    from fireREST.fmc.policy.policylock import PolicyLock
+    from fireREST.fmc.policy.prefilterpolicy import PrefilterPolicy
+    from fireREST.fmc.policy.ravpn import RaVpn
+    from fireREST.fmc.policy.snmpalert import SnmpAlert
+    from fireREST.fmc.policy.syslogalert import SyslogAlert
+    from fireREST.fmc.policy.umbrelladnspolicy import UmbrellaDnsPolicy
+    from fireREST.fmc.policy.vpntunnelstatus import VpnTunnelStatus
+    from fireREST.fmc.policy.zerotrustpolicy import ZeroTrustPolicy
 
 
 class Policy:
+    accesspolicy: LazyResource['AccessPolicy'] = LazyResource('.accesspolicy', 'AccessPolicy')
+    chassisplatformsettingspolicy: LazyResource['ChassisPlatformSettingsPolicy'] = LazyResource(
+        '.chassisplatformsettingspolicy', 'ChassisPlatformSettingsPolicy'
+    )
+    decryptionpolicy: LazyResource['DecryptionPolicy'] = LazyResource('.decryptionpolicy', 'DecryptionPolicy')
+    dnspolicy: LazyResource['DnsPolicy'] = LazyResource('.dnspolicy', 'DnsPolicy')
+    dynamicaccesspolicy: LazyResource['DynamicAccessPolicy'] = LazyResource(
+        '.dynamicaccesspolicy', 'DynamicAccessPolicy'
+    )
+    filepolicy: LazyResource['FilePolicy'] = LazyResource('.filepolicy', 'FilePolicy')
+    flexconfigpolicy: LazyResource['FlexConfigPolicy'] = LazyResource('.flexconfigpolicy', 'FlexConfigPolicy')
+    ftdnatpolicy: LazyResource['FtdNatPolicy'] = LazyResource('.ftdnatpolicy', 'FtdNatPolicy')
+    ftdplatformsettingspolicy: LazyResource['FtdPlatformSettingsPolicy'] = LazyResource(
+        '.ftdplatformsettingspolicy', 'FtdPlatformSettingsPolicy'
+    )
+    ftds2svpn: LazyResource['FtdS2sVpn'] = LazyResource('.ftds2svpn', 'FtdS2sVpn')
+    healthpolicy: LazyResource['HealthPolicy'] = LazyResource('.healthpolicy', 'HealthPolicy')
+    identitypolicy: LazyResource['IdentityPolicy'] = LazyResource('.identitypolicy', 'IdentityPolicy')
+    intrusionpolicy: LazyResource['IntrusionPolicy'] = LazyResource('.intrusionpolicy', 'IntrusionPolicy')
+    natexemptrule: LazyResource['NatExemptRule'] = LazyResource('.natexemptrule', 'NatExemptRule')
+    networkanalysispolicy: LazyResource['NetworkAnalysisPolicy'] = LazyResource(
+        '.networkanalysispolicy', 'NetworkAnalysisPolicy'
+    )
+    policylock: LazyResource['PolicyLock'] = LazyResource('.policylock', 'PolicyLock')
+    prefilterpolicy: LazyResource['PrefilterPolicy'] = LazyResource('.prefilterpolicy', 'PrefilterPolicy')
+    ravpn: LazyResource['RaVpn'] = LazyResource('.ravpn', 'RaVpn')
+    snmpalert: LazyResource['SnmpAlert'] = LazyResource('.snmpalert', 'SnmpAlert')
+    syslogalert: LazyResource['SyslogAlert'] = LazyResource('.syslogalert', 'SyslogAlert')
+    umbrelladnspolicy: LazyResource['UmbrellaDnsPolicy'] = LazyResource('.umbrelladnspolicy', 'UmbrellaDnsPolicy')
+    vpntunnelstatus: LazyResource['VpnTunnelStatus'] = LazyResource('.vpntunnelstatus', 'VpnTunnelStatus')
+    zerotrustpolicy: LazyResource['ZeroTrustPolicy'] = LazyResource('.zerotrustpolicy', 'ZeroTrustPolicy')
+
     def __init__(self, conn: Connection):
-        self.accesspolicy = AccessPolicy(conn)
-        self.chassisplatformsettingspolicy = ChassisPlatformSettingsPolicy(conn)
-        self.decryptionpolicy = DecryptionPolicy(conn)
-        self.dnspolicy = DnsPolicy(conn)
-        self.dynamicaccesspolicy = DynamicAccessPolicy(conn)
-        self.filepolicy = FilePolicy(conn)
-        self.flexconfigpolicy = FlexConfigPolicy(conn)
-        self.ftdnatpolicy = FtdNatPolicy(conn)
-        self.ftdplatformsettingspolicy = FtdPlatformSettingsPolicy(conn)
-        self.ftds2svpn = FtdS2sVpn(conn)
-        self.healthpolicy = HealthPolicy(conn)
-        self.identitypolicy = IdentityPolicy(conn)
-        self.intrusionpolicy = IntrusionPolicy(conn)
-        self.natexemptrule = NatExemptRule(conn)
-        self.networkanalysispolicy = NetworkAnalysisPolicy(conn)
-        self.policylock = PolicyLock(conn)
-        self.prefilterpolicy = PrefilterPolicy(conn)
-        self.ravpn = RaVpn(conn)
-        self.snmpalert = SnmpAlert(conn)
-        self.syslogalert = SyslogAlert(conn)
-        self.umbrelladnspolicy = UmbrellaDnsPolicy(conn)
-        self.vpntunnelstatus = VpnTunnelStatus(conn)
-        self.zerotrustpolicy = ZeroTrustPolicy(conn)
+        self.conn = conn
+
+
+def __getattr__(name: str):
+    return lazy_getattr(__name__, name)
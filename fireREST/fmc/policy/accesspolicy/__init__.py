@@ -1,13 +1,17 @@
+from typing import TYPE_CHECKING
+
 from fireREST import utils
 from fireREST.defaults import API_RELEASE_610
-from fireREST.fmc import Connection, Resource
-from fireREST.fmc.policy.accesspolicy.accessrule import AccessRule
-from fireREST.fmc.policy.accesspolicy.category import Category
-from fireREST.fmc.policy.accesspolicy.defaultaction import DefaultAction
-from fireREST.fmc.policy.accesspolicy.inheritancesettings import InheritanceSettings
-from fireREST.fmc.policy.accesspolicy.loggingsettings import LoggingSettings
-from fireREST.fmc.policy.accesspolicy.operational import Operational
-from fireREST.fmc.policy.accesspolicy.securityintelligencepolicy import SecurityIntelligencePolicy
+from fireREST.fmc import LazyResource, Resource, lazy_getattr
+
+if TYPE_CHECKING:
+    from fireREST.fmc.policy.accesspolicy.accessrule import AccessRule
+    from fireREST.fmc.policy.accesspolicy.category import Category
+    from fireREST.fmc.policy.accesspolicy.defaultaction import DefaultAction
+    from fireREST.fmc.policy.accesspolicy.inheritancesettings import InheritanceSettings
+    from fireREST.fmc.policy.accesspolicy.loggingsettings import LoggingSettings
+    from fireREST.fmc.policy.accesspolicy.operational import Operational
+    from fireREST.fmc.policy.accesspolicy.securityintelligencepolicy import SecurityIntelligencePolicy
 
 
 class AccessPolicy(Resource):
@@ -43,17 +47,22 @@ class AccessPolicy(Resource):
     MINIMUM_VERSION_REQUIRED_DELETE = API_RELEASE_610
     SUPPORTED_PARAMS = ['name']
 
-    def __init__(self, conn: Connection):
-        super().__init__(conn)
-
-        self.accessrule = AccessRule(conn)
-        self.category = Category(conn)
-        self.defaultaction = DefaultAction(conn)
-        self.inheritancesettings = InheritanceSettings(conn)
-        self.loggingsettings = LoggingSettings(conn)
-        self.operational = Operational(conn)
-        self.securityintelligencepolicy = SecurityIntelligencePolicy(conn)
+    accessrule: LazyResource['AccessRule'] = LazyResource('.accessrule', 'AccessRule')
+    category: LazyResource['Category'] = LazyResource('.category', 'Category')
+    defaultaction: LazyResource['DefaultAction'] = LazyResource('.defaultaction', 'DefaultAction')
+    inheritancesettings: LazyResource['InheritanceSettings'] = LazyResource(
+        '.inheritancesettings', 'InheritanceSettings'
+    )
+    loggingsettings: LazyResource['LoggingSettings'] = LazyResource('.loggingsettings', 'LoggingSettings')
+    operational: LazyResource['Operational'] = LazyResource('.operational', 'Operational')
+    securityintelligencepolicy: LazyResource['SecurityIntelligencePolicy'] = LazyResource(
+        '.securityintelligencepolicy', 'SecurityIntelligencePolicy'
+    )
 
     @utils.support_params
     def get(self, uuid=None, name=None, params=None):
         return super().get(uuid=uuid, name=name, params=params)
+
+
+def __getattr__(name: str):
+    return lazy_getattr(__name__, name)
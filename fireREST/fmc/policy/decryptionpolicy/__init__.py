@@ -1,6 +1,10 @@
+from typing import TYPE_CHECKING
+
 from fireREST.defaults import API_RELEASE_740
-from fireREST.fmc import Connection, Resource
-from fireREST.fmc.policy.decryptionpolicy.decryptionpolicyrule import DecryptionPolicyRule
+from fireREST.fmc import LazyResource, Resource, lazy_getattr
+
+if TYPE_CHECKING:
+    from fireREST.fmc.policy.decryptionpolicy.decryptionpolicyrule import DecryptionPolicyRule
 
 
 class DecryptionPolicy(Resource):
@@ -32,6 +36,10 @@ class DecryptionPolicy(Resource):
     MINIMUM_VERSION_REQUIRED_UPDATE = API_RELEASE_740
     MINIMUM_VERSION_REQUIRED_DELETE = API_RELEASE_740
 
-    def __init__(self, conn: Connection):
-        super().__init__(conn)
-        self.decryptionpolicyrule = DecryptionPolicyRule(conn)
+    decryptionpolicyrule: LazyResource['DecryptionPolicyRule'] = LazyResource(
+        '.decryptionpolicyrule', 'DecryptionPolicyRule'
+    )
+
+
+def __getattr__(name: str):
+    return lazy_getattr(__name__, name)
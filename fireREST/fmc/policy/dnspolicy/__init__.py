@@ -1,7 +1,11 @@
+from typing import TYPE_CHECKING
+
 from fireREST.defaults import API_RELEASE_700
-from fireREST.fmc import Connection, Resource
-from fireREST.fmc.policy.dnspolicy.allowdnsrule import AllowDnsRule
-from fireREST.fmc.policy.dnspolicy.blockdnsrule import BlockDnsRule
+from fireREST.fmc import LazyResource, Resource, lazy_getattr
+
+if TYPE_CHECKING:
+    from fireREST.fmc.policy.dnspolicy.allowdnsrule import AllowDnsRule
+    from fireREST.fmc.policy.dnspolicy.blockdnsrule import BlockDnsRule
 
 
 class DnsPolicy(Resource):
@@ -27,8 +31,9 @@ class DnsPolicy(Resource):
     PATH = '/policy/dnspolicies/{uuid}'
     MINIMUM_VERSION_REQUIRED_GET = API_RELEASE_700
 
-    def __init__(self, conn: Connection):
-        super().__init__(conn)
+    allowdnsrule: LazyResource['AllowDnsRule'] = LazyResource('.allowdnsrule', 'AllowDnsRule')
+    blockdnsrule: LazyResource['BlockDnsRule'] = LazyResource('.blockdnsrule', 'BlockDnsRule')
+
 
-        self.allowdnsrule = AllowDnsRule(conn)
-        self.blockdnsrule = BlockDnsRule(conn)
+def __getattr__(name: str):
+    return lazy_getattr(__name__, name)
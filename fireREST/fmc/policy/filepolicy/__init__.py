@@ -1,6 +1,10 @@
+from typing import TYPE_CHECKING
+
 from fireREST.defaults import API_RELEASE_610
-from fireREST.fmc import Connection, Resource
-from fireREST.fmc.policy.filepolicy.filerule import FileRule
+from fireREST.fmc import LazyResource, Resource, lazy_getattr
+
+if TYPE_CHECKING:
+    from fireREST.fmc.policy.filepolicy.filerule import FileRule
 
 
 class FilePolicy(Resource):
@@ -28,6 +32,8 @@ class FilePolicy(Resource):
     PATH = '/policy/filepolicies/{uuid}'
     MINIMUM_VERSION_REQUIRED_GET = API_RELEASE_610
 
-    def __init__(self, conn: Connection):
-        super().__init__(conn)
-        self.filerule = FileRule(conn)
+    filerule: LazyResource['FileRule'] = LazyResource('.filerule', 'FileRule')
+
+
+def __getattr__(name: str):
+    return lazy_getattr(__name__, name)
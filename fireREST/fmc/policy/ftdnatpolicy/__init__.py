@@ -1,8 +1,12 @@
+from typing import TYPE_CHECKING
+
 from fireREST.defaults import API_RELEASE_623
-from fireREST.fmc import Connection, Resource
-from fireREST.fmc.policy.ftdnatpolicy.autonatrule import AutoNatRule
-from fireREST.fmc.policy.ftdnatpolicy.manualnatrule import ManualNatRule
-from fireREST.fmc.policy.ftdnatpolicy.natrule import NatRule
+from fireREST.fmc import LazyResource, Resource, lazy_getattr
+
+if TYPE_CHECKING:
+    from fireREST.fmc.policy.ftdnatpolicy.autonatrule import AutoNatRule
+    from fireREST.fmc.policy.ftdnatpolicy.manualnatrule import ManualNatRule
+    from fireREST.fmc.policy.ftdnatpolicy.natrule import NatRule
 
 
 class FtdNatPolicy(Resource):
@@ -34,9 +38,10 @@ class FtdNatPolicy(Resource):
     MINIMUM_VERSION_REQUIRED_UPDATE = API_RELEASE_623
     MINIMUM_VERSION_REQUIRED_DELETE = API_RELEASE_623
 
-    def __init__(self, conn: Connection):
-        super().__init__(conn)
+    autonatrule: LazyResource['AutoNatRule'] = LazyResource('.autonatrule', 'AutoNatRule')
+    manualnatrule: LazyResource['ManualNatRule'] = LazyResource('.manualnatrule', 'ManualNatRule')
+    natrule: LazyResource['NatRule'] = LazyResource('.natrule', 'NatRule')
+
 
-        self.autonatrule = AutoNatRule(conn)
-        self.manualnatrule = ManualNatRule(conn)
-        self.natrule = NatRule(conn)
+def __getattr__(name: str):
+    return lazy_getattr(__name__, name)
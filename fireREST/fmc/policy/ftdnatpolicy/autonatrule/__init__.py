@@ -41,6 +41,7 @@ class AutoNatRule(ChildResource):
     MINIMUM_VERSION_REQUIRED_GET = API_RELEASE_623
     MINIMUM_VERSION_REQUIRED_UPDATE = API_RELEASE_623
     MINIMUM_VERSION_REQUIRED_DELETE = API_RELEASE_623
+    BULK_OPERATIONS = ['create', 'update', 'delete']
 
     @utils.support_params
     def create(
@@ -45,6 +45,7 @@ class NatRule(ChildResource):
         'translated_destination_port',
     ]
     MINIMUM_VERSION_REQUIRED_GET = API_RELEASE_623
+    BULK_OPERATIONS = ['delete']
 
     @utils.support_params
     def get(
@@ -1,8 +1,12 @@
+from typing import TYPE_CHECKING
+
 from fireREST.defaults import API_RELEASE_730
-from fireREST.fmc import Connection, Resource
-from fireREST.fmc.policy.ftdplatformsettingspolicy.httpaccesssettings import HttpAccessSettings
-from fireREST.fmc.policy.ftdplatformsettingspolicy.netflowpolicies import NetflowPolicies
-from fireREST.fmc.policy.ftdplatformsettingspolicy.snmpsettings import SnmpSettings
+from fireREST.fmc import LazyResource, Resource, lazy_getattr
+
+if TYPE_CHECKING:
+    from fireREST.fmc.policy.ftdplatformsettingspolicy.httpaccesssettings import HttpAccessSettings
+    from fireREST.fmc.policy.ftdplatformsettingspolicy.netflowpolicies import NetflowPolicies
+    from fireREST.fmc.policy.ftdplatformsettingspolicy.snmpsettings import SnmpSettings
 
 
 class FtdPlatformSettingsPolicy(Resource):
@@ -31,8 +35,10 @@ class FtdPlatformSettingsPolicy(Resource):
     PATH = '/policy/ftdplatformsettingspolicies/{uuid}'
     MINIMUM_VERSION_REQUIRED_GET = API_RELEASE_730
 
-    def __init__(self, conn: Connection):
-        super().__init__(conn)
-        self.httpaccesssettings = HttpAccessSettings(conn)
-        self.netflowpolicies = NetflowPolicies(conn)
-        self.snmpsettings = SnmpSettings(conn)
+    httpaccesssettings: LazyResource['HttpAccessSettings'] = LazyResource('.httpaccesssettings', 'HttpAccessSettings')
+    netflowpolicies: LazyResource['NetflowPolicies'] = LazyResource('.netflowpolicies', 'NetflowPolicies')
+    snmpsettings: LazyResource['SnmpSettings'] = LazyResource('.snmpsettings', 'SnmpSettings')
+
+
+def __getattr__(name: str):
+    return lazy_getattr(__name__, name)
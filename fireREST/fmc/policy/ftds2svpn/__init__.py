@@ -1,11 +1,15 @@
+from typing import TYPE_CHECKING
+
 from fireREST.defaults import API_RELEASE_630
-from fireREST.fmc import Connection, Resource
-from fireREST.fmc.policy.ftds2svpn.advancedsettings import AdvancedSettings
-from fireREST.fmc.policy.ftds2svpn.endpoint import Endpoint
-from fireREST.fmc.policy.ftds2svpn.ikesettings import IkeSettings
-from fireREST.fmc.policy.ftds2svpn.ipseccryptomap import IpsecCryptoMap
-from fireREST.fmc.policy.ftds2svpn.ipsecsettings import IpsecSettings
-from fireREST.fmc.policy.ftds2svpn.s2svpnsummary import S2sVpnSummary
+from fireREST.fmc import LazyResource, Resource, lazy_getattr
+
+if TYPE_CHECKING:
+    from fireREST.fmc.policy.ftds2svpn.advancedsettings import AdvancedSettings
+    from fireREST.fmc.policy.ftds2svpn.endpoint import Endpoint
+    from fireREST.fmc.policy.ftds2svpn.ikesettings import IkeSettings
+    from fireREST.fmc.policy.ftds2svpn.ipseccryptomap import IpsecCryptoMap
+    from fireREST.fmc.policy.ftds2svpn.ipsecsettings import IpsecSettings
+    from fireREST.fmc.policy.ftds2svpn.s2svpnsummary import S2sVpnSummary
 
 
 class FtdS2sVpn(Resource):
@@ -36,12 +40,13 @@ class FtdS2sVpn(Resource):
     MINIMUM_VERSION_REQUIRED_UPDATE = API_RELEASE_630
     MINIMUM_VERSION_REQUIRED_DELETE = API_RELEASE_630
 
-    def __init__(self, conn: Connection):
-        super().__init__(conn)
+    advancedsettings: LazyResource['AdvancedSettings'] = LazyResource('.advancedsettings', 'AdvancedSettings')
+    endpoint: LazyResource['Endpoint'] = LazyResource('.endpoint', 'Endpoint')
+    ikesettings: LazyResource['IkeSettings'] = LazyResource('.ikesettings', 'IkeSettings')
+    ipseccryptomap: LazyResource['IpsecCryptoMap'] = LazyResource('.ipseccryptomap', 'IpsecCryptoMap')
+    ipsecsettings: LazyResource['IpsecSettings'] = LazyResource('.ipsecsettings', 'IpsecSettings')
+    s2svpnsummary: LazyResource['S2sVpnSummary'] = LazyResource('.s2svpnsummary', 'S2sVpnSummary')
+
 
-        self.advancedsettings = AdvancedSettings(conn)
-        self.endpoint = Endpoint(conn)
-        self.ikesettings = IkeSettings(conn)
-        self.ipseccryptomap = IpsecCryptoMap(conn)
-        self.ipsecsettings = IpsecSettings(conn)
-        self.s2svpnsummary = S2sVpnSummary(conn)
+def __getattr__(name: str):
+    return lazy_getattr(__name__, name)
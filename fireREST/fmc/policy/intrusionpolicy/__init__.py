@@ -1,7 +1,11 @@
+from typing import TYPE_CHECKING
+
 from fireREST.defaults import API_RELEASE_610, API_RELEASE_670
-from fireREST.fmc import Connection, Resource
-from fireREST.fmc.policy.intrusionpolicy.intrusionrule import IntrusionRule
-from fireREST.fmc.policy.intrusionpolicy.intrusionrulegroup import IntrusionRuleGroup
+from fireREST.fmc import LazyResource, Resource, lazy_getattr
+
+if TYPE_CHECKING:
+    from fireREST.fmc.policy.intrusionpolicy.intrusionrule import IntrusionRule
+    from fireREST.fmc.policy.intrusionpolicy.intrusionrulegroup import IntrusionRuleGroup
 
 
 class IntrusionPolicy(Resource):
@@ -37,8 +41,9 @@ class IntrusionPolicy(Resource):
     MINIMUM_VERSION_REQUIRED_UPDATE = API_RELEASE_670
     MINIMUM_VERSION_REQUIRED_DELETE = API_RELEASE_670
 
-    def __init__(self, conn: Connection):
-        super().__init__(conn)
+    intrusionrule: LazyResource['IntrusionRule'] = LazyResource('.intrusionrule', 'IntrusionRule')
+    intrusionrulegroup: LazyResource['IntrusionRuleGroup'] = LazyResource('.intrusionrulegroup', 'IntrusionRuleGroup')
+
 
-        self.intrusionrule = IntrusionRule(conn)
-        self.intrusionrulegroup = IntrusionRuleGroup(conn)
+def __getattr__(name: str):
+    return lazy_getattr(__name__, name)
@@ -31,3 +31,4 @@ class IntrusionRule(ChildResource):
     PATH = '/policy/intrusionpolicies/{container_uuid}/intrusionrules/{uuid}'
     MINIMUM_VERSION_REQUIRED_GET = API_RELEASE_670
     MINIMUM_VERSION_REQUIRED_UPDATE = API_RELEASE_670
+    BULK_OPERATIONS = ['update']
@@ -32,3 +32,4 @@ class IntrusionRuleGroup(ChildResource):
     PATH = '/policy/intrusionpolicies/{container_uuid}/intrusionrulegroups/{uuid}'
     MINIMUM_VERSION_REQUIRED_GET = API_RELEASE_700
     MINIMUM_VERSION_REQUIRED_UPDATE = API_RELEASE_700
+    BULK_OPERATIONS = ['update']
@@ -1,7 +1,11 @@
+from typing import TYPE_CHECKING
+
 from fireREST.defaults import API_RELEASE_700
-from fireREST.fmc import Connection, Resource
-from fireREST.fmc.policy.networkanalysispolicy.inspectorconfig import InspectorConfig
-from fireREST.fmc.policy.networkanalysispolicy.inspectoroverrideconfig import InspectorOverrideConfig
+from fireREST.fmc import LazyResource, Resource, lazy_getattr
+
+if TYPE_CHECKING:
+    from fireREST.fmc.policy.networkanalysispolicy.inspectorconfig import InspectorConfig
+    from fireREST.fmc.policy.networkanalysispolicy.inspectoroverrideconfig import InspectorOverrideConfig
 
 
 class NetworkAnalysisPolicy(Resource):
@@ -34,8 +38,11 @@ class NetworkAnalysisPolicy(Resource):
     MINIMUM_VERSION_REQUIRED_UPDATE = API_RELEASE_700
     MINIMUM_VERSION_REQUIRED_DELETE = API_RELEASE_700
 
-    def __init__(self, conn: Connection):
-        super().__init__(conn)
+    inspectorconfig: LazyResource['InspectorConfig'] = LazyResource('.inspectorconfig', 'InspectorConfig')
+    inspectoroverrideconfig: LazyResource['InspectorOverrideConfig'] = LazyResource(
+        '.inspectoroverrideconfig', 'InspectorOverrideConfig'
+    )
+
 
-        self.inspectorconfig = InspectorConfig(conn)
-        self.inspectoroverrideconfig = InspectorOverrideConfig(conn)
+def __getattr__(name: str):
+    return lazy_getattr(__name__, name)
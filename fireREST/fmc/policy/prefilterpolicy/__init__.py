@@ -1,8 +1,12 @@
+from typing import TYPE_CHECKING
+
 from fireREST.defaults import API_RELEASE_650
-from fireREST.fmc import Connection, Resource
-from fireREST.fmc.policy.prefilterpolicy.defaultaction import DefaultAction
-from fireREST.fmc.policy.prefilterpolicy.operational import Operational
-from fireREST.fmc.policy.prefilterpolicy.prefilterrule import PrefilterRule
+from fireREST.fmc import LazyResource, Resource, lazy_getattr
+
+if TYPE_CHECKING:
+    from fireREST.fmc.policy.prefilterpolicy.defaultaction import DefaultAction
+    from fireREST.fmc.policy.prefilterpolicy.operational import Operational
+    from fireREST.fmc.policy.prefilterpolicy.prefilterrule import PrefilterRule
 
 
 class PrefilterPolicy(Resource):
@@ -34,9 +38,10 @@ class PrefilterPolicy(Resource):
     MINIMUM_VERSION_REQUIRED_UPDATE = API_RELEASE_650
     MINIMUM_VERSION_REQUIRED_DELETE = API_RELEASE_650
 
-    def __init__(self, conn: Connection):
-        super().__init__(conn)
+    prefilterrule: LazyResource['PrefilterRule'] = LazyResource('.prefilterrule', 'PrefilterRule')
+    defaultaction: LazyResource['DefaultAction'] = LazyResource('.defaultaction', 'DefaultAction')
+    operational: LazyResource['Operational'] = LazyResource('.operational', 'Operational')
+
 
-        self.prefilterrule = PrefilterRule(conn)
-        self.defaultaction = DefaultAction(conn)
-        self.operational = Operational(conn)
+def __getattr__(name: str):
+    return lazy_getattr(__name__, name)
@@ -1,7 +1,17 @@
-from fireREST.fmc import Connection
-from fireREST.fmc.policy.prefilterpolicy.operational.hitcounts import Hitcount
+from typing import TYPE_CHECKING
+
+from fireREST.fmc import Connection, LazyResource, lazy_getattr
+
+if TYPE_CHECKING:
+    from fireREST.fmc.policy.prefilterpolicy.operational.hitcounts import Hitcount
 
 
 class Operational:
+    hitcount: LazyResource['Hitcount'] = LazyResource('.hitcounts', 'Hitcount')
+
     def __init__(self, conn: Connection):
-        self.hitcount = Hitcount(conn)
+        self.conn = conn
+
+
+def __getattr__(name: str):
+    return lazy_getattr(__name__, name)
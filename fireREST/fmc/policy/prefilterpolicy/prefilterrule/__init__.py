@@ -42,6 +42,7 @@ class PrefilterRule(ChildResource):
     MINIMUM_VERSION_REQUIRED_GET = API_RELEASE_650
     MINIMUM_VERSION_REQUIRED_UPDATE = API_RELEASE_650
     MINIMUM_VERSION_REQUIRED_DELETE = API_RELEASE_650
+    BULK_OPERATIONS = ['create', 'update', 'delete']
 
     @utils.support_params
     def create(
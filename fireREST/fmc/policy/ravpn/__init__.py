@@ -1,12 +1,16 @@
+from typing import TYPE_CHECKING
+
 from fireREST.defaults import API_RELEASE_700, API_RELEASE_720
-from fireREST.fmc import Connection, Resource
-from fireREST.fmc.policy.ravpn.addressassignmentsettings import AddressAssignmentSettings
-from fireREST.fmc.policy.ravpn.certificatemapsettings import CertificateMapSettings
-from fireREST.fmc.policy.ravpn.connectionprofile import ConnectionProfile
-from fireREST.fmc.policy.ravpn.ipsecadvancedsettings import IpsecAdvancedSettings
-from fireREST.fmc.policy.ravpn.ldapattributemap import LdapAttributeMap
-from fireREST.fmc.policy.ravpn.loadbalancesettings import LoadBalanceSettings
-from fireREST.fmc.policy.ravpn.secureclientcustomizationsettings import SecureClientCustomizationSettings
+from fireREST.fmc import LazyResource, Resource, lazy_getattr
+
+if TYPE_CHECKING:
+    from fireREST.fmc.policy.ravpn.addressassignmentsettings import AddressAssignmentSettings
+    from fireREST.fmc.policy.ravpn.certificatemapsettings import CertificateMapSettings
+    from fireREST.fmc.policy.ravpn.connectionprofile import ConnectionProfile
+    from fireREST.fmc.policy.ravpn.ipsecadvancedsettings import IpsecAdvancedSettings
+    from fireREST.fmc.policy.ravpn.ldapattributemap import LdapAttributeMap
+    from fireREST.fmc.policy.ravpn.loadbalancesettings import LoadBalanceSettings
+    from fireREST.fmc.policy.ravpn.secureclientcustomizationsettings import SecureClientCustomizationSettings
 
 
 class RaVpn(Resource):
@@ -37,13 +41,24 @@ class RaVpn(Resource):
     MINIMUM_VERSION_REQUIRED_UPDATE = API_RELEASE_720
     MINIMUM_VERSION_REQUIRED_DELETE = API_RELEASE_720
 
-    def __init__(self, conn: Connection):
-        super().__init__(conn)
+    addressassignmentsettings: LazyResource['AddressAssignmentSettings'] = LazyResource(
+        '.addressassignmentsettings', 'AddressAssignmentSettings'
+    )
+    certificatemapsettings: LazyResource['CertificateMapSettings'] = LazyResource(
+        '.certificatemapsettings', 'CertificateMapSettings'
+    )
+    connectionprofile: LazyResource['ConnectionProfile'] = LazyResource('.connectionprofile', 'ConnectionProfile')
+    ipsecadvancedsettings: LazyResource['IpsecAdvancedSettings'] = LazyResource(
+        '.ipsecadvancedsettings', 'IpsecAdvancedSettings'
+    )
+    ldapattributemap: LazyResource['LdapAttributeMap'] = LazyResource('.ldapattributemap', 'LdapAttributeMap')
+    loadbalancesettings: LazyResource['LoadBalanceSettings'] = LazyResource(
+        '.loadbalancesettings', 'LoadBalanceSettings'
+    )
+    secureclientcustomizationsettings: LazyResource['SecureClientCustomizationSettings'] = LazyResource(
+        '.secureclientcustomizationsettings', 'SecureClientCustomizationSettings'
+    )
+
 
-        self.addressassignmentsettings = AddressAssignmentSettings(conn)
-        self.certificatemapsettings = CertificateMapSettings(conn)
-        self.connectionprofile = ConnectionProfile(conn)
-        self.ipsecadvancedsettings = IpsecAdvancedSettings(conn)
-        self.ldapattributemap = LdapAttributeMap(conn)
-        self.loadbalancesettings = LoadBalanceSettings(conn)
-        self.secureclientcustomizationsettings = SecureClientCustomizationSettings(conn)
+def __getattr__(name: str):
+    return lazy_getattr(__name__, name)
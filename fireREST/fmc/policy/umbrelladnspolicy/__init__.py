@@ -1,6 +1,10 @@
+from typing import TYPE_CHECKING
+
 from fireREST.defaults import API_RELEASE_720
-from fireREST.fmc import Connection, Resource
-from fireREST.fmc.policy.umbrelladnspolicy.umbrelladnsrule import UmbrellaDnsRule
+from fireREST.fmc import LazyResource, Resource, lazy_getattr
+
+if TYPE_CHECKING:
+    from fireREST.fmc.policy.umbrelladnspolicy.umbrelladnsrule import UmbrellaDnsRule
 
 
 class UmbrellaDnsPolicy(Resource):
@@ -31,7 +35,8 @@ class UmbrellaDnsPolicy(Resource):
     MINIMUM_VERSION_REQUIRED_UPDATE = API_RELEASE_720
     MINIMUM_VERSION_REQUIRED_DELETE = API_RELEASE_720
 
-    def __init__(self, conn: Connection):
-        super().__init__(conn)
+    umbrelladnsrule: LazyResource['UmbrellaDnsRule'] = LazyResource('.umbrelladnsrule', 'UmbrellaDnsRule')
+
 
-        self.umbrelladnsrule = UmbrellaDnsRule(conn)
+def __getattr__(name: str):
+    return lazy_getattr(__name__, name)
@@ -1,7 +1,11 @@
+from typing import TYPE_CHECKING
+
 from fireREST.defaults import API_RELEASE_740
-from fireREST.fmc import Connection, Resource
-from fireREST.fmc.policy.zerotrustpolicy.application import Application
-from fireREST.fmc.policy.zerotrustpolicy.applicationgroup import ApplicationGroup
+from fireREST.fmc import LazyResource, Resource, lazy_getattr
+
+if TYPE_CHECKING:
+    from fireREST.fmc.policy.zerotrustpolicy.application import Application
+    from fireREST.fmc.policy.zerotrustpolicy.applicationgroup import ApplicationGroup
 
 
 class ZeroTrustPolicy(Resource):
@@ -33,7 +37,9 @@ class ZeroTrustPolicy(Resource):
     MINIMUM_VERSION_REQUIRED_UPDATE = API_RELEASE_740
     MINIMUM_VERSION_REQUIRED_DELETE = API_RELEASE_740
 
-    def __init__(self, conn: Connection):
-        super().__init__(conn)
-        self.application = Application(conn)
-        self.applicationgroup = ApplicationGroup(conn)
+    application: LazyResource['Application'] = LazyResource('.application', 'Application')
+    applicationgroup: LazyResource['ApplicationGroup'] = LazyResource('.applicationgroup', 'ApplicationGroup')
+
+
+def __getattr__(name: str):
+    return lazy_getattr(__name__, name)
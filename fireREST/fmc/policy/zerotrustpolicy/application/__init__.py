@@ -36,3 +36,4 @@ class Application(ChildResource):
     MINIMUM_VERSION_REQUIRED_GET = API_RELEASE_740
     MINIMUM_VERSION_REQUIRED_UPDATE = API_RELEASE_740
     MINIMUM_VERSION_REQUIRED_DELETE = API_RELEASE_740
+    BULK_OPERATIONS = ['update', 'delete']
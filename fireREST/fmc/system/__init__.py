@@ -1,7 +1,17 @@
-from fireREST.fmc import Connection
-from fireREST.fmc.system.info import Info
+from typing import TYPE_CHECKING
+
+from fireREST.fmc import Connection, LazyResource, lazy_getattr
+
+if TYPE_CHECKING:
+    from fireREST.fmc.system.info import Info
 
 
 class System:
+    info: LazyResource['Info'] = LazyResource('.info', 'Info')
+
     def __init__(self, conn: Connection):
-        self.info = Info(conn)
+        self.conn = conn
+
+
+def __getattr__(name: str):
+    return lazy_getattr(__name__, name)
@@ -1,9 +1,19 @@
-from fireREST.fmc import Connection
-from fireREST.fmc.system.info.domain import Domain
-from fireREST.fmc.system.info.serverversion import ServerVersion
+from typing import TYPE_CHECKING
+
+from fireREST.fmc import Connection, LazyResource, lazy_getattr
+
+if TYPE_CHECKING:
+    from fireREST.fmc.system.info.domain import Domain
+    from fireREST.fmc.system.info.serverversion import ServerVersion
 
 
 class Info:
+    domain: LazyResource['Domain'] = LazyResource('.domain', 'Domain')
+    serverversion: LazyResource['ServerVersion'] = LazyResource('.serverversion', 'ServerVersion')
+
     def __init__(self, conn: Connection):
-        self.domain = Domain(conn)
-        self.serverversion = ServerVersion(conn)
+        self.conn = conn
+
+
+def __getattr__(name: str):
+    return lazy_getattr(__name__, name)
@@ -1,9 +1,23 @@
-from fireREST.fmc import Connection
-from fireREST.fmc.systemconfiguration.changemanagementconfig import ChangeManagementConfig
-from fireREST.fmc.systemconfiguration.remotemanagementaccess import RemoteManagementAccess
+from typing import TYPE_CHECKING
+
+from fireREST.fmc import Connection, LazyResource, lazy_getattr
+
+if TYPE_CHECKING:
+    from fireREST.fmc.systemconfiguration.changemanagementconfig import ChangeManagementConfig
+    from fireREST.fmc.systemconfiguration.remotemanagementaccess import RemoteManagementAccess
 
 
 class SystemConfiguration:
+    changemanagementconfig: LazyResource['ChangeManagementConfig'] = LazyResource(
+        '.changemanagementconfig', 'ChangeManagementConfig'
+    )
+    remotemanagementaccess: LazyResource['RemoteManagementAccess'] = LazyResource(
+        '.remotemanagementaccess', 'RemoteManagementAccess'
+    )
+
     def __init__(self, conn: Connection):
-        self.changemanagementconfig = ChangeManagementConfig(conn)
-        self.remotemanagementaccess = RemoteManagementAccess(conn)
+        self.conn = conn
+
+
+def __getattr__(name: str):
+    return lazy_getattr(__name__, name)
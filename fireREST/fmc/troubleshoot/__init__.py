@@ -1,11 +1,21 @@
-from fireREST.fmc import Connection
-from fireREST.fmc.troubleshoot.device import Device
-from fireREST.fmc.troubleshoot.packettracer import PacketTracer
-from fireREST.fmc.troubleshoot.task import Task
+from typing import TYPE_CHECKING
+
+from fireREST.fmc import Connection, LazyResource, lazy_getattr
+
+if TYPE_CHECKING:
+    from fireREST.fmc.troubleshoot.device import Device
+    from fireREST.fmc.troubleshoot.packettracer import PacketTracer
+    from fireREST.fmc.troubleshoot.task import Task
 
 
 class Troubleshoot:
+    device: LazyResource['Device'] = LazyResource('.device', 'Device')
+    packettracer: LazyResource['PacketTracer'] = LazyResource('.packettracer', 'PacketTracer')
+    task: LazyResource['Task'] = LazyResource('.task', 'Task')
+
     def __init__(self, conn: Connection):
-        self.device = Device(conn)
-        self.packettracer = PacketTracer(conn)
-        self.task = Task(conn)
+        self.conn = conn
+
+
+def __getattr__(name: str):
+    return lazy_getattr(__name__, name)
@@ -1,18 +1,18 @@
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Dict, Optional
 
 from fireREST import utils
 from fireREST.defaults import API_RELEASE_710
-from fireREST.fmc import Connection, Resource
-from fireREST.fmc.troubleshoot.packettracer.file import File
+from fireREST.fmc import LazyResource, Resource, lazy_getattr
+
+if TYPE_CHECKING:
+    from fireREST.fmc.troubleshoot.packettracer.file import File
 
 
 class PacketTracer(Resource):
     NAMESPACE = 'troubleshoot'
     PATH = '/packettracer'
 
-    def __init__(self, conn: Connection):
-        super().__init__(conn)
-        self.file = File(conn)
+    file: LazyResource['File'] = LazyResource('.file', 'File')
 
     @utils.minimum_version_required(version=API_RELEASE_710)
     def trace(self, data: Dict, params: Optional[Dict] = None):
@@ -23,3 +23,7 @@ class PacketTracer(Resource):
     def pcap_trace(self, data: Dict, params: Optional[Dict] = None):
         url = self.url(f'{self.PATH}/pcaptraces')
         return self.conn.post(url=url, data=data, params=params)
+
+
+def __getattr__(name: str):
+    return lazy_getattr(__name__, name)
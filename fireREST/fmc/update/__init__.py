@@ -1,19 +1,18 @@
-from typing import Dict
+from typing import TYPE_CHECKING, Dict
 
 from fireREST import utils
 from fireREST.defaults import API_RELEASE_630, API_RELEASE_670, API_RELEASE_710, API_RELEASE_720
-from fireREST.fmc import Resource
-from fireREST.fmc.update.upgradepackage import UpgradePackage
+from fireREST.fmc import LazyResource, Resource, lazy_getattr
+
+if TYPE_CHECKING:
+    from fireREST.fmc.update.upgradepackage import UpgradePackage
 
 
 class Update(Resource):
     NAMESPACE = 'platform'
     PATH = '/updates/{uuid}'
 
-    def __init__(self, conn):
-        super().__init__(conn)
-
-        self.upgradepackage = UpgradePackage(conn)
+    upgradepackage: LazyResource['UpgradePackage'] = LazyResource('.upgradepackage', 'UpgradePackage')
 
     @utils.minimum_version_required(version=API_RELEASE_670)
     def cancel(self, data: Dict):
@@ -39,3 +38,7 @@ class Update(Resource):
     def upgrade(self, data: Dict):
         url = self.url(path='/updates/upgrades')
         return self.conn.post(url=url, data=data)
+
+
+def __getattr__(name: str):
+    return lazy_getattr(__name__, name)
@@ -1,6 +1,10 @@
+from typing import TYPE_CHECKING
+
 from fireREST.defaults import API_RELEASE_630
-from fireREST.fmc import Resource
-from fireREST.fmc.update.upgradepackage.applicabledevice import ApplicableDevice
+from fireREST.fmc import LazyResource, Resource, lazy_getattr
+
+if TYPE_CHECKING:
+    from fireREST.fmc.update.upgradepackage.applicabledevice import ApplicableDevice
 
 
 class UpgradePackage(Resource):
@@ -28,7 +32,8 @@ class UpgradePackage(Resource):
     MINIMUM_VERSION_REQUIRED_GET = API_RELEASE_630
     MINIMUM_VERSION_REQUIRED_DELETE = API_RELEASE_630
 
-    def __init__(self, conn):
-        super().__init__(conn)
+    applicabledevice: LazyResource['ApplicableDevice'] = LazyResource('.applicabledevice', 'ApplicableDevice')
+
 
-        self.applicabledevice = ApplicableDevice(conn)
+def __getattr__(name: str):
+    return lazy_getattr(__name__, name)
@@ -1,13 +1,23 @@
-from fireREST.fmc import Connection
-from fireREST.fmc.user.authrole import AuthRole
-from fireREST.fmc.user.duoconfig import DuoConfig
-from fireREST.fmc.user.ssoconfig import SsoConfig
-from fireREST.fmc.user.users import Users
+from typing import TYPE_CHECKING
+
+from fireREST.fmc import Connection, LazyResource, lazy_getattr
+
+if TYPE_CHECKING:
+    from fireREST.fmc.user.authrole import AuthRole
+    from fireREST.fmc.user.duoconfig import DuoConfig
+    from fireREST.fmc.user.ssoconfig import SsoConfig
+    from fireREST.fmc.user.users import Users
 
 
 class User:
+    authrole: LazyResource['AuthRole'] = LazyResource('.authrole', 'AuthRole')
+    duoconfig: LazyResource['DuoConfig'] = LazyResource('.duoconfig', 'DuoConfig')
+    ssoconfig: LazyResource['SsoConfig'] = LazyResource('.ssoconfig', 'SsoConfig')
+    users: LazyResource['Users'] = LazyResource('.users', 'Users')
+
     def __init__(self, conn: Connection):
-        self.authrole = AuthRole(conn)
-        self.duoconfig = DuoConfig(conn)
-        self.ssoconfig = SsoConfig(conn)
-        self.users = Users(conn)
+        self.conn = conn
+
+
+def __getattr__(name: str):
+    return lazy_getattr(__name__, name)
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+
+import threading
+from contextvars import ContextVar
+from logging import getLogger
+from typing import Callable, Dict, NamedTuple, Optional, Tuple
+
+logger = getLogger(__name__)
+
+#: emitted before a request is sent
+PRE_REQUEST = 'pre_request'
+#: emitted after a response has been received (or the request failed with a connection error)
+POST_RESPONSE = 'post_response'
+#: emitted before a failed request is repeated
+RETRY = 'retry'
+#: emitted after the access token has been refreshed or the connection re-authenticated
+REFRESH = 'refresh'
+#: emitted if a request has been delayed by the client-side rate limiter
+RATE_LIMIT = 'rate_limit'
+
+#: events that can be subscribed to
+EVENTS = (PRE_REQUEST, POST_RESPONSE, RETRY, REFRESH, RATE_LIMIT)
+
+#: number of callbacks registered across all `Hooks` objects. Resource operations are only tracked if > 0
+_registered = 0
+
+#: guards `_registered` and the callbacks of all `Hooks` objects. Callbacks are replaced instead of modified in place,
+#: so `emit` can invoke them without acquiring the lock
+_lock = threading.Lock()
+
+
+class Operation(NamedTuple):
+    """Resource operation that issued a request"""
+
+    #: name of the resource class, e.g. `Network`
+    resource: str
+    #: name of the operation, e.g. `get`
+    name: str
+    #: path template of the resource, e.g. `/object/networks/{uuid}`
+    path: str
+
+
+_operation: ContextVar[Optional[Operation]] = ContextVar('fireREST_operation', default=None)
+
+
+def active():
+    """verify if any callbacks are registered
+
+    :return: True if resource operations should be tracked
+    :rtype: bool
+    """
+    return _registered > 0
+
+
+def current_operation():
+    """get resource operation that is performed by the current thread or task
+
+    :return: operation or None if the request has not been issued by a resource
+    :rtype: Operation, optional
+    """
+    return _operation.get()
+
+
+def set_operation(operation: Optional[Operation]):
+    """set resource operation of the current context
+
+    :param operation: operation that is performed
+    :type operation: Operation, optional
+    :return: token used to restore the previous operation with `reset_operation`
+    """
+    return _operation.set(operation)
+
+
+def reset_operation(token):
+    """restore resource operation that was active before `set_operation` was called"""
+    _operation.reset(token)
+
+
+class Hooks:
+    """Registry of callbacks invoked for request events of a `Connection`
+
+    Callbacks receive a dict describing the event. Request related events contain `method`, `url`, `resource`,
+    `operation` and `path` (the path template of the resource, e.g. `/object/networks/{uuid}`, which is None for
+    requests that have not been issued by a resource). Exceptions raised by callbacks are logged and ignored
+
+    Example: `fmc.conn.hooks.register(hooks.POST_RESPONSE, lambda event: print(event['path'], event['latency']))`
+    """
+
+    def __init__(self):
+        #: registered callbacks by event
+        self.callbacks: Dict[str, Tuple[Callable[[Dict], None], ...]] = {}
+
+    def register(self, event: str, callback: Callable[[Dict], None]):
+        """register callback for an event
+
+        :param event: name of the event. Options: see `EVENTS`
+        :type event: str
+        :param callback: callable invoked with a dict describing the event
+        :type callback: Callable
+        """
+        global _registered
+        if event not in EVENTS:
+            raise ValueError(f'Unsupported event {event}. Supported events: {", ".join(EVENTS)}')
+        with _lock:
+            self.callbacks[event] = self.callbacks.get(event, ()) + (callback,)
+            _registered += 1
+
+    def unregister(self, event: str, callback: Callable[[Dict], None]):
+        """remove callback registered for an event
+
+        :param event: name of the event
+        :type event: str
+        :param callback: registered callable
+        :type callback: Callable
+        """
+        global _registered
+        with _lock:
+            callbacks = list(self.callbacks.get(event, ()))
+            if callback not in callbacks:
+                return
+            callbacks.remove(callback)
+            _registered -= 1
+            if callbacks:
+                self.callbacks[event] = tuple(callbacks)
+            else:
+                del self.callbacks[event]
+
+    def emit(self, event: str, payload: Dict):
+        """invoke all callbacks registered for an event. The resource operation of the current context is added
+        to request related events
+
+        :param event: name of the event
+        :type event: str
+        :param payload: description of the event
+        :type payload: dict
+        """
+        callbacks = self.callbacks.get(event)
+        if not callbacks:
+            return
+        if 'method' in payload:
+            operation = _operation.get()
+            payload['resource'] = operation.resource if operation else None
+            payload['operation'] = operation.name if operation else None
+            payload['path'] = operation.path if operation else None
+        payload['event'] = event
+        for callback in callbacks:
+            try:
+                callback(payload)
+            except Exception:
+                logger.exception('Hook for event %s failed', event)
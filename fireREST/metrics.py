@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+
+import math
+import threading
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
+
+from . import defaults
+from .hooks import POST_RESPONSE, RATE_LIMIT, REFRESH, RETRY, Hooks
+
+#: quantiles reported by `MetricsCollector.summary` and `MetricsCollector.prometheus`
+QUANTILES = (0.5, 0.95, 0.99)
+
+
+def percentile(samples, quantile: float):
+    """calculate percentile of samples using the nearest-rank method
+
+    :param samples: sorted samples
+    :type samples: Sequence[float]
+    :param quantile: quantile between 0 and 1
+    :type quantile: float
+    :return: value at the given quantile or None if there are no samples
+    :rtype: float, optional
+    """
+    if not samples:
+        return None
+    return samples[max(math.ceil(quantile * len(samples)) - 1, 0)]
+
+
+class RequestStats:
+    """Aggregated request metrics of a resource and http method. Latency quantiles are calculated from the most
+    recent `samples` requests, all other values are totals"""
+
+    def __init__(self, samples: int):
+        self.count = 0
+        self.errors = 0
+        self.latency = 0.0
+        self.decode_time = 0.0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.latencies: Deque[float] = deque(maxlen=samples)
+
+    def add(self, event: Dict):
+        self.count += 1
+        self.errors += 1 if event['error'] is not None or (event['status'] or 0) >= 400 else 0
+        self.latency += event['latency']
+        self.decode_time += event['decode_time']
+        self.bytes_in += event['bytes_in']
+        self.bytes_out += event['bytes_out']
+        self.latencies.append(event['latency'])
+
+
+class MetricsCollector:
+    """In-memory aggregator of request metrics. Requests are grouped by resource class (`''` for requests that have
+    not been issued by a resource, e.g. authentication) and http method
+
+    Example: `metrics = MetricsCollector().attach(fmc.conn.hooks); ...; print(metrics.prometheus())`
+    """
+
+    def __init__(self, samples=defaults.API_METRICS_SAMPLES):
+        """Initialize metrics collector
+
+        :param samples: number of recent requests per resource and method used to calculate latency quantiles.
+                        Defaults to `1024`
+        :type samples: int, optional
+        """
+        self.samples = samples
+        self.requests: Dict[Tuple[str, str], RequestStats] = {}
+        self.retries: Dict[Tuple[str, str], int] = {}
+        self.refreshes = 0
+        self.logins = 0
+        self.rate_limit_delays = 0
+        self.rate_limit_delay = 0.0
+        self._lock = threading.Lock()
+
+    def attach(self, hooks: Hooks):
+        """register collector for all request events
+
+        :param hooks: hooks of a connection, e.g. `fmc.conn.hooks`
+        :type hooks: Hooks
+        :return: collector
+        :rtype: MetricsCollector
+        """
+        hooks.register(POST_RESPONSE, self.on_response)
+        hooks.register(RETRY, self.on_retry)
+        hooks.register(REFRESH, self.on_refresh)
+        hooks.register(RATE_LIMIT, self.on_rate_limit)
+        return self
+
+    def detach(self, hooks: Hooks):
+        """remove collector from hooks
+
+        :param hooks: hooks the collector has been attached to
+        :type hooks: Hooks
+        """
+        hooks.unregister(POST_RESPONSE, self.on_response)
+        hooks.unregister(RETRY, self.on_retry)
+        hooks.unregister(REFRESH, self.on_refresh)
+        hooks.unregister(RATE_LIMIT, self.on_rate_limit)
+
+    def on_response(self, event: Dict):
+        key = (event['resource'] or '', event['method'])
+        with self._lock:
+            stats = self.requests.get(key)
+            if stats is None:
+                stats = self.requests[key] = RequestStats(self.samples)
+            stats.add(event)
+
+    def on_retry(self, event: Dict):
+        key = (event['resource'] or '', event['method'])
+        with self._lock:
+            self.retries[key] = self.retries.get(key, 0) + 1
+
+    def on_refresh(self, event: Dict):
+        with self._lock:
+            self.refreshes += 1
+            self.logins += 1 if event['login'] else 0
+
+    def on_rate_limit(self, event: Dict):
+        with self._lock:
+            self.rate_limit_delays += 1
+            self.rate_limit_delay += event['delay']
+
+    def summary(self, resource: Optional[str] = None):
+        """get aggregated request metrics
+
+        :param resource: only include requests of a resource class, e.g. `Network`
+        :type resource: str, optional
+        :return: metrics by resource and http method including count, errors, latency quantiles (`p50`, `p95`,
+                 `p99`), total and mean latency, decode time and bytes sent and received
+        :rtype: Dict[Tuple[str, str], dict]
+        """
+        with self._lock:
+            snapshot = [(key, stats, sorted(stats.latencies)) for key, stats in self.requests.items()]
+        summary = {}
+        for key, stats, latencies in snapshot:
+            if resource is not None and key[0] != resource:
+                continue
+            summary[key] = {
+                'count': stats.count,
+                'errors': stats.errors,
+                'retries': self.retries.get(key, 0),
+                **{f'p{round(q * 100)}': percentile(latencies, q) for q in QUANTILES},
+                'latency': stats.latency,
+                'mean': stats.latency / stats.count,
+                'decode_time': stats.decode_time,
+                'bytes_in': stats.bytes_in,
+                'bytes_out': stats.bytes_out,
+            }
+        return summary
+
+    def prometheus(self, prefix='firerest'):
+        """export metrics in prometheus text format
+
+        :param prefix: prefix of metric names. Defaults to `firerest`
+        :type prefix: str, optional
+        :return: metrics in prometheus text exposition format
+        :rtype: str
+        """
+        summary = self.summary()
+        lines = [
+            f'# HELP {prefix}_request_duration_seconds Latency of api requests',
+            f'# TYPE {prefix}_request_duration_seconds summary',
+        ]
+        for (resource, method), stats in sorted(summary.items()):
+            labels = f'resource="{_escape(resource)}",method="{method}"'
+            for quantile in QUANTILES:
+                value = stats[f'p{round(quantile * 100)}']
+                lines.append(f'{prefix}_request_duration_seconds{{{labels},quantile="{quantile}"}} {value}')
+            lines.append(f'{prefix}_request_duration_seconds_sum{{{labels}}} {stats["latency"]}')
+            lines.append(f'{prefix}_request_duration_seconds_count{{{labels}}} {stats["count"]}')
+        for name, field, description in (
+            ('request_errors_total', 'errors', 'Failed api requests'),
+            ('request_retries_total', 'retries', 'Retried api requests'),
+            ('decode_seconds_total', 'decode_time', 'Time spent decoding api responses'),
+            ('response_bytes_total', 'bytes_in', 'Bytes received from the api'),
+            ('request_bytes_total', 'bytes_out', 'Bytes sent to the api'),
+        ):
+            lines.append(f'# HELP {prefix}_{name} {description}')
+            lines.append(f'# TYPE {prefix}_{name} counter')
+            for (resource, method), stats in sorted(summary.items()):
+                labels = f'resource="{_escape(resource)}",method="{method}"'
+                lines.append(f'{prefix}_{name}{{{labels}}} {stats[field]}')
+        for name, value, description in (
+            ('token_refreshes_total', self.refreshes, 'Access token refreshes'),
+            ('logins_total', self.logins, 'Re-authentications after failed token refreshes'),
+            ('rate_limit_delays_total', self.rate_limit_delays, 'Requests delayed by the client-side rate limiter'),
+            ('rate_limit_delay_seconds_total', self.rate_limit_delay, 'Time requests were delayed by the rate limiter'),
+        ):
+            lines.append(f'# HELP {prefix}_{name} {description}')
+            lines.append(f'# TYPE {prefix}_{name} counter')
+            lines.append(f'{prefix}_{name} {value}')
+        return '\n'.join(lines) + '\n'
+
+
+def _escape(value: str):
+    """escape prometheus label value"""
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
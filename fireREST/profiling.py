@@ -0,0 +1,345 @@
+# -*- coding: utf-8 -*-
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from types import GeneratorType
+from typing import Dict, Optional
+
+#: time spent waiting for api responses
+NETWORK = 'network'
+#: time requests were delayed by the client-side rate limiter
+RATE_LIMIT = 'rate_limit'
+#: time spent waiting before failed requests are retried
+RETRY = 'retry'
+#: time the calling thread waited for worker threads of concurrent paging and bulk operations. The time spent by
+#: the workers is reported in the other categories
+WORKERS = 'workers'
+#: time spent serializing requests and deserializing responses
+SERIALIZATION = 'serialization'
+#: time spent preparing payloads (`utils.sanitize_payload`, size validation and chunking)
+PAYLOAD = 'payload'
+#: time spent building log messages
+LOGGING = 'logging'
+#: time spent within `resolve_by_name`, `support_params` and `minimum_version_required` (excluding the requests
+#: they issue, e.g. name lookups)
+DECORATORS = 'decorators'
+#: remaining time spent within resource operations and connection methods
+CLIENT = 'client'
+
+#: categories client-side time is split into
+CATEGORIES = (NETWORK, RATE_LIMIT, RETRY, WORKERS, SERIALIZATION, PAYLOAD, LOGGING, DECORATORS, CLIENT)
+
+#: operation name used for requests that are not issued by a resource, e.g. authentication
+CONNECTION = '(connection)'
+
+#: number of active profiles. Operations are only timed if > 0
+_active = 0
+#: guards `_active` and the profiles of all connections
+_lock = threading.Lock()
+_local = threading.local()
+_profile: ContextVar[Optional['Profile']] = ContextVar('fireREST_profile', default=None)
+_operation: ContextVar[str] = ContextVar('fireREST_profile_operation', default=CONNECTION)
+
+
+class Profile:
+    """Wall time of a profiled block split into time spent in fireREST per resource operation and user code
+
+    Time spent within fireREST is attributed to the resource operation (e.g. `Network.get`) that is performed and
+    split into `CATEGORIES`. Each category only contains time that is not part of another category, e.g. the time of
+    a name lookup performed by `resolve_by_name` is reported as network and serialization time and only the
+    remaining time of the decorator as decorator overhead. Time spent outside of fireREST by the thread that started
+    the profile is reported as user code. Requests sent by worker threads (paging, bulk operations) overlap with the
+    operation that started them, their time is reported per category and the time the operation waited for them as
+    `workers`. `workers` is not part of the total time of an operation and not subtracted from user code
+    """
+
+    def __init__(self):
+        self.operations: Dict[str, Dict[str, float]] = {}
+        self.calls: Dict[str, int] = {}
+        self.start = 0.0
+        self.end: Optional[float] = None
+        self.fireREST = 0.0
+        self.thread = threading.get_ident()
+        self._lock = threading.Lock()
+
+    def add(self, operation: str, category: str, seconds: float):
+        with self._lock:
+            categories = self.operations.get(operation)
+            if categories is None:
+                categories = self.operations[operation] = dict.fromkeys(CATEGORIES, 0.0)
+            categories[category] += seconds
+
+    def count(self, operation: str):
+        with self._lock:
+            self.calls[operation] = self.calls.get(operation, 0) + 1
+
+    @property
+    def wall(self):
+        """wall time of the profiled block in seconds"""
+        return (self.end if self.end is not None else time.perf_counter()) - self.start
+
+    @property
+    def user(self):
+        """time in seconds spent outside of fireREST by the thread that started the profile"""
+        return max(self.wall - self.fireREST, 0.0)
+
+    def summary(self):
+        """get time per resource operation and category
+
+        :return: mapping of operation to number of calls, total time and time per category in seconds. The total
+                 time contains all categories except `workers`, which overlaps with the time spent by worker threads
+        :rtype: Dict[str, dict]
+        """
+        with self._lock:
+            return {
+                operation: {
+                    'calls': self.calls.get(operation, 0),
+                    'total': sum(value for category, value in categories.items() if category != WORKERS),
+                    **categories,
+                }
+                for operation, categories in self.operations.items()
+            }
+
+    def report(self):
+        """format profile as text table. Operations are sorted by total time, all values are in milliseconds
+
+        :return: report
+        :rtype: str
+        """
+        summary = sorted(self.summary().items(), key=lambda item: item[1]['total'], reverse=True)
+        width = max([len('operation')] + [len(operation) for operation, _ in summary])
+        columns = ('calls', 'total') + CATEGORIES
+        lines = [f'{"operation":<{width}}' + ''.join(f'{column:>15}' for column in columns)]
+        for operation, stats in summary:
+            values = [f'{stats["calls"]:>15}'] + [f'{stats[column] * 1000:>15.2f}' for column in columns[1:]]
+            lines.append(f'{operation:<{width}}' + ''.join(values))
+        lines.append('')
+        lines.append(
+            f'wall time: {self.wall * 1000:.2f} ms, fireREST: {self.fireREST * 1000:.2f} ms, '
+            f'user code: {self.user * 1000:.2f} ms'
+        )
+        return '\n'.join(lines)
+
+    def __str__(self):
+        return self.report()
+
+
+@contextmanager
+def profile(conn):
+    """Profile all operations performed by a connection within the context, including operations performed by other
+    threads. Operations of other connections are not recorded. Only one profile can be active per connection
+
+    Example: `with profiling.profile(fmc.conn) as p: ...; print(p.report())`
+
+    :param conn: connection that is profiled. The profile is stored as `conn.profiler` while the context is active
+    :type conn: fireREST.fmc.Connection
+    :return: profile that is populated while the context is active
+    :rtype: Profile
+    """
+    global _active
+    result = Profile()
+    with _lock:
+        if conn.profiler is not None:
+            raise RuntimeError('Another profile is already active for this connection')
+        result.start = time.perf_counter()
+        conn.profiler = result
+        _active += 1
+    try:
+        yield result
+    finally:
+        with _lock:
+            _active -= 1
+            conn.profiler = None
+        result.end = time.perf_counter()
+
+
+def active():
+    """verify if any profile is active
+
+    :rtype: bool
+    """
+    return _active > 0
+
+
+class _Attached:
+    """Context in which operations are recorded by a profile"""
+
+    __slots__ = ('profile', 'token')
+
+    def __init__(self, profile: 'Profile'):
+        self.profile = profile
+        self.token = None
+
+    def __enter__(self):
+        self.token = _profile.set(self.profile)
+        return self
+
+    def __exit__(self, *args):
+        _profile.reset(self.token)
+
+
+def attach(conn):
+    """record operations performed within the context by the profile of `conn`. Entry point for operations of a
+    connection, the context is inherited by worker threads that copy the context of the caller
+
+    :param conn: connection performing the operation
+    :type conn: fireREST.fmc.Connection
+    :return: context manager
+    """
+    if not _active or _profile.get() is not None:
+        return _NULL_SECTION
+    profiler = conn.profiler
+    if profiler is None:
+        return _NULL_SECTION
+    return _Attached(profiler)
+
+
+class Section:
+    """Timed section of a category. Time of nested sections is only attributed to the innermost section"""
+
+    __slots__ = ('category', 'profile', 'start', 'children')
+
+    def __init__(self, category: str, profile: 'Profile'):
+        self.category = category
+        self.profile = profile
+        self.start = 0.0
+        self.children = 0.0
+
+    def __enter__(self):
+        stack = getattr(_local, 'stack', None)
+        if stack is None:
+            stack = _local.stack = []
+        stack.append(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *args):
+        elapsed = time.perf_counter() - self.start
+        stack = _local.stack
+        stack.pop()
+        if stack:
+            stack[-1].children += elapsed
+        elif threading.get_ident() == self.profile.thread:
+            self.profile.fireREST += elapsed
+        self.profile.add(_operation.get(), self.category, elapsed - self.children)
+
+
+class _NullSection:
+    """Section used if no profile is active"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+
+_NULL_SECTION = _NullSection()
+
+
+def section(category: str):
+    """time code within the context as part of a category if a profile is active
+
+    Example: `with profiling.section(profiling.NETWORK): response = session.request(...)`
+
+    :param category: category of the section. Options: see `CATEGORIES`
+    :type category: str
+    :return: context manager
+    """
+    if not _active:
+        return _NULL_SECTION
+    current = _profile.get()
+    if current is None:
+        return _NULL_SECTION
+    return Section(category, current)
+
+
+def decorator(wrapper, f):
+    """instrument decorator of a resource operation. While a profile is active the time spent in `wrapper` is
+    recorded as decorator overhead and the time of the decorated operation `f` as client time
+
+    :param wrapper: wrapper function returned by the decorator
+    :type wrapper: Callable
+    :param f: function that is decorated by `wrapper`. Must be the function called by `wrapper`
+    :type f: Callable
+    :return: instrumented wrapper
+    :rtype: Callable
+    """
+
+    @wraps(wrapper)
+    def profiled(*args, **kwargs):
+        if not _active:
+            return wrapper(*args, **kwargs)
+        current = _profile.get()
+        profile_token = None
+        if current is None:
+            current = args[0].conn.profiler
+            if current is None:
+                return wrapper(*args, **kwargs)
+            profile_token = _profile.set(current)
+        operation = f'{type(args[0]).__name__}.{wrapper.__name__}'
+        token = None
+        if _operation.get() != operation:
+            token = _operation.set(operation)
+            current.count(operation)
+        try:
+            with Section(DECORATORS, current):
+                result = wrapper(*args, **kwargs)
+        finally:
+            if token is not None:
+                _operation.reset(token)
+            if profile_token is not None:
+                _profile.reset(profile_token)
+        if token is not None and isinstance(result, GeneratorType):
+            return _iter_profiled(result, operation, current)
+        return result
+
+    profiled._profiled = True  # type: ignore[attr-defined]
+    return profiled
+
+
+def method(f):
+    """instrument resource operation wrapped by a decorator that uses `decorator`. Time spent within the operation
+    is recorded as client time while a profile is active
+
+    :param f: resource operation or instrumented decorator
+    :type f: Callable
+    :return: instrumented operation
+    :rtype: Callable
+    """
+    if getattr(f, '_profiled', False):
+        return f
+
+    @wraps(f)
+    def profiled(*args, **kwargs):
+        if not _active:
+            return f(*args, **kwargs)
+        current = _profile.get()
+        if current is None:
+            return f(*args, **kwargs)
+        with Section(CLIENT, current):
+            return f(*args, **kwargs)
+
+    return profiled
+
+
+def _iter_profiled(iterator, operation: str, current: 'Profile'):
+    """yield items of a generator returned by a resource operation. Requests of generators are issued lazily, so
+    items are retrieved within the operation. Items retrieved after the profile ended are not recorded"""
+    while True:
+        profile_token = _profile.set(current if current.end is None else None)
+        token = _operation.set(operation)
+        try:
+            with section(CLIENT):
+                item = next(iterator)
+        except StopIteration:
+            return
+        finally:
+            _operation.reset(token)
+            _profile.reset(profile_token)
+        yield item
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from logging import getLogger
+
+from . import defaults
+
+logger = getLogger(__name__)
+
+
+class RateLimiter:
+    """Client-side token bucket used to pace api requests
+
+    The bucket holds up to `burst` tokens and is refilled at a rate of `(limit - burst) / period` tokens per second,
+    which guarantees that no more than `limit` requests are sent within any `period`. Each request reserves a token
+    and waits until the reservation is due, so concurrent callers are spread out evenly instead of all hitting the
+    rate limit at the same time. A single `RateLimiter` can be shared by multiple connections to the same FMC
+    """
+
+    def __init__(
+        self,
+        limit=defaults.API_RATE_LIMIT,
+        period=defaults.API_RATE_LIMIT_PERIOD,
+        burst=defaults.API_RATE_LIMIT_BURST,
+    ):
+        """Initialize rate limiter
+
+        :param limit: max. number of requests within `period`. Defaults to `120`
+        :type limit: int, optional
+        :param period: period in seconds the limit applies to. Defaults to `60`
+        :type period: float, optional
+        :param burst: number of requests that can be sent without pacing. Defaults to `10`
+        :type burst: int, optional
+        """
+        burst = max(1, min(burst, limit - 1)) if limit > 1 else 1
+        self.limit = limit
+        self.period = period
+        self.burst = burst
+        self.rate = max(limit - burst, 1) / period
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self):
+        """Reserve a token for a single request
+
+        :return: seconds the caller has to wait before the request may be sent
+        :rtype: float
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+            return max(wait, self.blocked_until - now)
+
+    def acquire(self):
+        """Block the calling thread until a request may be sent
+
+        :return: seconds waited
+        :rtype: float
+        """
+        wait = self.reserve()
+        if wait > 0:
+            logger.debug('Rate limiter delays request by %.2f seconds', wait)
+            time.sleep(wait)
+        return wait
+
+    def penalize(self, seconds=None):
+        """Stop issuing requests for the given amount of time, e.g. after the api signaled that the rate limit
+        has been exceeded. All tokens are drained to ensure requests are paced once the block expires
+
+        :param seconds: time in seconds no requests should be sent. Defaults to the refill interval of one token
+        :type seconds: float, optional
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.tokens = min(self.tokens, 0.0)
+            if seconds is None:
+                seconds = 1 / self.rate
+            self.blocked_until = max(self.blocked_until, now + seconds)
+
+    def update(self, response):
+        """Adjust rate limiter state using the status code and rate limit headers of an api response
+
+        :param response: api response
+        :type response: requests.Response
+        """
+        headers = response.headers
+        retry_after = parse_retry_after(headers.get('Retry-After'))
+        if response.status_code == 429 or retry_after is not None:
+            self.penalize(retry_after)
+        remaining = headers.get('X-RateLimit-Remaining')
+        if remaining is not None and remaining.isdigit():
+            with self._lock:
+                self._refill(time.monotonic())
+                self.tokens = min(self.tokens, float(remaining))
+
+
+def parse_retry_after(value):
+    """parse value of a `Retry-After` header
+
+    :param value: header value in seconds or http date format
+    :type value: str, optional
+    :return: seconds to wait or None if value is missing or invalid
+    :rtype: float, optional
+    """
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sqlite3
+import time
+import zlib
+from contextlib import closing
+from logging import getLogger
+from typing import Optional
+
+from . import defaults
+from .utils import cache_dir
+
+logger = getLogger(__name__)
+
+
+class ReferenceStore:
+    """On-disk store for reference data that only changes with software or vdb updates, e.g. applications, url
+    categories and countries
+
+    Responses are stored zlib-compressed in a sqlite database. Entries are keyed by request url (which includes the
+    hostname of the fmc) and carry a fingerprint of the fmc software and vdb version they were retrieved from. Entries
+    are only returned if the fingerprint matches and they did not exceed their max. age
+    """
+
+    def __init__(self, path=None, max_age=defaults.API_REFERENCE_STORE_MAX_AGE):
+        """Initialize reference store
+
+        :param path: path to database file. Defaults to `references.sqlite` within `utils.cache_dir()`
+        :type path: str, optional
+        :param max_age: time in seconds stored responses are valid. Defaults to `604800` (one week)
+        :type max_age: float, optional
+        """
+        self.path = path or os.path.join(cache_dir(), defaults.API_REFERENCE_STORE_FILE)
+        self.max_age = max_age
+        self._initialized = False
+
+    @staticmethod
+    def fingerprint(installed_version, vdb_version: Optional[str] = None):
+        """generate fingerprint of the fmc software and vdb version
+
+        :return: fingerprint
+        :rtype: str
+        """
+        return f'{installed_version}/{vdb_version or ""}'
+
+    def _connect(self):
+        """open database and create schema on first use"""
+        if not self._initialized:
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, mode=0o700, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=defaults.API_REFERENCE_STORE_TIMEOUT)
+        if not self._initialized:
+            with conn:
+                conn.execute(
+                    'CREATE TABLE IF NOT EXISTS responses '
+                    '(key TEXT PRIMARY KEY, fingerprint TEXT NOT NULL, updated REAL NOT NULL, payload BLOB NOT NULL)'
+                )
+            self._initialized = True
+        return conn
+
+    def load(self, key: str, fingerprint: str):
+        """load stored response
+
+        :param key: request url including query parameters
+        :type key: str
+        :param fingerprint: fingerprint generated by `ReferenceStore.fingerprint`
+        :type fingerprint: str
+        :return: serialized response or None if no valid response is stored
+        :rtype: bytes, optional
+        """
+        try:
+            with closing(self._connect()) as conn:
+                row = conn.execute(
+                    'SELECT payload FROM responses WHERE key = ? AND fingerprint = ? AND updated > ?',
+                    (key, fingerprint, time.time() - self.max_age),
+                ).fetchone()
+            return zlib.decompress(row[0]) if row else None
+        except (sqlite3.Error, zlib.error) as error:
+            logger.warning('Ignoring unreadable reference store %s (%s)', self.path, error)
+            return None
+
+    def store(self, key: str, fingerprint: str, payload: bytes):
+        """store response. Entries that exceeded their max. age are purged
+
+        :param key: request url including query parameters
+        :type key: str
+        :param fingerprint: fingerprint generated by `ReferenceStore.fingerprint`
+        :type fingerprint: str
+        :param payload: serialized response
+        :type payload: bytes
+        """
+        now = time.time()
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute('DELETE FROM responses WHERE updated <= ?', (now - self.max_age,))
+                conn.execute(
+                    'INSERT OR REPLACE INTO responses (key, fingerprint, updated, payload) VALUES (?, ?, ?, ?)',
+                    (key, fingerprint, now, zlib.compress(payload)),
+                )
+        except sqlite3.Error as error:
+            logger.warning('Failed to update reference store %s (%s)', self.path, error)
+
+    def clear(self):
+        """remove all stored responses"""
+        with closing(self._connect()) as conn, conn:
+            conn.execute('DELETE FROM responses')
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+
+import random
+from logging import getLogger
+
+from . import defaults
+from .ratelimit import parse_retry_after
+
+logger = getLogger(__name__)
+
+#: http methods that can safely be repeated
+IDEMPOTENT_METHODS = frozenset({'get', 'put', 'delete', 'head', 'options'})
+
+#: retry budget key used for connection errors and timeouts
+CONNECTION_ERROR = 'connection'
+
+
+class RetryPolicy:
+    """Retry policy applied to all api requests of a `Connection`
+
+    Failed requests are retried using exponential backoff with full jitter unless the api response includes a
+    `Retry-After` header. Delays are raised to the min. delay of the status code, by default retries of rate limited
+    requests span at least one rate limit period of FMC. Each status code (and connection errors) has its own retry budget per request.
+    Requests rejected by the rate limiter (429) are always retried since they have not been processed by FMC.
+    Server errors and connection errors are only retried for idempotent operations unless `retry_non_idempotent`
+    is enabled
+    """
+
+    def __init__(
+        self,
+        budget=None,
+        backoff_base=defaults.API_RETRY_BACKOFF_BASE,
+        backoff_factor=defaults.API_RETRY_BACKOFF_FACTOR,
+        backoff_max=defaults.API_RETRY_BACKOFF_MAX,
+        backoff_min=None,
+        jitter=True,
+        retry_non_idempotent=False,
+        on_retry=None,
+    ):
+        """Initialize retry policy
+
+        :param budget: max. number of retries per status code. Use `retry.CONNECTION_ERROR` as key for connection
+                       errors and timeouts. Defaults to `defaults.API_RETRY_BUDGET`
+        :type budget: dict, optional
+        :param backoff_base: delay in seconds before the first retry. Defaults to `1`
+        :type backoff_base: float, optional
+        :param backoff_factor: multiplier applied to the delay after each retry. Defaults to `2`
+        :type backoff_factor: float, optional
+        :param backoff_max: max. delay in seconds between two attempts. Defaults to `60`
+        :type backoff_max: float, optional
+        :param backoff_min: min. delay in seconds per status code, applied if the response does not include a
+                            `Retry-After` header. Defaults to `defaults.API_RETRY_BACKOFF_MIN`
+        :type backoff_min: dict, optional
+        :param jitter: randomize delay between `0` and the calculated backoff. Defaults to `True`
+        :type jitter: bool, optional
+        :param retry_non_idempotent: retry POST operations on server and connection errors. Defaults to `False`
+        :type retry_non_idempotent: bool, optional
+        :param on_retry: callback invoked with a dict describing each retry (method, url, attempt, delay, status,
+                         error) before the request is repeated
+        :type on_retry: Callable, optional
+        """
+        self.budget = dict(defaults.API_RETRY_BUDGET if budget is None else budget)
+        self.backoff_base = backoff_base
+        self.backoff_factor = backoff_factor
+        self.backoff_max = backoff_max
+        self.backoff_min = dict(defaults.API_RETRY_BACKOFF_MIN if backoff_min is None else backoff_min)
+        self.jitter = jitter
+        self.retry_non_idempotent = retry_non_idempotent
+        self.on_retry = on_retry
+
+    def is_retryable(self, method: str, reason, retries: int):
+        """verify if a failed request should be retried
+
+        :param method: http operation (post, get, put, delete)
+        :type method: str
+        :param reason: status code of the response or `retry.CONNECTION_ERROR`
+        :type reason: Union[int, str]
+        :param retries: number of retries already performed for `reason`
+        :type retries: int
+        :return: True if request should be retried
+        :rtype: bool
+        """
+        if retries >= self.budget.get(reason, 0):
+            return False
+        if reason == 429:
+            return True
+        return method.lower() in IDEMPOTENT_METHODS or self.retry_non_idempotent
+
+    def backoff(self, retries: int, response=None):
+        """calculate delay before the next attempt
+
+        :param retries: number of retries already performed
+        :type retries: int
+        :param response: api response of the failed attempt
+        :type response: requests.Response, optional
+        :return: delay in seconds
+        :rtype: float
+        """
+        if response is not None:
+            retry_after = parse_retry_after(response.headers.get('Retry-After'))
+            if retry_after is not None:
+                return min(retry_after, self.backoff_max)
+        delay = min(self.backoff_max, self.backoff_base * self.backoff_factor**retries)
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        if response is not None and response.status_code in self.backoff_min:
+            delay = max(delay, min(self.backoff_min[response.status_code], self.backoff_max))
+        return delay
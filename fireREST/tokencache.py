@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from logging import getLogger
+
+from . import defaults
+from .utils import cache_dir
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - windows
+    fcntl = None  # type: ignore[assignment]
+
+logger = getLogger(__name__)
+
+
+class TokenCache:
+    """On-disk cache for authentication tokens, domains and server version of fmc sessions
+
+    Entries are keyed by protocol, hostname and username. The cache file is only readable by the current user,
+    access is serialized across threads and processes using a lock file and updates are written atomically
+    """
+
+    def __init__(self, path=None):
+        """Initialize token cache
+
+        :param path: path to cache file. Defaults to `tokens.json` within `utils.cache_dir()`
+        :type path: str, optional
+        """
+        self.path = path or os.path.join(cache_dir(), defaults.API_TOKEN_CACHE_FILE)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(protocol: str, hostname: str, username: str):
+        """generate cache key for an fmc session
+
+        :return: cache key
+        :rtype: str
+        """
+        return f'{protocol}://{username}@{hostname}'
+
+    @contextmanager
+    def _locked(self):
+        """serialize cache access across threads and processes"""
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        with self._lock:
+            with open(f'{self.path}.lock', 'a') as lockfile:
+                if fcntl:
+                    fcntl.flock(lockfile, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    if fcntl:
+                        fcntl.flock(lockfile, fcntl.LOCK_UN)
+
+    def _read(self):
+        try:
+            with open(self.path, encoding='utf-8') as fh:
+                return json.load(fh)
+        except FileNotFoundError:
+            return {}
+        except ValueError:
+            logger.warning('Ignoring corrupt token cache %s', self.path)
+            return {}
+
+    def _write(self, entries):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix='.tokens-')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as fh:
+                json.dump(entries, fh)
+            os.chmod(tmp, 0o600)
+            os.replace(tmp, self.path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def load(self, key: str):
+        """load cached session
+
+        :param key: cache key generated by `TokenCache.key`
+        :type key: str
+        :return: cached session or None if no valid session is cached
+        :rtype: dict, optional
+        """
+        with self._locked():
+            entry = self._read().get(key)
+        if entry and time.time() - entry.get('updated', 0) < defaults.API_TOKEN_CACHE_MAX_AGE:
+            return entry
+        return None
+
+    def store(self, key: str, entry: dict):
+        """store session in cache. entries that exceeded their max. age are purged
+
+        :param key: cache key generated by `TokenCache.key`
+        :type key: str
+        :param entry: session data
+        :type entry: dict
+        """
+        now = time.time()
+        with self._locked():
+            entries = {
+                k: v for k, v in self._read().items() if now - v.get('updated', 0) < defaults.API_TOKEN_CACHE_MAX_AGE
+            }
+            entries[key] = {**entry, 'updated': now}
+            self._write(entries)
+
+    def delete(self, key: str):
+        """remove session from cache
+
+        :param key: cache key generated by `TokenCache.key`
+        :type key: str
+        """
+        with self._locked():
+            entries = self._read()
+            if entries.pop(key, None) is not None:
+                self._write(entries)
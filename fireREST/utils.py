@@ -1,21 +1,72 @@
-import sys
+import json
+import os
 from copy import deepcopy
-from functools import wraps
+from functools import lru_cache, wraps
 from logging import getLogger
-from re import sub
-from typing import Dict
+from time import sleep
+from types import GeneratorType
+from typing import Dict, Iterator, List, Tuple, Union
 from uuid import UUID
 
 import packaging
-from requests.exceptions import HTTPError
-from retry import retry
+from requests.exceptions import ConnectionError as RequestConnectionError, HTTPError, Timeout
 
+from . import cache, defaults, hooks, profiling
 from . import exceptions as exc
 from .mapping import FILTERS, PARAMS
+from .retry import CONNECTION_ERROR
 
 logger = getLogger(__name__)
 
 
+def cache_dir():
+    """get directory used by fireREST to persist data across processes. `FIREREST_CACHE_DIR` takes precedence over
+    `XDG_CACHE_HOME`, otherwise `~/.cache/fireREST` is used
+
+    :return: path to cache directory
+    :rtype: str
+    """
+    if os.environ.get('FIREREST_CACHE_DIR'):
+        return os.environ['FIREREST_CACHE_DIR']
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'fireREST')
+
+
+class LazyJson:
+    """Log argument that is serialized to json only if the log record is emitted"""
+
+    __slots__ = ('obj', 'kwargs')
+
+    def __init__(self, obj, **kwargs):
+        """Initialize lazy json log argument
+
+        :param obj: object that will be serialized
+        :param kwargs: arguments passed to `json.dumps`
+        """
+        self.obj = obj
+        self.kwargs = kwargs
+
+    def __str__(self):
+        return json.dumps(self.obj, **self.kwargs)
+
+
+def response_json(response, codec=None):
+    """decode json body of an api response. The decoded body is cached on the response object, so it is only
+    decoded once even if it is accessed multiple times (e.g. for logging and pagination)
+
+    :param response: api response
+    :type response: requests.Response
+    :param codec: json codec used to decode the raw response content. Defaults to `response.json()`
+    :type codec: fireREST.codec.JsonCodec, optional
+    :return: decoded response body
+    :rtype: Union[dict, list]
+    """
+    if '_decoded_json' not in response.__dict__:
+        with profiling.section(profiling.SERIALIZATION):
+            response.__dict__['_decoded_json'] = codec.loads(response.content) if codec else response.json()
+    return response.__dict__['_decoded_json']
+
+
 def is_uuid(val: str):
     """verify if a value is valid uuid
 
@@ -48,31 +99,67 @@ def is_getbyid_operation(url: str):
     return False
 
 
+#: attribute of `Resource` that defines the minimum version required for each operation
+MINIMUM_VERSION_ATTRIBUTES = {
+    'create': 'MINIMUM_VERSION_REQUIRED_CREATE',
+    'get': 'MINIMUM_VERSION_REQUIRED_GET',
+    'iter': 'MINIMUM_VERSION_REQUIRED_GET',
+    'resolve_names': 'MINIMUM_VERSION_REQUIRED_GET',
+    'update': 'MINIMUM_VERSION_REQUIRED_UPDATE',
+    'delete': 'MINIMUM_VERSION_REQUIRED_DELETE',
+    'bulk_create': 'MINIMUM_VERSION_REQUIRED_CREATE',
+    'bulk_update': 'MINIMUM_VERSION_REQUIRED_UPDATE',
+    'bulk_delete': 'MINIMUM_VERSION_REQUIRED_DELETE',
+}
+
+
+@lru_cache(maxsize=None)
+def parse_version(value: str):
+    """parse version string. Results are cached since resources only use a small set of distinct versions
+
+    :param value: version string, e.g. `7.4.0`
+    :type value: str
+    :return: parsed version
+    :rtype: packaging.version.Version
+    """
+    # noinspection PyUnresolvedReferences
+    return packaging.version.parse(value)
+
+
+def minimum_version(resource, operation: str):
+    """get minimum fmc version required for an operation of a resource
+
+    :param resource: resource object or class
+    :type resource: Union[fireREST.fmc.Resource, type]
+    :param operation: name of the operation. Options: see `MINIMUM_VERSION_ATTRIBUTES`
+    :type operation: str
+    :return: minimum version required
+    :rtype: packaging.version.Version
+    """
+    return parse_version(getattr(resource, MINIMUM_VERSION_ATTRIBUTES[operation]))
+
+
 def minimum_version_required(func=None, version=None):
     """Verify if operation is supported by fmc
 
     decorator that verifies if the called operation is supported by `Resource`. If the minimum
     version required specified in `Resource` is >= the installed FMC software version the operation
-    will be performed.
+    will be performed. Version strings are parsed once and cached, each call only compares versions
 
     :raise  UnsupportedOperationError: if operation is not supported by FMC
     """
 
     def inner_function(f):
+        f = profiling.method(f)
+        fixed_version = parse_version(version) if version else None
+        attribute = MINIMUM_VERSION_ATTRIBUTES.get(f.__name__)
+
         @wraps(f)
         def wrapper(*args, **kwargs):
-            if version:
-                # noinspection PyUnresolvedReferences
-                min_version = packaging.version.parse(version)
+            if fixed_version is not None:
+                min_version = fixed_version
             else:
-                operations = {
-                    'create': args[0].MINIMUM_VERSION_REQUIRED_CREATE,
-                    'get': args[0].MINIMUM_VERSION_REQUIRED_GET,
-                    'update': args[0].MINIMUM_VERSION_REQUIRED_UPDATE,
-                    'delete': args[0].MINIMUM_VERSION_REQUIRED_DELETE,
-                }
-                # noinspection PyUnresolvedReferences
-                min_version = packaging.version.parse(operations[f.__name__])
+                min_version = parse_version(getattr(args[0], attribute))
 
             installed_version = args[0].version
             if installed_version < min_version:
@@ -82,22 +169,74 @@ def minimum_version_required(func=None, version=None):
                 )
             return f(*args, **kwargs)
 
-        return wrapper
+        return profiling.decorator(track_operation(wrapper), f)
 
     if func:
         return inner_function(func)
     return inner_function
 
 
+def track_operation(wrapper):
+    """record resource operation as current operation while it is performed
+
+    Used by all decorators of resource operations. If callbacks are registered for request events (see `hooks.Hooks`)
+    the outermost decorator records the operation, so events of all requests it issues (including name lookups
+    performed by `resolve_by_name`) carry the resource and its path template
+
+    :param wrapper: wrapper function returned by the decorator
+    :type wrapper: Callable
+    :return: wrapper that records the operation
+    :rtype: Callable
+    """
+
+    @wraps(wrapper)
+    def tracked(*args, **kwargs):
+        if not hooks.active():
+            return wrapper(*args, **kwargs)
+        cls = type(args[0])
+        operation = hooks.Operation(cls.__name__, wrapper.__name__, getattr(cls, 'PATH', None))
+        if hooks.current_operation() == operation:
+            # recorded by an outer decorator
+            return wrapper(*args, **kwargs)
+        token = hooks.set_operation(operation)
+        try:
+            result = wrapper(*args, **kwargs)
+        finally:
+            hooks.reset_operation(token)
+        if isinstance(result, GeneratorType):
+            return _iter_with_operation(result, operation)
+        return result
+
+    return tracked
+
+
+def _iter_with_operation(iterator: Iterator, operation):
+    """yield items of a generator returned by a resource operation. The operation is recorded as current operation
+    while items are retrieved, since requests of generators are issued lazily"""
+    while True:
+        token = hooks.set_operation(operation)
+        try:
+            item = next(iterator)
+        except StopIteration:
+            return
+        finally:
+            hooks.reset_operation(token)
+        yield item
+
+
 def resolve_by_name(f):
     """Resolve `container_name` or `name` of `Resource` to uuid
 
     decorator that adds support for resolving resource uuid via name
     `resolve_by_name` checks if operations are performed with names instead of uuids and depending
     on the resource will try to find the uuid by searching for the name by iterating over all available items. In
-    case a resource supports filter options or filter params it will query fmc api using the available filters
+    case a resource supports a name filter or param the lookup is performed server-side (see `name_params`).
+    Lookups that only require the uuid request the collection without expanded details.
+    Name to uuid mappings are cached per collection in `Connection.name_cache`. If an operation using a cached uuid
+    fails because the resource no longer exists the lookup is repeated without cache
     :raise ResourceNotFoundError: if a resource or parent resource cannot be found by name
     """
+    f = profiling.method(f)
 
     @wraps(f)
     def wrapper(*args, **kwargs):
@@ -106,40 +245,133 @@ def resolve_by_name(f):
         container_uuid = kwargs.get('container_uuid', None)
         name = kwargs.get('name', None)
         uuid = kwargs.get('uuid', None)
-        params = deepcopy(kwargs.get('params', None))
+        params = kwargs.get('params', None)
+        call_kwargs = dict(kwargs)
+        cached = False
 
         if container_name and not container_uuid:
             url = resource.url(resource.CONTAINER_PATH.format(uuid=None))
-            for item in resource.conn.get(url=url, params=None):
-                if item['name'] == container_name:
-                    container_uuid = item['id']
-                    kwargs['container_uuid'] = container_uuid
-                    break
-            else:
+            lookup_params = name_params(resource.container_resource(), container_name, expanded=False)
+            container_uuid, _, cached = lookup_by_name(resource.conn, url, container_name, lookup_params)
+            if container_uuid is None:
                 raise exc.ResourceNotFoundError(
                     msg=f'Resource of type {resource.CONTAINER_NAME} with name "{container_name}" does not exist'
                 )
+            call_kwargs['container_uuid'] = container_uuid
 
         if name and not uuid:
             url = resource.url(resource.PATH.format(container_uuid=container_uuid, uuid=None))
-            for item in resource.conn.get(url=url, params=params):
-                if item['name'] == name:
-                    if f.__name__ == 'get':
-                        kwargs['result'] = item
-                    else:
-                        kwargs['uuid'] = item['id']
-                        # Make sure name param is not passed to !GET api request
-                        kwargs['name'] = None
-                    break
+            if f.__name__ in ('get', 'iter'):
+                # items found by the lookup are returned as result of the operation
+                lookup_params = name_params(resource, name, params)
             else:
+                lookup_params = name_params(resource, name, expanded=False)
+            uuid, item, from_cache = lookup_by_name(resource.conn, url, name, lookup_params)
+            if uuid is None:
                 raise exc.ResourceNotFoundError(
                     msg=f'Resource of type {resource.__class__.__name__} with name "{name}" does not exist'
                 )
-        if 'result' in kwargs.keys():
-            return kwargs['result']
-        return f(*args, **kwargs)
+            if item is not None and f.__name__ in ('get', 'iter'):
+                return iter([item]) if f.__name__ == 'iter' else item
+            cached = cached or from_cache
+            call_kwargs['uuid'] = uuid
+            # Make sure name param is not passed to api request
+            call_kwargs['name'] = None
+            if f.__name__ in ('get', 'iter') and call_kwargs.get('params'):
+                call_kwargs['params'] = _strip_list_params(resource, call_kwargs['params'])
+
+        if not cached:
+            return f(*args, **call_kwargs)
+        try:
+            return f(*args, **call_kwargs)
+        except exc.ResourceNotFoundError:
+            # cached uuid is outdated, e.g. resource has been deleted or renamed by another client
+            with cache.bypass():
+                return wrapper(*args, **kwargs)
+
+    return profiling.decorator(track_operation(wrapper), f)
 
-    return wrapper
+
+def lookup_by_name(conn, url: str, name: str, params=None):
+    """find uuid of a resource within a collection by name. Lookups are answered from `Connection.name_cache` if
+    possible, otherwise the collection is queried and the name to uuid mappings of all returned items are cached
+
+    :param conn: connection object used for api calls
+    :type conn: fireREST.fmc.Connection
+    :param url: url of the collection
+    :type url: str
+    :param name: name of the resource
+    :type name: str
+    :param params: dict of parameters (e.g. filters) used to query the collection
+    :type params: dict, optional
+    :return: uuid (None if not found), item returned by the api (None if answered from cache) and whether the
+             uuid was answered from cache
+    :rtype: tuple
+    """
+    name_cache = conn.name_cache
+    if name_cache is not None and not cache.bypassed():
+        uuid = (name_cache.get(url) or {}).get(name)
+        if uuid is not None:
+            return uuid, None, True
+
+    index: Dict[str, str] = {}
+    match = None
+    for item in conn.get(url=url, params=deepcopy(params)):
+        if 'name' in item and 'id' in item:
+            index.setdefault(item['name'], item['id'])
+        if match is None and item.get('name') == name:
+            match = item
+
+    if name_cache is not None:
+        if set(params or {}) - {'expanded', 'limit', 'offset'}:
+            # filtered queries only return a subset of the collection
+            index = {**(name_cache.get(url) or {}), **index}
+        name_cache.set(url, index)
+    if match is None:
+        return None, None, False
+    return match['id'], match, False
+
+
+def name_params(resource, name: str, params=None, expanded=None):
+    """generate params for a list operation of `resource` that only returns items matching `name`. The `name`
+    param is used if listed in `SUPPORTED_PARAMS`, otherwise the `name` or `nameOrValue` filter if listed in
+    `SUPPORTED_FILTERS`. Without server-side support the whole collection has to be scanned
+
+    :param resource: resource or resource class that is queried
+    :type resource: fireREST.fmc.Resource, optional
+    :param name: name of the requested item
+    :type name: str
+    :param params: additional params of the list operation
+    :type params: dict, optional
+    :param expanded: request expanded details of items. Use `False` if only uuid and name are required
+    :type expanded: bool, optional
+    :return: params for the list operation
+    :rtype: dict
+    """
+    params = dict(params or {})
+    if expanded is not None:
+        params['expanded'] = expanded
+    if resource is None:
+        return params
+    if 'name' in resource.SUPPORTED_PARAMS:
+        params.setdefault(PARAMS['name'], name)
+        return params
+    # values containing the filter separator cannot be expressed as filter
+    if ';' in name:
+        return params
+    for key in ('name', 'name_or_value'):
+        if key in resource.SUPPORTED_FILTERS:
+            if f'{FILTERS[key]}:' not in params.get('filter', ''):
+                name_filter = search_filter([{FILTERS[key]: name}])
+                params['filter'] = f'{params["filter"]};{name_filter}' if params.get('filter') else name_filter
+            break
+    return params
+
+
+def _strip_list_params(resource, params: Dict):
+    """remove filter params that only apply to list operations"""
+    list_params = {'filter'} | {PARAMS[param] for param in resource.SUPPORTED_PARAMS if param in PARAMS}
+    return {k: v for k, v in params.items() if k not in list_params}
 
 
 def support_params(f):
@@ -149,6 +381,7 @@ def support_params(f):
     are checked against `Resource.SUPPORTED_FILTERS` and `Resource.SUPPORTED_PARAMS`. If a match is found
     params are set accordingly and passed to the operations implementation
     """
+    f = profiling.method(f)
 
     @wraps(f)
     def wrapper(*args, **kwargs):
@@ -167,62 +400,180 @@ def support_params(f):
         kwargs['params'] = {**kwargs['params'], **params} if 'params' in kwargs else params
         return f(*args, **kwargs)
 
-    return wrapper
+    return profiling.decorator(track_operation(wrapper), f)
 
 
 def handle_errors(f):
     """Exception handler for api requests
 
     decorator that handles common api errors automatically by checking both status codes and error messages
-    within requests
+    within requests. Failed requests are retried according to the `RetryPolicy` of the connection
 
     """
 
     @wraps(f)
-    @retry(exceptions=exc.RateLimitException, tries=6, delay=10, logger=logger)
     def wrapper(*args, **kwargs):
         conn = args[0]
-        try:
-            validate_data(kwargs.get('method', args[1]), kwargs.get('data', args[-1]))
-            response = f(*args, **kwargs)
-            # only applicable if dry_run is disabled
-            if not args[0].dry_run:
-                response.raise_for_status()
-        except HTTPError:
-            if response.status_code == 401 and (
-                'Access token invalid' in response.text or 'Invalid access token' in response.text
-            ):
-                # Invalid access token detected. Refresh authorization token
-                conn.refresh()
-
-                # Repeat request with valid authentication token
-                response = f(*args, **kwargs)
-            else:
-                raise_for_status(response)
-        return response
+        method = kwargs.get('method', args[1])
+        url = kwargs.get('url', args[2] if len(args) > 2 else None)
+        retries: Dict = {}
+        with profiling.attach(conn):
+            while True:
+                token = conn.headers.get('X-auth-access-token')
+                try:
+                    response = f(*args, **kwargs)
+                except (RequestConnectionError, Timeout) as error:
+                    reason, response = CONNECTION_ERROR, None
+                    if not _retry(conn, method, url, reason, retries, error=error):
+                        raise
+                    continue
+
+                # only applicable if dry_run is disabled
+                if response is None:
+                    return response
+
+                if (
+                    response.status_code == 401
+                    and '/v1/auth/' not in url
+                    and ('Access token invalid' in response.text or 'Invalid access token' in response.text)
+                ):
+                    # Invalid access token detected. Refresh authorization token unless another request already did
+                    conn.refresh(expired_token=token)
+
+                    # Repeat request with valid authentication token
+                    response = f(*args, **kwargs)
+
+                if response.status_code >= 400:
+                    if _retry(conn, method, url, response.status_code, retries, response=response):
+                        continue
+                    raise_for_status(response, getattr(conn, 'codec', None))
+                return response
 
     return wrapper
 
 
+def _retry(conn, method, url, reason, retries, response=None, error=None):
+    """check retry policy of connection and wait before a failed request is repeated
+
+    :return: True if request should be repeated, False if retry budget is exhausted or request is not retryable
+    :rtype: bool
+    """
+    policy = conn.retry_policy
+    attempt = retries.get(reason, 0)
+    if policy is None or not policy.is_retryable(method, reason, attempt):
+        return False
+    delay = policy.backoff(attempt, response)
+    retries[reason] = attempt + 1
+    logger.warning(
+        'Request %s %s failed (%s). Retrying in %.2f seconds (%s/%s)',
+        method.upper(),
+        url,
+        reason,
+        delay,
+        attempt + 1,
+        policy.budget[reason],
+    )
+    if policy.on_retry or conn.hooks.callbacks:
+        event = {
+            'method': method.upper(),
+            'url': url,
+            'attempt': attempt + 1,
+            'delay': delay,
+            'status': response.status_code if response is not None else None,
+            'error': error,
+        }
+        if policy.on_retry:
+            policy.on_retry(event)
+        conn.hooks.emit(hooks.RETRY, dict(event))
+    with profiling.section(profiling.RETRY):
+        sleep(delay)
+    return True
+
+
 def validate_data(method, data):
     """Validate api payload
 
-    Validate payload that will be sent to fmc for errors
+    Validate payload that will be sent to fmc for errors. The size limit is checked against the serialized
+    payload, objects that are not serialized yet are serialized to json to determine their size
 
+    :param method: api operation. Options: ['post', 'put', 'get', 'delete']
+    :type method: str
+    :param data: serialized request body or api payload
+    :type data: Union[bytes, dict, list]
     :raise PayloadLimitExceededError: if payload is larger than max supported payload size
 
     ..todo:: add support for checking payload against data model
     """
-    if method != 'get':
-        if sys.getsizeof(data) > 2048000:
+    if method != 'get' and data is not None:
+        size = len(data) if isinstance(data, (bytes, bytearray)) else len(json.dumps(data).encode('utf-8'))
+        if size > defaults.API_PAYLOAD_SIZE_MAX:
             raise exc.PayloadLimitExceededError
 
 
-def raise_for_status(response):
+def chunk_payload(
+    items: List, codec, max_items=defaults.API_BULK_ITEMS_MAX, max_size=defaults.API_PAYLOAD_SIZE_MAX
+) -> Iterator[Tuple[List, bytes]]:
+    """split bulk payload into chunks that comply with the max. number of items and max. payload size of bulk
+    operations. Each item is serialized exactly once, chunks are assembled from the serialized items
+
+    :param items: api objects of the bulk operation
+    :type items: list
+    :param codec: json codec used to serialize items
+    :type codec: fireREST.codec.JsonCodec
+    :param max_items: max. number of items per chunk. Defaults to `1000`
+    :type max_items: int, optional
+    :param max_size: max. size of a serialized chunk in bytes. Defaults to `2048000`
+    :type max_size: int, optional
+    :raise PayloadLimitExceededError: if a single item exceeds the max. payload size
+    :return: generator of items and serialized json array of each chunk
+    :rtype: Iterator[Tuple[list, bytes]]
+    """
+    for chunk, encoded in chunk_items(items, codec, max_items, max_size):
+        yield chunk, json_array(encoded)
+
+
+def chunk_items(
+    items: List, codec, max_items=defaults.API_BULK_ITEMS_MAX, max_size=defaults.API_PAYLOAD_SIZE_MAX
+) -> Iterator[Tuple[List, List[bytes]]]:
+    """split bulk payload into chunks like `chunk_payload`, but return the serialized items of each chunk instead
+    of the serialized chunk. Used if chunks might be split again before they are sent
+
+    :return: generator of items and serialized items of each chunk
+    :rtype: Iterator[Tuple[list, List[bytes]]]
+    """
+    start, size = 0, 2
+    encoded: List[bytes] = []
+    for i, item in enumerate(items):
+        data = codec.dumps(item)
+        if len(data) + 2 > max_size:
+            raise exc.PayloadLimitExceededError
+        if encoded and (len(encoded) >= max_items or size + len(data) + 1 > max_size):
+            yield items[start:i], encoded
+            start, encoded, size = i, [], 2
+        size += len(data) + (1 if encoded else 0)
+        encoded.append(data)
+    if encoded:
+        yield items[start:], encoded
+
+
+def json_array(encoded: List[bytes]):
+    """assemble serialized json array from serialized items
+
+    :param encoded: serialized items
+    :type encoded: List[bytes]
+    :return: serialized json array
+    :rtype: bytes
+    """
+    return b'[' + b','.join(encoded) + b']'
+
+
+def raise_for_status(response, codec=None):
     """raise exception based on error received by fmc
 
     :param response: api response from FMC
     :type response: requests.Response
+    :param codec: json codec used to decode the error message
+    :type codec: fireREST.codec.JsonCodec, optional
     """
     status_code = response.status_code
     exceptions = {
@@ -248,13 +599,15 @@ def raise_for_status(response):
     if status_code in errors:
         for error in errors[status_code]:
             if error['msg'] in response.text:
-                raise error['exception'](msg=response.json()['error']['messages'][0]['description'])
+                raise error['exception'](
+                    msg=response_json(response, codec)['error']['messages'][0]['description'], status_code=status_code
+                )
     try:
         raise exceptions.get(status_code, exc.GenericApiError)(
-            msg=response.json()['error']['messages'][0]['description']
+            msg=response_json(response, codec)['error']['messages'][0]['description'], status_code=status_code
         )
     except KeyError:
-        raise exceptions.get(status_code, exc.GenericApiError)(msg=response.text)
+        raise exceptions.get(status_code, exc.GenericApiError)(msg=response.text, status_code=status_code)
     except ValueError:
         raise exceptions.get(status_code, HTTPError)()
 
@@ -298,37 +651,36 @@ def fix_url(url: str):
     :return: fixed url
     :rtype: str
     """
-    return sub(r'/None$', '', url).rstrip('/')
+    if url.endswith('/None'):
+        url = url[:-5]
+    return url.rstrip('/')
 
 
-def sanitize_payload(method: str, payload: Dict, ignore_fields=None, _recursive=False):
+def sanitize_payload(method: str, payload: Union[Dict, List], ignore_fields=None):
     """sanitize json object for api operation
 
     Sanitize json object for api operation. This is necessary since fmc api cannot handle json objects with some
-    fields that are received via get operations (e.g. link, metadata). The provided
-    payload will be copied to ensure the provided data is not manipulated
+    fields that are received via get operations (e.g. link, metadata). The provided payload is never modified,
+    objects that contain fields which must be removed are replaced by shallow copies without these fields
 
     :param method: api operation. Options: ['post', 'put', 'get']
     :type method: str
     :param payload: api object in dict format
     :param ignore_fields: fields that should be popped
     :type ignore_fields: list, optional
-    :param _recursive: specifies if `sanitize_payload` is called by itself. Only called by function itself
-    :type _recursive: bool
     :return: sanitized api object
     :rtype: Union[dict, list]
     """
-    if not _recursive:
-        payload = deepcopy(payload)
-    if not isinstance(payload, list):
-        payload.pop('metadata', None)
-        payload.pop('links', None)
-        if ignore_fields:
-            for item in ignore_fields:
-                payload.pop(item, None)
-        if method.lower() == 'post':
-            payload.pop('id', None)
-    else:
-        for item in payload:
-            sanitize_payload(method, item, ignore_fields, _recursive=True)
-    return payload
+    fields = {'metadata', 'links', *(ignore_fields or ())}
+    if method.lower() == 'post':
+        fields.add('id')
+    if isinstance(payload, list):
+        return [_without_fields(item, fields) for item in payload]
+    return _without_fields(payload, fields)
+
+
+def _without_fields(item, fields):
+    """return dict without `fields`. The dict itself is returned if it contains none of the fields"""
+    if not isinstance(item, dict) or fields.isdisjoint(item):
+        return item
+    return {key: value for key, value in item.items() if key not in fields}
@@ -45,6 +45,20 @@ def test_get_network_objects(fmc):
     assert expected_result == actual_result
 
 
+def test_iter_network_objects(fmc):
+    expected_result = [item['id'] for item in fmc.object.network.get()]
+    actual_result = [item['id'] for item in fmc.object.network.iter()]
+
+    assert expected_result == actual_result
+
+
+def test_iter_network_object_by_name(fmc):
+    expected_result = ['FireREST-NetworkObj']
+    actual_result = [item['name'] for item in fmc.object.network.iter(name=expected_result[0])]
+
+    assert expected_result == actual_result
+
+
 def test_get_network_object_by_name(fmc):
     expected_result = 'FireREST-NetworkObj'
     actual_result = fmc.object.network.get(name=expected_result)['name']
@@ -59,6 +73,24 @@ def test_get_network_object_by_id(fmc):
     assert expected_result == actual_result
 
 
+def test_resolve_network_object_names(fmc):
+    name = STATE['object']['network']['name']
+    expected_result = {name: fmc.object.network.get(name=name)['id']}
+    actual_result = fmc.object.network.resolve_names([name, 'FireREST-NON-EXISTING-OBJ'])
+
+    assert expected_result == actual_result
+    assert actual_result.missing == ['FireREST-NON-EXISTING-OBJ']
+
+
+def test_resolve_network_address_names(fmc):
+    name = STATE['object']['network']['name']
+    expected_result = fmc.object.network.get(name=name)['id']
+    actual_result = fmc.object.resolve_names([name])
+
+    assert expected_result == actual_result[name]['id']
+    assert actual_result[name]['type'] == 'Network'
+
+
 def test_update_network_object(fmc):
     data = fmc.object.network.get(name=STATE['object']['network']['name'])
     data['description'] = 'Description set by FireREST'
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+import asyncio
+
+import pytest
+
+from fireREST import AsyncFMC, cache
+from fireREST import exceptions as exc
+from fireREST.fmc.aio import AsyncConnection, AsyncResource
+
+
+@pytest.fixture(scope='module')
+def afmc(fmc):
+    afmc = AsyncFMC(fmc=fmc)
+    yield afmc
+    afmc.conn.executor.shutdown()
+
+
+def test_initialization(afmc, fmc):
+    assert isinstance(afmc.object, AsyncResource)
+    assert isinstance(afmc.object.network, AsyncResource)
+    assert afmc.version == fmc.version
+    assert afmc.domain == fmc.domain
+
+
+def test_get(afmc, fmc):
+    expected_result = fmc.object.network.get()
+    actual_result = asyncio.run(afmc.object.network.get())
+
+    assert expected_result == actual_result
+
+
+def test_concurrent_get_by_id(afmc, fmc):
+    expected_result = [item['id'] for item in fmc.object.network.get()[:10]]
+
+    async def get_all():
+        return await asyncio.gather(*(afmc.object.network.get(uuid=uuid) for uuid in expected_result))
+
+    actual_result = [item['id'] for item in asyncio.run(get_all())]
+
+    assert expected_result == actual_result
+
+
+def test_iter(afmc, fmc):
+    expected_result = [item['id'] for item in fmc.object.network.get()]
+
+    async def iterate():
+        return [item['id'] async for item in afmc.object.network.iter()]
+
+    actual_result = asyncio.run(iterate())
+
+    assert expected_result == actual_result
+
+
+def test_get_with_non_existing_name(afmc):
+    with pytest.raises(exc.ResourceNotFoundError):
+        asyncio.run(afmc.object.network.get(name='FireREST-NON-EXISTING-OBJ'))
+
+
+def test_iterate_retrieves_items_in_batches():
+    calls = []
+
+    class CountingConnection(AsyncConnection):
+        async def run(self, func, *args, **kwargs):
+            calls.append(func)
+            return await super().run(func, *args, **kwargs)
+
+    conn = CountingConnection(conn=object(), max_concurrency=1)
+
+    async def iterate():
+        return [item async for item in conn.iterate(lambda: iter(range(2500)), batch_size=1000)]
+
+    expected_result = list(range(2500))
+    actual_result = asyncio.run(iterate())
+    conn.executor.shutdown()
+
+    assert expected_result == actual_result
+    assert len(calls) == 4  # func and 3 batches
+
+
+def test_iterate_closes_generator_if_consumer_stops():
+    state = {'closed': False}
+
+    def items():
+        try:
+            yield from range(10)
+        finally:
+            state['closed'] = True
+
+    conn = AsyncConnection(conn=object(), max_concurrency=1)
+
+    async def first_item():
+        iterator = conn.iterate(items, batch_size=2)
+        async for item in iterator:
+            await iterator.aclose()
+            return item
+
+    actual_result = asyncio.run(first_item())
+    conn.executor.shutdown()
+
+    assert actual_result == 0
+    assert state['closed'] is True
+
+
+def test_run_preserves_context_of_caller():
+    conn = AsyncConnection(conn=object(), max_concurrency=1)
+
+    async def bypassed():
+        with cache.bypass():
+            return await conn.run(cache.bypassed)
+
+    actual_result = asyncio.run(bypassed())
+    conn.executor.shutdown()
+
+    assert actual_result is True
@@ -1,13 +1,44 @@
 # -*- coding: utf-8 -*-
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
+from requests import Response
 
 
 from fireREST.fmc import Connection
+from fireREST import defaults
 from fireREST import exceptions as exc
+from fireREST.defaults import API_CONFIG_URL
+from fireREST.hooks import Hooks
 from requests.auth import HTTPBasicAuth
 
 
+class RefreshConnection(Connection):
+    """Connection that simulates token refresh requests without an api"""
+
+    def __init__(self):
+        self.cdo = False
+        self.protocol = 'https'
+        self.hostname = 'localhost'
+        self.headers = {'X-auth-access-token': 'access-0', 'X-auth-refresh-token': 'refresh-0'}
+        self.refresh_counter = defaults.API_REFRESH_COUNTER_INIT
+        self._auth_lock = threading.RLock()
+        self.token_cache = None
+        self.hooks = Hooks()
+        self.refresh_requests = 0
+
+    def _request(self, method, url, params=None, auth=None, data=None):
+        time.sleep(0.01)
+        self.refresh_requests += 1
+        response = Response()
+        response.status_code = 204
+        response.headers['X-auth-access-token'] = f'access-{self.refresh_requests}'
+        response.headers['X-auth-refresh-token'] = f'refresh-{self.refresh_requests}'
+        return response
+
+
 @pytest.fixture
 def connection(constants):
     return Connection(
@@ -105,3 +136,89 @@ def test_get_version(conn):
     actual_result = conn.get_version()
 
     assert actual_result is not None
+
+
+def test_get_with_concurrent_paging(conn):
+    url = f'{conn.protocol}://{conn.hostname}{API_CONFIG_URL}/domain/{conn.domain["id"]}/object/networks'
+    conn.paging_workers = 1
+    expected_result = conn.get(url, params={'limit': 5})
+
+    conn.paging_workers = 4
+    actual_result = conn.get(url, params={'limit': 5})
+    conn.paging_workers = defaults.API_PAGING_WORKERS
+
+    assert expected_result == actual_result
+
+
+def test_iter_get(conn):
+    url = f'{conn.protocol}://{conn.hostname}{API_CONFIG_URL}/domain/{conn.domain["id"]}/object/networks'
+    expected_result = conn.get(url, params={'limit': 5})
+    actual_result = list(conn.iter_get(url, params={'limit': 5}))
+
+    assert expected_result == actual_result
+
+
+def test_concurrent_refresh_is_single_flight():
+    conn = RefreshConnection()
+    expired_token = conn.headers['X-auth-access-token']
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        for _ in range(16):
+            executor.submit(conn.refresh, expired_token)
+
+    assert conn.refresh_requests == 1
+    assert conn.refresh_counter == 1
+    assert conn.headers['X-auth-access-token'] == 'access-1'
+
+
+def test_refresh_without_expired_token():
+    conn = RefreshConnection()
+
+    conn.refresh()
+    conn.refresh()
+
+    assert conn.refresh_requests == 2
+
+
+def test_concurrent_requests_with_expired_token(conn):
+    url = f'{conn.protocol}://{conn.hostname}{API_CONFIG_URL}/domain/{conn.domain["id"]}/object/networks'
+    conn.login()
+    conn.headers = {**conn.headers, 'X-auth-access-token': 'invalid-access-token'}
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: conn.get(url), range(8)))
+
+    assert conn.refresh_counter == 1
+    assert all(result == results[0] for result in results)
+
+
+def test_pool_stats(conn):
+    conn.get_version()
+
+    actual_result = conn.pool_stats()
+
+    assert actual_result[0]['host'] == conn.hostname
+    assert actual_result[0]['maxsize'] == defaults.API_POOL_MAXSIZE
+    assert actual_result[0]['num_requests'] > 0
+
+
+def test_token_cache_reuses_session(constants, tmp_path):
+    path = str(tmp_path / 'tokens.json')
+    first = Connection(
+        hostname=constants['hostname'],
+        username=constants['username'],
+        password=constants['password'],
+        domain=constants['domain']['name'],
+        token_cache=path,
+    )
+    second = Connection(
+        hostname=constants['hostname'],
+        username=constants['username'],
+        password=constants['password'],
+        domain=constants['domain']['name'],
+        token_cache=path,
+    )
+
+    assert second.headers['X-auth-access-token'] == first.headers['X-auth-access-token']
+    assert second.domain == first.domain
+    assert second.version == first.version
@@ -15,6 +15,7 @@ from fireREST.fmc.job import Job
 from fireREST.fmc.netmap import NetMap
 from fireREST.fmc.object import Object
 from fireREST.fmc.policy import Policy
+from fireREST.fmc.policy.accesspolicy import AccessPolicy
 from fireREST.fmc.system import System
 from fireREST.fmc.troubleshoot import Troubleshoot
 from fireREST.fmc.update import Update
@@ -41,3 +42,14 @@ def test_initialization(fmc):
     assert isinstance(fmc.troubleshoot, Troubleshoot)
     assert isinstance(fmc.update, Update)
     assert isinstance(fmc.user, User)
+
+
+def test_resources_are_initialized_lazily(fmc):
+    policy = Policy(fmc.conn)
+    assert 'accesspolicy' not in vars(policy)
+
+    expected_result = policy.accesspolicy
+    actual_result = policy.accesspolicy
+    assert isinstance(actual_result, AccessPolicy)
+    assert actual_result is expected_result
+    assert 'accessrule' not in vars(actual_result)
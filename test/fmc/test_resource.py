@@ -7,6 +7,9 @@ from requests.auth import HTTPBasicAuth
 
 from fireREST import defaults
 from fireREST.defaults import API_REFRESH_URL, API_PLATFORM_URL, API_CONFIG_URL
+from fireREST.fmc import NameResolution
+from fireREST.fmc.policy.accesspolicy import AccessPolicy
+from fireREST.fmc.policy.accesspolicy.accessrule import AccessRule
 
 
 def test_initialization(fmc, constants):
@@ -67,6 +70,42 @@ def test_refresh_url(fmc):
     assert actual_url == expected_url
 
 
+def test_config_url_after_domain_change(fmc):
+    domain = fmc.conn.domain
+    try:
+        fmc.conn.domain = {'id': 'e276abec-e0f2-11e3-8169-6d9ed49b625f', 'name': 'Other'}
+        expected_url = f'{fmc.conn.protocol}://{fmc.conn.hostname}{API_CONFIG_URL}/domain/{fmc.conn.domain["id"]}/test'
+        actual_url = fmc.policy.accesspolicy.url(path='/test', namespace='config')
+    finally:
+        fmc.conn.domain = domain
+    assert actual_url == expected_url
+
+
+def test_url_with_none_uuid(fmc):
+    expected_url = f'{fmc.conn.protocol}://{fmc.conn.hostname}{API_CONFIG_URL}/domain/{fmc.conn.domain["id"]}/test'
+    actual_url = fmc.policy.accesspolicy.url(path='/test/None', namespace='config')
+    assert actual_url == expected_url
+
+
 def test_url_with_invalid_namespace(fmc):
     with pytest.raises(exc.InvalidNamespaceError):
         fmc.policy.accesspolicy.url(path='/test', namespace='nonExistingNamespace')
+
+
+def test_container_resource():
+    expected_result = AccessPolicy
+
+    actual_result = AccessRule.container_resource()
+
+    assert expected_result == actual_result
+
+
+def test_name_resolution_with_missing_and_ambiguous_names():
+    candidates = {'a': [{'id': '1'}], 'b': [{'id': '2'}, {'id': '3'}]}
+    expected_result = {'a': '1'}
+
+    actual_result = NameResolution.build(['a', 'b', 'c', 'a'], candidates, lambda item: item['id'])
+
+    assert expected_result == actual_result
+    assert actual_result.missing == ['c']
+    assert actual_result.ambiguous == {'b': candidates['b']}
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+import threading
+
+from requests.exceptions import ConnectionError as RequestConnectionError
+
+from fireREST import bulk, exceptions
+
+
+class FakeApi:
+    def __init__(self, invalid=(), error=exceptions.UnprocessableEntityError):
+        self.invalid = set(invalid)
+        self.error = error
+        self.requests = []
+        self.lock = threading.Lock()
+
+    def send(self, chunk):
+        names = [payload['name'] for _, payload in chunk]
+        with self.lock:
+            self.requests.append(names)
+        if self.invalid.intersection(names):
+            raise self.error('invalid item')
+        return [{'id': f'id-{name}', 'name': name} for name in names]
+
+
+def chunks(names, size):
+    items = [{'name': name} for name in names]
+    return [[(item, item) for item in items[i : i + size]] for i in range(0, len(items), size)]
+
+
+def test_execute_maps_results_to_items():
+    api = FakeApi()
+
+    result = bulk.execute(api.send, chunks(['a', 'b', 'c'], 2), max_workers=2)
+
+    expected_result = {'a': 'id-a', 'b': 'id-b', 'c': 'id-c'}
+    actual_result = {item['name']: obj['id'] for item, obj in result.succeeded}
+    assert actual_result == expected_result
+    assert result.ok
+
+
+def test_execute_isolates_failed_items():
+    api = FakeApi(invalid=['f'])
+
+    result = bulk.execute(api.send, chunks('abcdefgh', 8), max_workers=1)
+
+    expected_result = [{'name': 'f'}]
+    actual_result = result.failed_items
+    assert actual_result == expected_result
+    assert sorted(obj['name'] for obj in result.items) == list('abcdegh')
+    assert isinstance(result.errors[0], exceptions.UnprocessableEntityError)
+
+
+def test_execute_does_not_split_chunks_on_request_errors():
+    api = FakeApi(invalid=['a'], error=RequestConnectionError)
+
+    result = bulk.execute(api.send, chunks('abcd', 4), max_workers=1)
+
+    expected_result = [['a', 'b', 'c', 'd']]
+    actual_result = api.requests
+    assert actual_result == expected_result
+    assert len(result.failed) == 4
+
+
+def test_execute_does_not_split_chunks_on_server_errors():
+    api = FakeApi(invalid=['a'], error=lambda msg: exceptions.GenericApiError(msg, status_code=500))
+
+    result = bulk.execute(api.send, chunks('abcd', 4), max_workers=1)
+
+    expected_result = [['a', 'b', 'c', 'd']]
+    actual_result = api.requests
+    assert actual_result == expected_result
+    assert len(result.failed) == 4
+    assert not result.succeeded
+
+
+def test_execute_splits_chunks_rejected_with_bad_request():
+    api = FakeApi(invalid=['d'], error=lambda msg: exceptions.GenericApiError(msg, status_code=400))
+
+    result = bulk.execute(api.send, chunks('abcd', 4), max_workers=1)
+
+    expected_result = [{'name': 'd'}]
+    actual_result = result.failed_items
+    assert actual_result == expected_result
+    assert sorted(obj['name'] for obj in result.items) == list('abc')
+
+
+def test_retry_only_resends_failed_items():
+    api = FakeApi(invalid=['c'])
+
+    def retry(items):
+        return bulk.execute(api.send, [[(item, item)] for item in items], max_workers=1)
+
+    result = bulk.execute(api.send, chunks('abcd', 4), max_workers=1, retry=retry)
+    api.invalid.clear()
+    api.requests.clear()
+    result = result.retry()
+
+    expected_result = [['c']]
+    actual_result = api.requests
+    assert actual_result == expected_result
+    assert result.ok
+    assert len(result.succeeded) == 4
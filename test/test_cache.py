@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+import time
+
+from fireREST import cache
+from fireREST.cache import TTLCache
+
+
+def test_get_with_cached_value():
+    name_cache = TTLCache(maxsize=2, ttl=60)
+    name_cache.set('key', 'value')
+    expected_result = 'value'
+
+    actual_result = name_cache.get('key')
+
+    assert expected_result == actual_result
+    assert name_cache.hits == 1
+
+
+def test_get_with_expired_value(monkeypatch):
+    name_cache = TTLCache(maxsize=2, ttl=60)
+    name_cache.set('key', 'value')
+    now = time.monotonic()
+    monkeypatch.setattr(cache.time, 'monotonic', lambda: now + 61)
+
+    actual_result = name_cache.get('key')
+
+    assert actual_result is None
+    assert len(name_cache) == 0
+    assert name_cache.misses == 1
+
+
+def test_set_with_entry_ttl(monkeypatch):
+    response_cache = TTLCache(maxsize=2, ttl=60)
+    response_cache.set('short', 'value', ttl=10)
+    response_cache.set('long', 'value')
+    now = time.monotonic()
+    monkeypatch.setattr(cache.time, 'monotonic', lambda: now + 11)
+    expected_result = [None, 'value']
+
+    actual_result = [response_cache.get('short'), response_cache.get('long')]
+
+    assert expected_result == actual_result
+
+
+def test_set_evicts_least_recently_used_entry():
+    name_cache = TTLCache(maxsize=2, ttl=60)
+    name_cache.set('a', 1)
+    name_cache.set('b', 2)
+    name_cache.get('a')
+    name_cache.set('c', 3)
+    expected_result = [1, None, 3]
+
+    actual_result = [name_cache.get(key) for key in ('a', 'b', 'c')]
+
+    assert expected_result == actual_result
+
+
+def test_invalidate_with_predicate():
+    name_cache = TTLCache(maxsize=10, ttl=60)
+    for key in ('/policies', '/policies/1/rules', '/objects'):
+        name_cache.set(key, {})
+    expected_result = 2
+
+    actual_result = name_cache.invalidate(lambda key: key.startswith('/policies'))
+
+    assert expected_result == actual_result
+    assert name_cache.get('/objects') == {}
+
+
+def test_bypass():
+    assert cache.bypassed() is False
+    with cache.bypass():
+        assert cache.bypassed() is True
+    assert cache.bypassed() is False
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+
+import importlib.util
+
+import pytest
+
+from requests import Response
+
+from fireREST import codec, utils
+
+
+@pytest.mark.parametrize('name', ['json', 'simplejson', 'orjson'])
+def test_codec_roundtrip(name):
+    if name == 'orjson':
+        pytest.importorskip('orjson')
+    json_codec = codec.get_codec(name)
+    payload = {'name': 'NetObjViaAPI', 'value': '198.18.1.0/24', 'description': 'ü', 'items': [1, 2.5, None, True]}
+    expected_result = payload
+    actual_result = json_codec.loads(json_codec.dumps(payload))
+    assert isinstance(json_codec.dumps(payload), bytes)
+    assert actual_result == expected_result
+
+
+def test_get_codec_with_auto_selection():
+    expected_result = 'orjson' if importlib.util.find_spec('orjson') else 'json'
+    actual_result = codec.get_codec('auto').name
+    assert actual_result == expected_result
+
+
+def test_get_codec_with_codec_instance():
+    expected_result = codec.JsonCodec()
+    actual_result = codec.get_codec(expected_result)
+    assert actual_result is expected_result
+
+
+def test_get_codec_with_unsupported_codec():
+    with pytest.raises(ValueError):
+        codec.get_codec('yaml')
+
+
+def test_response_json_decodes_raw_content_with_codec():
+    response = Response()
+    response.status_code = 200
+    response._content = b'{"items": [{"name": "net"}]}'
+    expected_result = {'items': [{'name': 'net'}]}
+    actual_result = utils.response_json(response, codec.JsonCodec())
+    assert actual_result == expected_result
@@ -0,0 +1,313 @@
+# -*- coding: utf-8 -*-
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qsl
+
+import pytest
+from requests import Response
+
+from fireREST import exceptions, utils
+from fireREST.codec import JsonCodec
+from fireREST.fmc import Connection
+from fireREST.fmc.object.network import Network
+from fireREST.fmc.policy.accesspolicy.accessrule import AccessRule
+
+URL = 'https://fmc.example.com/api/fmc_config/v1/domain/e276abec-e0f2-11e3-8169-6d9ed49b625f/object/networks'
+
+
+class CountingLock:
+    """lock that counts how often it has been acquired"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.acquired = threading.Semaphore(0)
+
+    def __enter__(self):
+        self.lock.acquire()
+        self.acquired.release()
+
+    def __exit__(self, *args):
+        self.lock.release()
+
+
+class SharedGetConnection(Connection):
+    """connection that counts GET operations. The first operation blocks until the lock of running operations has
+    been acquired `wait_for` times"""
+
+    def __init__(self, wait_for=1, error=None):
+        self.response_cache = None
+        self.reference_store = None
+        self.name_cache = None
+        self._inflight = {}
+        self._inflight_lock = CountingLock()
+        self.wait_for = wait_for
+        self.error = error
+        self.calls = 0
+
+    def _get(self, url, params=None):
+        self.calls += 1
+        if self.calls == 1:
+            for _ in range(self.wait_for):
+                assert self._inflight_lock.acquired.acquire(timeout=5)
+        if self.error:
+            raise self.error
+        return [{'id': str(self.calls), 'name': 'net'}]
+
+
+def concurrent_get(conn, count=10):
+    with ThreadPoolExecutor(max_workers=count) as executor:
+        return [executor.submit(conn.get, URL, {'expanded': True}) for _ in range(count)]
+
+
+def test_get_shares_identical_concurrent_requests():
+    conn = SharedGetConnection(wait_for=10)
+
+    results = [future.result() for future in concurrent_get(conn)]
+
+    assert conn.calls == 1
+    assert all(result is results[0] for result in results)
+
+
+def test_get_shares_errors_of_identical_concurrent_requests():
+    conn = SharedGetConnection(wait_for=10, error=exceptions.ResourceNotFoundError(msg='not found'))
+
+    for future in concurrent_get(conn):
+        with pytest.raises(exceptions.ResourceNotFoundError):
+            future.result()
+    assert conn.calls == 1
+
+
+def test_get_does_not_share_requests_after_invalidation():
+    conn = SharedGetConnection(wait_for=3)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        running = executor.submit(conn.get, URL)
+        # the running operation waits for the invalidation and the following operation
+        conn.invalidate(f'{URL}/1')
+        conn.get(URL)
+        running.result()
+
+    assert conn.calls == 2
+    assert conn._inflight == {}
+
+
+class PagingConnection(Connection):
+    """connection that answers GET operations for paginated collections without an api. Pages contain at most `limit`
+    items, a GET operation of a page at `fail_offset` fails. Requests and the max. number of concurrent requests are
+    recorded"""
+
+    def __init__(self, collections, limit=10, paging_workers=1, fail_offset=None, delay=0.01):
+        self.version = utils.parse_version('7.4.0')
+        self._base_urls = {'config': URL.rsplit('/object/', 1)[0]}
+        self.codec = JsonCodec()
+        self.response_cache = None
+        self.reference_store = None
+        self.name_cache = None
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
+        self.paging_workers = paging_workers
+        self.collections = collections
+        self.limit = limit
+        self.fail_offset = fail_offset
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.requests = []
+        self.running = 0
+        self.max_running = 0
+
+    def _request(self, method, url, params=None, auth=None, data=None, body=None):
+        url, _, query = url.partition('?')
+        params = {**dict(parse_qsl(query)), **(params or {})}
+        offset = int(params.get('offset', 0))
+        with self.lock:
+            self.requests.append((url, offset))
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        try:
+            time.sleep(self.delay)
+            if offset == self.fail_offset:
+                raise exceptions.GenericApiError('page failed', status_code=500)
+            items = self.collections[url]
+            paging = {'offset': offset, 'limit': self.limit, 'count': len(items)}
+            if offset + self.limit < len(items):
+                paging['next'] = [f'{url}?offset={offset + self.limit}&limit={self.limit}']
+            response = Response()
+            response.status_code = 200
+            response._content = json.dumps({'items': items[offset : offset + self.limit], 'paging': paging}).encode()
+            return response
+        finally:
+            with self.lock:
+                self.running -= 1
+
+
+def networks(count):
+    return {URL: [{'id': f'id-{i}', 'name': f'net-{i}'} for i in range(count)]}
+
+
+def test_get_with_concurrent_paging_returns_items_in_api_order():
+    sequential = PagingConnection(networks(95))
+    concurrent = PagingConnection(networks(95), paging_workers=3)
+
+    expected_result = sequential.get(URL)
+    actual_result = concurrent.get(URL)
+
+    assert actual_result == expected_result
+    assert len(actual_result) == 95
+    assert sorted(offset for _, offset in concurrent.requests) == list(range(0, 95, 10))
+
+
+def test_get_with_concurrent_paging_limits_running_requests():
+    conn = PagingConnection(networks(200), paging_workers=3)
+
+    conn.get(URL)
+
+    assert 1 < conn.max_running <= 3
+
+
+def test_get_with_concurrent_paging_raises_error_of_failed_page():
+    conn = PagingConnection(networks(95), paging_workers=3, fail_offset=40)
+
+    with pytest.raises(exceptions.GenericApiError):
+        conn.get(URL)
+
+
+def test_iter_get_yields_items_page_by_page():
+    conn = PagingConnection(networks(95))
+
+    items = conn.iter_get(URL)
+    first_item = next(items)
+
+    assert first_item == {'id': 'id-0', 'name': 'net-0'}
+    assert len(conn.requests) == 1
+
+
+@pytest.mark.parametrize('paging_workers', [1, 2])
+def test_iter_get_stops_requests_if_closed(paging_workers):
+    conn = PagingConnection(networks(200), paging_workers=paging_workers)
+
+    items = conn.iter_get(URL)
+    for _ in range(15):
+        next(items)
+    items.close()
+    requests = len(conn.requests)
+    time.sleep(0.05)
+
+    assert requests <= 2 + paging_workers
+    assert len(conn.requests) == requests
+
+
+def test_child_resource_iter_with_container_name():
+    policies = URL.replace('/object/networks', '/policy/accesspolicies')
+    rules = [{'id': f'rule-{i}', 'name': f'rule-{i}'} for i in range(25)]
+    conn = PagingConnection({policies: [{'id': 'policy', 'name': 'policy'}], f'{policies}/policy/accessrules': rules})
+
+    expected_result = rules
+    actual_result = list(AccessRule(conn).iter(container_name='policy'))
+
+    assert actual_result == expected_result
+
+
+class CountingCodec(JsonCodec):
+    """codec that counts serialized objects"""
+
+    def __init__(self):
+        self.dumped = 0
+
+    def dumps(self, obj):
+        self.dumped += 1
+        return super().dumps(obj)
+
+
+class BulkConnection(Connection):
+    """connection that answers POST operations without an api. Requests containing an item named `invalid` are
+    rejected, all requests after `fail_after` successful requests fail"""
+
+    def __init__(self, fail_after=None):
+        self.version = utils.parse_version('7.4.0')
+        self._base_urls = {'config': URL.rsplit('/object/', 1)[0]}
+        self.codec = CountingCodec()
+        self.dry_run = False
+        self.response_cache = None
+        self.name_cache = None
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
+        self.fail_after = fail_after
+        self.bodies = []
+
+    def _request(self, method, url, params=None, auth=None, data=None, body=None):
+        if body is None:
+            body = self.codec.dumps(data)
+        self.bodies.append(body)
+        payload = json.loads(body)
+        items = payload if isinstance(payload, list) else [payload]
+        if any(item['name'] == 'invalid' for item in items) or (
+            self.fail_after is not None and len(self.bodies) > self.fail_after
+        ):
+            raise exceptions.UnprocessableEntityError('invalid item')
+        items = [{**item, 'id': f'id-{item["name"]}'} for item in items]
+        response = Response()
+        response.status_code = 201
+        response._content = json.dumps({'items': items} if isinstance(payload, list) else items[0]).encode()
+        return response
+
+
+def test_bulk_create_serializes_items_once():
+    conn = BulkConnection()
+    items = [{'name': name, 'value': '10.0.0.0/8'} for name in ('a', 'b', 'invalid', 'c')]
+
+    result = Network(conn).bulk_create(items, max_workers=1)
+
+    assert sorted(obj['id'] for obj in result.items) == ['id-a', 'id-b', 'id-c']
+    assert result.failed_items == [items[2]]
+    assert conn.codec.dumped == len(items)
+
+
+def test_post_reports_partial_result_of_failed_bulk_request():
+    conn = BulkConnection(fail_after=1)
+    items = [{'name': name} for name in ('a', 'b', 'c')]
+
+    with pytest.raises(exceptions.UnprocessableEntityError) as error:
+        conn.post(URL, items, bulk_items_max=1)
+
+    expected_result = [{'name': 'a', 'id': 'id-a'}]
+    actual_result = error.value.bulk_response.json()['items']
+    assert actual_result == expected_result
+    assert error.value.pending_items == items[1:]
+
+
+class VersionConnection(Connection):
+    """connection that answers authentication and version requests without an api"""
+
+    vdb = 'build 370'
+
+    def _request(self, method, url, params=None, auth=None, data=None, body=None):
+        response = Response()
+        response.status_code = 200
+        if url.endswith('/generatetoken'):
+            response.headers['X-auth-access-token'] = 'access'
+            response.headers['X-auth-refresh-token'] = 'refresh'
+            response.headers['DOMAINS'] = '[{"uuid": "e276abec-e0f2-11e3-8169-6d9ed49b625f", "name": "Global"}]'
+        else:
+            version = {'serverVersion': '7.4.0 (build 1)', 'vdbVersion': self.vdb}
+            response._content = json.dumps({'items': [version]}).encode()
+        return response
+
+
+def test_reference_store_verifies_cached_vdb_version(tmp_path):
+    options = {
+        'hostname': 'fmc.example.com',
+        'username': 'firerest',
+        'password': 'firerest',
+        'rate_limit': None,
+        'token_cache': str(tmp_path / 'tokens.json'),
+        'reference_store': str(tmp_path / 'references.sqlite'),
+    }
+    VersionConnection(**options)
+
+    class UpdatedConnection(VersionConnection):
+        vdb = 'build 371'
+
+    actual_result = UpdatedConnection(**options).vdb_version
+
+    assert actual_result == 'build 371'
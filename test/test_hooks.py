@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from fireREST import hooks, utils
+
+
+URL = 'https://fmc.example.com/object/networks'
+
+
+class HookConnection:
+    def __init__(self, conn_hooks):
+        self.hooks = conn_hooks
+        self.name_cache = None
+
+    def get(self, url, params=None):
+        self.hooks.emit(hooks.PRE_REQUEST, {'method': 'GET', 'url': url})
+        return [{'id': 'net-5-uuid', 'name': 'net-5'}]
+
+
+class HookResource:
+    PATH = '/object/networks/{uuid}'
+    MINIMUM_VERSION_REQUIRED_GET = '6.1.0'
+    SUPPORTED_FILTERS = ['name']
+    SUPPORTED_PARAMS: list = []
+
+    def __init__(self, conn_hooks):
+        self.version = utils.parse_version('7.4.0')
+        self.hooks = conn_hooks
+        self.conn = HookConnection(conn_hooks)
+
+    def url(self, path):
+        return utils.fix_url(f'https://fmc.example.com{path}')
+
+    def request(self):
+        self.hooks.emit(hooks.PRE_REQUEST, {'method': 'GET', 'url': URL})
+
+    @utils.resolve_by_name
+    @utils.minimum_version_required
+    def get(self, uuid=None, name=None, params=None):
+        self.request()
+
+    @utils.minimum_version_required
+    def iter(self):
+        return (self.request() for _ in range(2))
+
+
+def failing_callback(event):
+    raise RuntimeError('hook failed')
+
+
+def test_register_with_unsupported_event():
+    with pytest.raises(ValueError):
+        hooks.Hooks().register('unknown', print)
+
+
+def test_emit_adds_resource_operation():
+    events = []
+    conn_hooks = hooks.Hooks()
+    conn_hooks.register(hooks.PRE_REQUEST, events.append)
+    expected_result = [('HookResource', 'get', '/object/networks/{uuid}', hooks.PRE_REQUEST)]
+
+    HookResource(conn_hooks).get()
+    actual_result = [(e['resource'], e['operation'], e['path'], e['event']) for e in events]
+
+    assert expected_result == actual_result
+    assert hooks.current_operation() is None
+    conn_hooks.unregister(hooks.PRE_REQUEST, events.append)
+
+
+def test_emit_adds_resource_operation_to_name_lookups():
+    events = []
+    conn_hooks = hooks.Hooks()
+    conn_hooks.register(hooks.PRE_REQUEST, events.append)
+    expected_result = [('HookResource', 'get', '/object/networks/{uuid}')]
+
+    HookResource(conn_hooks).get(name='net-5')
+    actual_result = [(e['resource'], e['operation'], e['path']) for e in events]
+
+    assert expected_result == actual_result
+    conn_hooks.unregister(hooks.PRE_REQUEST, events.append)
+
+
+def test_emit_adds_resource_operation_to_lazy_requests():
+    events = []
+    conn_hooks = hooks.Hooks()
+    conn_hooks.register(hooks.PRE_REQUEST, events.append)
+    expected_result = ['iter', 'iter']
+
+    list(HookResource(conn_hooks).iter())
+    actual_result = [event['operation'] for event in events]
+
+    assert expected_result == actual_result
+    conn_hooks.unregister(hooks.PRE_REQUEST, events.append)
+
+
+def test_emit_ignores_failing_callbacks():
+    events = []
+    conn_hooks = hooks.Hooks()
+    conn_hooks.register(hooks.REFRESH, failing_callback)
+    conn_hooks.register(hooks.REFRESH, events.append)
+
+    conn_hooks.emit(hooks.REFRESH, {'hostname': 'fmc.example.com', 'login': False})
+
+    assert len(events) == 1
+    assert 'resource' not in events[0]
+    conn_hooks.unregister(hooks.REFRESH, failing_callback)
+    conn_hooks.unregister(hooks.REFRESH, events.append)
+
+
+def test_unregister():
+    conn_hooks = hooks.Hooks()
+    conn_hooks.register(hooks.RETRY, print)
+
+    conn_hooks.unregister(hooks.RETRY, print)
+
+    assert conn_hooks.callbacks == {}
+    assert hooks.active() is False
+
+
+def test_concurrent_register_and_unregister():
+    conn_hooks = hooks.Hooks()
+
+    def register(i):
+        def callback(event):
+            pass
+
+        for _ in range(100):
+            conn_hooks.register(hooks.RETRY, callback)
+            conn_hooks.emit(hooks.RETRY, {'attempt': i})
+            conn_hooks.unregister(hooks.RETRY, callback)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(register, range(8)))
+
+    assert conn_hooks.callbacks == {}
+    assert hooks.active() is False
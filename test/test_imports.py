@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+import subprocess
+import sys
+
+import pytest
+
+from fireREST import FMC
+from fireREST.fmc import LazyResource
+
+
+def loaded_modules(statement: str):
+    script = f'import sys\n{statement}\nprint(" ".join(sys.modules))'
+    output = subprocess.run([sys.executable, '-c', script], check=True, capture_output=True, text=True).stdout
+    return set(output.split())
+
+
+def lazy_resources(cls, seen=None):
+    seen = set() if seen is None else seen
+    for attr in vars(cls).values():
+        if isinstance(attr, LazyResource) and attr not in seen:
+            seen.add(attr)
+            yield attr
+            yield from lazy_resources(attr.resolve(), seen)
+
+
+def test_import_does_not_load_resource_modules():
+    expected_result = {
+        'fireREST',
+        'fireREST.bulk',
+        'fireREST.cache',
+        'fireREST.codec',
+        'fireREST.defaults',
+        'fireREST.exceptions',
+        'fireREST.fmc',
+        'fireREST.hooks',
+        'fireREST.mapping',
+        'fireREST.profiling',
+        'fireREST.ratelimit',
+        'fireREST.retry',
+        'fireREST.tokencache',
+        'fireREST.utils',
+        'fireREST.version',
+    }
+    modules = loaded_modules('import fireREST')
+    actual_result = {module for module in modules if module.startswith('fireREST')}
+    assert actual_result == expected_result
+    assert 'asyncio' not in modules
+
+
+def test_import_of_namespace_does_not_load_sub_resources():
+    modules = loaded_modules('from fireREST.fmc.policy import Policy')
+    assert 'fireREST.fmc.policy' in modules
+    assert 'fireREST.fmc.policy.accesspolicy' not in modules
+
+
+def test_all_lazy_resources_resolve():
+    for resource in lazy_resources(FMC):
+        actual_result = resource.resolve()
+        assert actual_result.__name__ == resource.name
+
+
+def test_import_sub_resource_from_parent_package():
+    from fireREST.fmc.policy import AccessPolicy
+    from fireREST.fmc.policy.accesspolicy import AccessRule
+    from fireREST.fmc.policy.accesspolicy.accessrule import AccessRule as ExpectedAccessRule
+
+    assert AccessPolicy.accessrule.resolve() is ExpectedAccessRule
+    assert AccessRule is ExpectedAccessRule
+
+
+def test_import_unknown_attribute_from_package():
+    with pytest.raises(ImportError):
+        from fireREST.fmc.policy import NonExistingPolicy  # noqa: F401
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+from fireREST import hooks
+from fireREST.metrics import MetricsCollector, percentile
+
+
+def response(latency):
+    return {
+        'method': 'GET',
+        'url': 'https://fmc.example.com/object/networks',
+        'status': 200,
+        'bytes_out': 0,
+        'bytes_in': 100,
+        'latency': latency,
+        'decode_time': 0.001,
+        'error': None,
+    }
+
+
+def emit_responses(conn_hooks, latencies, resource='Network'):
+    token = hooks.set_operation(hooks.Operation(resource, 'get', '/object/networks/{uuid}'))
+    try:
+        for latency in latencies:
+            conn_hooks.emit(hooks.POST_RESPONSE, response(latency))
+    finally:
+        hooks.reset_operation(token)
+
+
+def test_percentile():
+    samples = list(range(1, 101))
+    expected_result = [50, 95, 99]
+
+    actual_result = [percentile(samples, q) for q in (0.5, 0.95, 0.99)]
+
+    assert expected_result == actual_result
+
+
+def test_summary_by_resource():
+    conn_hooks = hooks.Hooks()
+    metrics = MetricsCollector().attach(conn_hooks)
+    emit_responses(conn_hooks, [i / 100 for i in range(1, 101)])
+    emit_responses(conn_hooks, [1.0], resource='Host')
+
+    actual_result = metrics.summary(resource='Network')[('Network', 'GET')]
+
+    assert list(metrics.summary()) == [('Network', 'GET'), ('Host', 'GET')]
+    assert (actual_result['count'], actual_result['p50'], actual_result['p99']) == (100, 0.5, 0.99)
+    assert actual_result['bytes_in'] == 10000
+    metrics.detach(conn_hooks)
+
+
+def test_prometheus():
+    conn_hooks = hooks.Hooks()
+    metrics = MetricsCollector().attach(conn_hooks)
+    emit_responses(conn_hooks, [0.25])
+    conn_hooks.emit(hooks.REFRESH, {'hostname': 'fmc.example.com', 'refresh_counter': 1, 'login': False})
+
+    actual_result = metrics.prometheus().splitlines()
+
+    assert 'firerest_request_duration_seconds{resource="Network",method="GET",quantile="0.95"} 0.25' in actual_result
+    assert 'firerest_request_duration_seconds_count{resource="Network",method="GET"} 1' in actual_result
+    assert 'firerest_token_refreshes_total 1' in actual_result
+    metrics.detach(conn_hooks)
@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from fireREST import profiling, utils
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+class ProfiledConnection:
+    def __init__(self):
+        self.profiler = None
+
+
+class ProfiledResource:
+    MINIMUM_VERSION_REQUIRED_CREATE = '6.1.0'
+    MINIMUM_VERSION_REQUIRED_GET = '6.1.0'
+    SUPPORTED_FILTERS: list = []
+    SUPPORTED_PARAMS: list = []
+
+    def __init__(self, clock, conn=None):
+        self.version = utils.parse_version('7.4.0')
+        self.clock = clock
+        self.conn = conn or ProfiledConnection()
+
+    def request(self):
+        self.clock.advance(0.010)
+        with profiling.section(profiling.NETWORK):
+            self.clock.advance(0.100)
+        with profiling.section(profiling.SERIALIZATION):
+            self.clock.advance(0.020)
+
+    def wait_for_workers(self):
+        with profiling.section(profiling.WORKERS):
+            self.clock.advance(0.050)
+            self.request()
+
+    @utils.support_params
+    @utils.minimum_version_required
+    def get(self, params=None, **kwargs):
+        self.clock.advance(0.001)
+        self.request()
+
+    @utils.minimum_version_required
+    def create(self):
+        self.wait_for_workers()
+
+    @utils.minimum_version_required
+    def iter(self):
+        for _ in range(2):
+            self.request()
+            yield {}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(profiling.time, 'perf_counter', clock)
+    return clock
+
+
+def test_profile_splits_operation_time(clock):
+    resource = ProfiledResource(clock)
+
+    with profiling.profile(resource.conn) as profile:
+        resource.get()
+        clock.advance(0.500)
+    actual_result = profile.summary()['ProfiledResource.get']
+
+    assert actual_result['calls'] == 1
+    assert actual_result['network'] == pytest.approx(0.100)
+    assert actual_result['serialization'] == pytest.approx(0.020)
+    assert actual_result['client'] == pytest.approx(0.011)
+    assert actual_result['decorators'] == pytest.approx(0.0)
+    assert profile.user == pytest.approx(0.500)
+    assert profile.wall == pytest.approx(0.631)
+
+
+def test_profile_attributes_lazy_requests_to_operation(clock):
+    resource = ProfiledResource(clock)
+
+    with profiling.profile(resource.conn) as profile:
+        list(resource.iter())
+    actual_result = profile.summary()['ProfiledResource.iter']
+
+    assert actual_result['calls'] == 1
+    assert actual_result['network'] == pytest.approx(0.200)
+    assert profile.user == pytest.approx(0.0)
+
+
+def test_profile_report(clock):
+    resource = ProfiledResource(clock)
+    with profiling.profile(resource.conn) as profile:
+        resource.get()
+
+    actual_result = profile.report().splitlines()
+
+    assert actual_result[0].split()[:4] == ['operation', 'calls', 'total', 'network']
+    assert actual_result[1].split()[:4] == ['ProfiledResource.get', '1', '131.00', '100.00']
+
+
+def test_profile_does_not_record_outside_of_context(clock):
+    resource = ProfiledResource(clock)
+    with profiling.profile(resource.conn) as profile:
+        pass
+
+    resource.get()
+
+    assert profile.summary() == {}
+    assert profiling.active() is False
+
+
+def test_profile_does_not_record_other_connections(clock):
+    resource = ProfiledResource(clock)
+    other = ProfiledResource(clock)
+
+    with profiling.profile(resource.conn) as profile:
+        other.get()
+        resource.get()
+
+    assert profile.summary()['ProfiledResource.get']['calls'] == 1
+
+
+def test_profile_total_excludes_time_waiting_for_workers(clock):
+    resource = ProfiledResource(clock)
+
+    with profiling.profile(resource.conn) as profile:
+        resource.create()
+    actual_result = profile.summary()['ProfiledResource.create']
+
+    assert actual_result['workers'] == pytest.approx(0.060)
+    assert actual_result['total'] == pytest.approx(0.120)
+
+
+def test_profile_cannot_be_nested():
+    conn = ProfiledConnection()
+    with profiling.profile(conn):
+        with pytest.raises(RuntimeError):
+            with profiling.profile(conn):
+                pass
+
+
+def test_profile_started_concurrently_on_same_connection():
+    conn = ProfiledConnection()
+    barrier = threading.Barrier(8)
+    started = []
+
+    def start():
+        barrier.wait()
+        try:
+            with profiling.profile(conn) as result:
+                started.append(result)
+                barrier.wait()
+        except RuntimeError:
+            barrier.wait()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda _: start(), range(8)))
+
+    assert len(started) == 1
+    assert conn.profiler is None
+    assert profiling.active() is False
+
+
+def test_profiles_started_concurrently_on_different_connections():
+    def start(_):
+        conn = ProfiledConnection()
+        for _ in range(200):
+            with profiling.profile(conn):
+                assert profiling.active() is True
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(start, range(8)))
+
+    assert profiling.active() is False
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+import time
+
+from requests import Response
+
+from fireREST.ratelimit import RateLimiter, parse_retry_after
+
+
+def response(status_code=200, headers=None):
+    resp = Response()
+    resp.status_code = status_code
+    resp.headers.update(headers or {})
+    return resp
+
+
+def test_burst_is_not_delayed():
+    limiter = RateLimiter(limit=120, period=60, burst=10)
+
+    actual_result = [limiter.reserve() for _ in range(10)]
+
+    assert actual_result == [0.0] * 10
+
+
+def test_requests_exceeding_burst_are_paced():
+    limiter = RateLimiter(limit=120, period=60, burst=10)
+    for _ in range(10):
+        limiter.reserve()
+
+    first_wait = limiter.reserve()
+    second_wait = limiter.reserve()
+
+    assert 0 < first_wait <= 60 / 110
+    assert second_wait - first_wait >= 60 / 110 * 0.9
+
+
+def test_limit_is_not_exceeded_within_period():
+    limiter = RateLimiter(limit=120, period=60, burst=10)
+
+    waits = [limiter.reserve() for _ in range(121)]
+
+    assert waits[119] < 60
+    assert waits[120] >= 60 * 0.99
+
+
+def test_acquire_sleeps_until_token_is_available():
+    limiter = RateLimiter(limit=100, period=1, burst=1)
+    limiter.acquire()
+
+    start = time.monotonic()
+    limiter.acquire()
+    elapsed = time.monotonic() - start
+
+    assert elapsed >= 0.005
+
+
+def test_update_with_rate_limit_exceeded():
+    limiter = RateLimiter(limit=120, period=60, burst=10)
+
+    limiter.update(response(429, {'Retry-After': '5'}))
+
+    assert limiter.reserve() >= 4.9
+
+
+def test_update_with_remaining_header():
+    limiter = RateLimiter(limit=120, period=60, burst=10)
+
+    limiter.update(response(200, {'X-RateLimit-Remaining': '0'}))
+
+    assert limiter.reserve() > 0
+
+
+def test_update_with_successful_response():
+    limiter = RateLimiter(limit=120, period=60, burst=10)
+
+    limiter.update(response(200))
+
+    assert limiter.reserve() == 0.0
+
+
+def test_parse_retry_after_with_seconds():
+    assert parse_retry_after('10') == 10.0
+
+
+def test_parse_retry_after_with_invalid_value():
+    assert parse_retry_after('invalid') is None
+    assert parse_retry_after(None) is None
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+import time
+
+from fireREST import referencestore
+from fireREST.referencestore import ReferenceStore
+
+KEY = 'https://fmc.example.com/api/fmc_config/v1/domain/e276abec-e0f2-11e3-8169-6d9ed49b625f/object/countries?'
+FINGERPRINT = ReferenceStore.fingerprint('7.4.0', 'build 370 ( 2023-05-01 )')
+PAYLOAD = b'[{"id":"276","name":"Germany","type":"Country"}]'
+
+
+def test_fingerprint():
+    expected_result = '7.4.0/build 370 ( 2023-05-01 )'
+    actual_result = FINGERPRINT
+
+    assert expected_result == actual_result
+
+
+def test_store_and_load(tmp_path):
+    store = ReferenceStore(str(tmp_path / 'cache' / 'references.sqlite'))
+
+    store.store(KEY, FINGERPRINT, PAYLOAD)
+    actual_result = ReferenceStore(store.path).load(KEY, FINGERPRINT)
+
+    assert PAYLOAD == actual_result
+
+
+def test_load_with_changed_fingerprint(tmp_path):
+    store = ReferenceStore(str(tmp_path / 'references.sqlite'))
+    store.store(KEY, FINGERPRINT, PAYLOAD)
+
+    actual_result = store.load(KEY, ReferenceStore.fingerprint('7.6.0', 'build 370 ( 2023-05-01 )'))
+
+    assert actual_result is None
+
+
+def test_load_with_expired_entry(tmp_path, monkeypatch):
+    store = ReferenceStore(str(tmp_path / 'references.sqlite'), max_age=60)
+    store.store(KEY, FINGERPRINT, PAYLOAD)
+    now = time.time()
+    monkeypatch.setattr(referencestore.time, 'time', lambda: now + 61)
+
+    actual_result = store.load(KEY, FINGERPRINT)
+
+    assert actual_result is None
+
+
+def test_load_with_corrupt_database(tmp_path):
+    path = tmp_path / 'references.sqlite'
+    path.write_bytes(b'not a database')
+
+    actual_result = ReferenceStore(str(path)).load(KEY, FINGERPRINT)
+
+    assert actual_result is None
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+
+from requests import Response
+
+from fireREST import defaults
+from fireREST.retry import CONNECTION_ERROR, RetryPolicy
+
+
+def response(status_code=200, headers=None):
+    resp = Response()
+    resp.status_code = status_code
+    resp.headers.update(headers or {})
+    return resp
+
+
+def test_is_retryable_with_rate_limit_and_post_operation():
+    policy = RetryPolicy(budget={429: 1})
+
+    assert policy.is_retryable('post', 429, 0) is True
+    assert policy.is_retryable('post', 429, 1) is False
+
+
+def test_is_retryable_with_server_error_and_idempotent_operation():
+    policy = RetryPolicy(budget={503: 2})
+
+    assert policy.is_retryable('get', 503, 0) is True
+    assert policy.is_retryable('put', 503, 1) is True
+    assert policy.is_retryable('delete', 503, 2) is False
+
+
+def test_is_retryable_with_server_error_and_post_operation():
+    policy = RetryPolicy(budget={503: 2, CONNECTION_ERROR: 2})
+
+    assert policy.is_retryable('post', 503, 0) is False
+    assert policy.is_retryable('post', CONNECTION_ERROR, 0) is False
+
+
+def test_is_retryable_with_server_error_and_post_operation_opt_in():
+    policy = RetryPolicy(budget={503: 2}, retry_non_idempotent=True)
+
+    assert policy.is_retryable('post', 503, 0) is True
+
+
+def test_is_retryable_with_status_without_budget():
+    policy = RetryPolicy()
+
+    assert policy.is_retryable('get', 404, 0) is False
+    assert policy.is_retryable('get', 500, 0) is False
+
+
+def test_backoff_is_exponential_without_jitter():
+    policy = RetryPolicy(backoff_base=1, backoff_factor=2, backoff_max=5, jitter=False)
+
+    actual_result = [policy.backoff(retries) for retries in range(5)]
+
+    assert actual_result == [1, 2, 4, 5, 5]
+
+
+def test_backoff_with_jitter_is_within_bounds():
+    policy = RetryPolicy(backoff_base=1, backoff_factor=2, backoff_max=60)
+
+    for retries in range(5):
+        assert 0 <= policy.backoff(retries) <= 2**retries
+
+
+def test_backoff_honors_retry_after():
+    policy = RetryPolicy(backoff_max=60)
+
+    assert policy.backoff(0, response(429, {'Retry-After': '7'})) == 7
+    assert policy.backoff(0, response(429, {'Retry-After': '600'})) == 60
+
+
+def test_backoff_of_rate_limited_request_spans_rate_limit_period():
+    policy = RetryPolicy()
+
+    for _ in range(100):
+        actual_result = sum(policy.backoff(retries, response(429)) for retries in range(policy.budget[429]))
+        assert actual_result >= defaults.API_RATE_LIMIT_PERIOD
+
+
+def test_backoff_min_does_not_apply_to_retry_after():
+    policy = RetryPolicy()
+
+    assert policy.backoff(0, response(429, {'Retry-After': '1'})) == 1
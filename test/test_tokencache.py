@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+import os
+import stat
+
+from fireREST import defaults
+from fireREST.tokencache import TokenCache
+
+SESSION = {
+    'access_token': 'access',
+    'refresh_token': 'refresh',
+    'domains': [{'name': 'Global', 'uuid': 'e276abec-e0f2-11e3-8169-6d9ed49b625f'}],
+    'refresh_counter': 0,
+    'version': '7.4.0',
+    'version_checked': 0,
+}
+
+
+def test_key():
+    expected_result = 'https://firerest@fmc.example.com'
+    actual_result = TokenCache.key('https', 'fmc.example.com', 'firerest')
+
+    assert expected_result == actual_result
+
+
+def test_store_and_load(tmp_path):
+    cache = TokenCache(str(tmp_path / 'tokens.json'))
+    key = TokenCache.key('https', 'fmc.example.com', 'firerest')
+
+    cache.store(key, SESSION)
+    actual_result = TokenCache(cache.path).load(key)
+
+    assert actual_result['access_token'] == SESSION['access_token']
+    assert actual_result['domains'] == SESSION['domains']
+
+
+def test_cache_file_is_only_accessible_by_owner(tmp_path):
+    cache = TokenCache(str(tmp_path / 'cache' / 'tokens.json'))
+
+    cache.store('key', SESSION)
+
+    assert stat.S_IMODE(os.stat(cache.path).st_mode) == 0o600
+
+
+def test_load_with_unknown_key(tmp_path):
+    cache = TokenCache(str(tmp_path / 'tokens.json'))
+
+    assert cache.load('unknown') is None
+
+
+def test_load_with_expired_session(tmp_path, monkeypatch):
+    cache = TokenCache(str(tmp_path / 'tokens.json'))
+    cache.store('key', SESSION)
+
+    monkeypatch.setattr(defaults, 'API_TOKEN_CACHE_MAX_AGE', -1)
+
+    assert cache.load('key') is None
+
+
+def test_load_with_corrupt_cache(tmp_path):
+    cache = TokenCache(str(tmp_path / 'tokens.json'))
+    with open(cache.path, 'w') as fh:
+        fh.write('{invalid')
+
+    assert cache.load('key') is None
+
+
+def test_delete(tmp_path):
+    cache = TokenCache(str(tmp_path / 'tokens.json'))
+    cache.store('key', SESSION)
+    cache.store('other', SESSION)
+
+    cache.delete('key')
+
+    assert cache.load('key') is None
+    assert cache.load('other') is not None
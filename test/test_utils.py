@@ -1,10 +1,20 @@
 # -*- coding: utf-8 -*-
 
+import json
+
 import pytest
 
 from uuid import uuid4
 
-from fireREST import exceptions, utils
+from requests import Response
+
+from fireREST import defaults, exceptions, utils
+from fireREST.cache import TTLCache
+from fireREST.codec import JsonCodec
+from fireREST.fmc.object.network import Network
+from fireREST.fmc.policy.accesspolicy import AccessPolicy
+from fireREST.hooks import Hooks
+from fireREST.retry import RetryPolicy
 
 
 def test_is_uuid_with_valid_uuid():
@@ -65,30 +75,42 @@ def test_is_getbyid_operation_with_invalid_getbyid_operation():
 
 
 def test_validate_data_with_supported_payload_size():
-    class ValidObject(object):
-        def __init__(self):
-            pass
-
-        def __sizeof__(self):
-            return 1024
-
     expected_result = None
-    actual_result = utils.validate_data('post', ValidObject())
+    actual_result = utils.validate_data('post', b'x' * defaults.API_PAYLOAD_SIZE_MAX)
 
     assert expected_result == actual_result
 
 
 def test_validate_data_with_unsupported_payload_size():
     with pytest.raises(exceptions.PayloadLimitExceededError):
+        utils.validate_data('post', b'x' * (defaults.API_PAYLOAD_SIZE_MAX + 1))
+
+
+def test_validate_data_with_unserialized_payload():
+    with pytest.raises(exceptions.PayloadLimitExceededError):
+        utils.validate_data('post', [{'description': 'x' * 4096}] * 1000)
 
-        class InvalidObject(object):
-            def __init__(self):
-                pass
 
-            def __sizeof__(self):
-                return 204800100
+def test_chunk_payload_with_max_items():
+    items = [{'name': f'obj-{i}'} for i in range(5)]
+    expected_result = [items[0:2], items[2:4], items[4:5]]
+    actual_result = [chunk for chunk, _ in utils.chunk_payload(items, JsonCodec(), max_items=2)]
+    assert actual_result == expected_result
+
 
-        utils.validate_data('post', InvalidObject())
+def test_chunk_payload_with_max_size():
+    items = [{'name': f'obj-{i}'} for i in range(5)]
+    chunks = list(utils.chunk_payload(items, JsonCodec(), max_size=40))
+    expected_result = items
+    actual_result = [item for _, body in chunks for item in json.loads(body)]
+    assert actual_result == expected_result
+    assert all(len(body) <= 40 for _, body in chunks)
+    assert len(chunks) == 3
+
+
+def test_chunk_payload_with_oversized_item():
+    with pytest.raises(exceptions.PayloadLimitExceededError):
+        list(utils.chunk_payload([{'name': 'x' * 64}], JsonCodec(), max_size=32))
 
 
 def test_sanitize_with_valid_dict_payload():
@@ -134,6 +156,75 @@ def test_sanitize_with_valid_list_payload_and_post_operation():
     assert actual_result == expected_result
 
 
+def test_sanitize_does_not_modify_payload():
+    method = 'post'
+    payload = [
+        {
+            'id': 'A-VALID-UUID',
+            'name': 'TEST-OBJ',
+            'literals': [{'type': 'Network', 'value': '198.18.0.0/16'}],
+            'links': {'self': 'https://fmc.example.com'},
+        }
+    ]
+    expected_result = [
+        {
+            'id': 'A-VALID-UUID',
+            'name': 'TEST-OBJ',
+            'literals': [{'type': 'Network', 'value': '198.18.0.0/16'}],
+            'links': {'self': 'https://fmc.example.com'},
+        }
+    ]
+    sanitized = utils.sanitize_payload(method, payload)
+    actual_result = payload
+    assert actual_result == expected_result
+    assert sanitized[0]['literals'] is payload[0]['literals']
+
+
+class VersionedResource:
+    MINIMUM_VERSION_REQUIRED_CREATE = '99.0.0'
+    MINIMUM_VERSION_REQUIRED_GET = '6.1.0'
+
+    def __init__(self, installed_version):
+        self.version = utils.parse_version(installed_version)
+
+    @utils.minimum_version_required
+    def create(self):
+        return True
+
+    @utils.minimum_version_required
+    def get(self):
+        return True
+
+
+def test_parse_version_is_cached():
+    expected_result = utils.parse_version('7.4.0')
+    actual_result = utils.parse_version('7.4.0')
+    assert actual_result is expected_result
+
+
+def test_minimum_version_with_network_resource():
+    expected_result = utils.parse_version('6.1.0')
+    actual_result = utils.minimum_version(Network, 'bulk_create')
+    assert actual_result == expected_result
+
+
+def test_minimum_version_required_with_supported_operation():
+    expected_result = True
+    actual_result = VersionedResource('7.4.0').get()
+    assert actual_result == expected_result
+
+
+def test_minimum_version_required_with_unsupported_operation():
+    with pytest.raises(exceptions.UnsupportedOperationError):
+        VersionedResource('7.4.0').create()
+
+
+def test_capabilities_with_network_resource():
+    expected_result = {'create': False, 'get': False, 'update': False, 'delete': False}
+    actual_result = Network.capabilities(utils.parse_version('6.0.0'))
+    assert actual_result == expected_result
+
+
 def test_search_filter_with_single_item():
     expected_filter = 'deviceId:457d932a-3dfb-11ea-9b36-8a42de410c5c'
     actual_filter = utils.search_filter(items=[{'deviceId': '457d932a-3dfb-11ea-9b36-8a42de410c5c'}])
@@ -164,3 +255,173 @@ def test_search_filter_with_bool():
     expected_filter = 'myvalue:true;deviceId:457d932a-3dfb-11ea-9b36-8a42de410c5c'
     actual_filter = utils.search_filter(items=[{'myvalue': True}, {'deviceId': '457d932a-3dfb-11ea-9b36-8a42de410c5c'}])
     assert actual_filter == expected_filter
+
+
+def test_response_json_decodes_body_once():
+    response = Response()
+    response.status_code = 200
+    response._content = b'{"items": [{"name": "net"}]}'
+    first_result = utils.response_json(response)
+    response._content = b'{}'
+    actual_result = utils.response_json(response)
+    assert actual_result is first_result
+
+
+def test_raise_for_status_sets_status_code():
+    response = Response()
+    response.status_code = 500
+    response._content = b'{"error": {"messages": [{"description": "internal error"}]}}'
+    with pytest.raises(exceptions.GenericApiError) as error:
+        utils.raise_for_status(response)
+    expected_result = 500
+    actual_result = error.value.status_code
+    assert actual_result == expected_result
+
+
+def test_lazy_json_serializes_on_format():
+    payload = {'name': 'net'}
+    lazy = utils.LazyJson(payload, indent=4)
+    payload['value'] = '10.0.0.0/8'
+    expected_result = '{\n    "name": "net",\n    "value": "10.0.0.0/8"\n}'
+    actual_result = str(lazy)
+    assert actual_result == expected_result
+
+
+class RetryConnection:
+    def __init__(self, retry_policy, responses):
+        self.retry_policy = retry_policy
+        self.hooks = Hooks()
+        self.responses = responses
+        self.dry_run = False
+        self.headers = {}
+        self.calls = 0
+
+    @utils.handle_errors
+    def _request(self, method, url, params=None, auth=None, data=None):
+        self.calls += 1
+        status_code = self.responses.pop(0)
+        response = Response()
+        response.status_code = status_code
+        response._content = b'{"error": {"messages": [{"description": "error"}]}}'
+        return response
+
+
+def test_handle_errors_with_retryable_server_error():
+    conn = RetryConnection(RetryPolicy(backoff_base=0), [503, 503, 200])
+
+    actual_result = conn._request('get', 'https://localhost/api').status_code
+
+    assert actual_result == 200
+    assert conn.calls == 3
+
+
+def test_handle_errors_with_exhausted_retry_budget():
+    conn = RetryConnection(RetryPolicy(budget={503: 1}, backoff_base=0), [503, 503, 200])
+
+    with pytest.raises(exceptions.GenericApiError):
+        conn._request('get', 'https://localhost/api')
+    assert conn.calls == 2
+
+
+def test_handle_errors_with_server_error_and_post_operation():
+    conn = RetryConnection(RetryPolicy(backoff_base=0), [503, 200])
+
+    with pytest.raises(exceptions.GenericApiError):
+        conn._request('post', 'https://localhost/api', data={})
+    assert conn.calls == 1
+
+
+def test_handle_errors_emits_retry_event():
+    events = []
+    conn = RetryConnection(RetryPolicy(backoff_base=0, backoff_min={}, on_retry=events.append), [429, 200])
+
+    conn._request('post', 'https://localhost/api', data={})
+
+    assert [(event['status'], event['attempt']) for event in events] == [(429, 1)]
+
+
+class NameConnection:
+    def __init__(self, items):
+        self.items = items
+        self.requests = []
+        self.name_cache = TTLCache(maxsize=10, ttl=60)
+
+    def get(self, url, params=None):
+        self.requests.append(url)
+        if utils.is_getbyid_operation(url):
+            for item in self.items:
+                if item['id'] == url.split('/')[-1]:
+                    return item
+            raise exceptions.ResourceNotFoundError(msg='not found')
+        return self.items
+
+
+class NameResource:
+    SUPPORTED_FILTERS = []
+    SUPPORTED_PARAMS = []
+    PATH = '/object/networks/{uuid}'
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def url(self, path):
+        return utils.fix_url(path)
+
+    @utils.resolve_by_name
+    def get(self, uuid=None, name=None, params=None):
+        return self.conn.get(self.url(self.PATH.format(uuid=uuid)), params)
+
+
+def test_resolve_by_name_uses_name_cache():
+    items = [{'id': str(uuid4()), 'name': f'net-{i}'} for i in range(3)]
+    resource = NameResource(NameConnection(items))
+    expected_result = ['/object/networks', f'/object/networks/{items[2]["id"]}']
+
+    resource.get(name='net-1')
+    resource.get(name='net-2')
+    actual_result = resource.conn.requests
+
+    assert expected_result == actual_result
+
+
+def test_resolve_by_name_with_stale_cache_entry():
+    items = [{'id': str(uuid4()), 'name': 'net-1'}]
+    resource = NameResource(NameConnection(items))
+    resource.get(name='net-1')
+    items[0] = {'id': str(uuid4()), 'name': 'net-1'}
+    expected_result = items[0]
+
+    actual_result = resource.get(name='net-1')
+
+    assert expected_result == actual_result
+
+
+def test_resolve_by_name_with_non_existing_name():
+    resource = NameResource(NameConnection([]))
+
+    with pytest.raises(exceptions.ResourceNotFoundError):
+        resource.get(name='net-1')
+
+
+def test_name_params_with_supported_name_param():
+    expected_result = {'name': 'ACP', 'expanded': False}
+
+    actual_result = utils.name_params(AccessPolicy, 'ACP', expanded=False)
+
+    assert expected_result == actual_result
+
+
+def test_name_params_with_supported_name_filter():
+    expected_result = {'filter': 'unusedOnly:true;nameOrValue:NET'}
+
+    actual_result = utils.name_params(Network, 'NET', {'filter': 'unusedOnly:true'})
+
+    assert expected_result == actual_result
+
+
+def test_name_params_without_server_side_support():
+    expected_result = {'expanded': False}
+
+    actual_result = utils.name_params(NameResource, 'NET', expanded=False)
+
+    assert expected_result == actual_result